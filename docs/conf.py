@@ -145,6 +145,10 @@ rst_epilog = """
 
 .. |OpcPackage| replace:: :class:`.OpcPackage`
 
+.. |PackageInventory| replace:: :class:`.PackageInventory`
+
+.. |PackageLimitError| replace:: :class:`.PackageLimitError`
+
 .. |Paragraph| replace:: :class:`.Paragraph`
 
 .. |ParagraphFormat| replace:: :class:`.ParagraphFormat`
@@ -155,14 +159,20 @@ rst_epilog = """
 
 .. |Part| replace:: :class:`.Part`
 
+.. |PartInfo| replace:: :class:`.PartInfo`
+
 .. |Pt| replace:: :class:`.Pt`
 
+.. |ReadOnlyPackageError| replace:: :class:`.ReadOnlyPackageError`
+
 .. |_Relationship| replace:: :class:`._Relationship`
 
 .. |Relationships| replace:: :class:`._Relationships`
 
 .. |RenderedPageBreak| replace:: :class:`.RenderedPageBreak`
 
+.. |ResourceLimits| replace:: :class:`.ResourceLimits`
+
 .. |RGBColor| replace:: :class:`.RGBColor`
 
 .. |_Row| replace:: :class:`._Row`
@@ -179,6 +189,8 @@ rst_epilog = """
 
 .. |str| replace:: :class:`.str`
 
+.. |StreamingDocument| replace:: :class:`.StreamingDocument`
+
 .. |Styles| replace:: :class:`.Styles`
 
 .. |StylesPart| replace:: :class:`.StylesPart`
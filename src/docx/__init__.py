@@ -8,7 +8,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Type
 
-from docx.api import Document
+from docx.api import Document, inspect, iter_blocks
+from docx.streaming import StreamingDocument
 
 if TYPE_CHECKING:
     from docx.opc.part import Part
@@ -16,7 +17,7 @@ if TYPE_CHECKING:
 __version__ = "1.1.2"
 
 
-__all__ = ["Document"]
+__all__ = ["Document", "StreamingDocument", "inspect", "iter_blocks"]
 
 
 # -- register custom Part classes with opc package reader --
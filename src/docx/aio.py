@@ -0,0 +1,94 @@
+"""Asyncio interface for opening and saving documents without blocking the event loop.
+
+Opening a document and saving one do blocking file I/O and CPU-bound parsing and
+compression. The coroutines here run that work on an executor, so an event loop serving
+other requests keeps running meanwhile::
+
+    from docx.aio import open_document
+
+    document = await open_document(upload)
+    document.add_paragraph("Reviewed")
+    await document.save_async(output)
+
+Work is run on an executor shared by all event loops, a thread pool sized by
+:func:`configure`. Its size bounds how many documents are opened or saved at the same
+time; others wait their turn in its queue, so one large document cannot take every
+thread. Cancelling a coroutine waiting its turn removes its work from the queue. Work
+already running on a thread cannot be interrupted; it runs to completion and its result
+is discarded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, TYPE_CHECKING, Any
+
+from docx.api import Document
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from docx.document import Document as DocumentObject
+
+_executor: Executor | None = None
+_owns_executor = False
+_lock = threading.Lock()
+
+
+def configure(max_concurrency: int | None = None, executor: Executor | None = None):
+    """Set the executor documents are opened and saved on.
+
+    `max_concurrency` is the number of threads of the pool created to run that work, the
+    default size of a |ThreadPoolExecutor| when omitted. Pass `executor` instead to run
+    it on an executor of your own, which is then left for you to shut down. An executor
+    previously created here is shut down once its pending work is done.
+    """
+    global _executor, _owns_executor
+    if executor is not None and max_concurrency is not None:
+        raise ValueError("specify max_concurrency or executor, not both")
+    with _lock:
+        previous, owned = _executor, _owns_executor
+        if executor is None:
+            executor = ThreadPoolExecutor(max_concurrency, thread_name_prefix="docx-aio")
+            _owns_executor = True
+        else:
+            _owns_executor = False
+        _executor = executor
+    if previous is not None and owned:
+        previous.shutdown(wait=False)
+
+
+async def open_document(
+    docx: str | IO[bytes] | bytes | bytearray | memoryview | None = None, **kwargs: Any
+) -> DocumentObject:
+    """Return a |Document| object loaded from `docx`, loaded on the shared executor.
+
+    Arguments are those of :func:`docx.Document`.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(Document, docx, **kwargs))
+
+
+async def save_document(document: DocumentObject, path_or_stream: str | IO[bytes], **kwargs: Any):
+    """Save `document` to `path_or_stream`, written on the shared executor.
+
+    A snapshot of the document is taken before the first suspension point, so the
+    document can be changed while it is being written without the changes reaching the
+    saved document. Arguments are those of :meth:`.Document.save_in_background`, apart
+    from `executor`.
+    """
+    future = document.save_in_background(path_or_stream, executor=_get_executor(), **kwargs)
+    await asyncio.wrap_future(future)
+
+
+def _get_executor() -> Executor:
+    """The executor documents are opened and saved on, created on first use."""
+    global _executor, _owns_executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(thread_name_prefix="docx-aio")
+            _owns_executor = True
+        return _executor
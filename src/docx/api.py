@@ -6,33 +6,117 @@ Provides a syntactically more convenient API for interacting with the OpcPackage
 from __future__ import annotations
 
 import os
-from typing import IO, TYPE_CHECKING, Any, Optional, Union, cast
+from typing import IO, TYPE_CHECKING, Any, Collection, Iterator, Optional, Union, cast
 
 from docx.opc.constants import CONTENT_TYPE as CT
+from docx.opc.inventory import PackageInventory
+from docx.oxml.parser import iter_child_elements
+from docx.oxml.table import CT_Tbl
+from docx.oxml.text.paragraph import CT_P
 from docx.package import Package
 
 if TYPE_CHECKING:
     import docx.types as t
     from docx.document import Document as DocumentObject
+    from docx.opc.limits import ResourceLimits
     from docx.parts.document import DocumentPart
     from docx.section import Section
     from docx.table import Table
     from docx.text.paragraph import Paragraph
 
 
-def Document(docx: str | IO[bytes] | None = None) -> DocumentObject:
+def Document(
+    docx: str | IO[bytes] | bytes | bytearray | memoryview | None = None,
+    lazy: bool = False,
+    parse_workers: int | None = None,
+    read_only: bool = False,
+    exclude_reltypes: Collection[str] = (),
+    limits: ResourceLimits | None = None,
+) -> DocumentObject:
     """Return a |Document| object loaded from `docx`, where `docx` can be either a path
-    to a ``.docx`` file (a string) or a file-like object.
+    to a ``.docx`` file (a string), a file-like object or a bytes-like object holding
+    the ``.docx`` file in memory. A Flat OPC file, a whole package in a single XML
+    document as Word saves in "Word XML Document" format, is recognized and loaded too.
 
     If `docx` is missing or ``None``, the built-in default document "template" is
     loaded.
+
+    When `lazy` is True, parts are only read from `docx` and parsed when first used,
+    so parts the caller never touches cost next to nothing. `docx` is held open while
+    the document is in use in that case. A Flat OPC file is the exception: it is always
+    read whole as it is opened and the content of every part held in memory, only the
+    parsing of its XML parts is deferred.
+
+    When `parse_workers` is greater than one, the XML parts of `docx` are parsed
+    concurrently on that many threads, which shortens the time to open a large document
+    on a multi-core machine.
+
+    When `read_only` is True, the document is opened for reading only, which is faster
+    and takes less memory. Its XML is parsed with a parser profile tuned for that, and
+    the document cannot be saved; adding a part, relationship or image to it raises
+    |ReadOnlyPackageError|. Parts related by a relationship type in `exclude_reltypes`,
+    like ``RT.IMAGE``, ``RT.GLOSSARY_DOCUMENT`` or ``RT.CUSTOM_XML``, are not loaded at
+    all, which is only allowed in this mode.
+
+    A bytes-like object, like |bytes| or a |memoryview|, is read in place rather than
+    copied, and parts stored in it without compression, typically images, refer to it
+    rather than holding a copy of their bytes. A path opened with both `lazy` and
+    `read_only` True is memory-mapped for the same effect.
+
+    For a `docx` from an untrusted source, `limits` sets |ResourceLimits| on the total
+    and per-part inflated size, the compression ratio and the XML depth and element
+    count of its parts. They are checked before the memory is taken, raising
+    |PackageLimitError| when `docx` exceeds one.
     """
     docx = _default_docx_path() if docx is None else docx
-    document_part = cast("DocumentPart", Package.open(docx).main_document_part)
-    if document_part.content_type != CT.WML_DOCUMENT_MAIN:
-        tmpl = "file '%s' is not a Word file, content type is '%s'"
-        raise ValueError(tmpl % (docx, document_part.content_type))
-    return document_part.document
+    package = Package.open(
+        docx,
+        lazy=lazy,
+        parse_workers=parse_workers,
+        read_only=read_only,
+        exclude_reltypes=exclude_reltypes,
+        limits=limits,
+    )
+    return _document_part(package, docx).document
+
+
+def inspect(docx: str | IO[bytes]) -> PackageInventory:
+    """Return a |PackageInventory| of `docx`, read without opening it as a document.
+
+    `docx` is a path to a ``.docx`` file or a file-like object containing one. Only the
+    core properties and the zip directory are read, so this takes milliseconds even for
+    a very large document. The inventory provides the core properties and the
+    partname, content type and size of each part.
+    """
+    return PackageInventory.from_file(docx)
+
+
+def iter_blocks(docx: str | IO[bytes]) -> Iterator[Paragraph | Table]:
+    """Generate a |Paragraph| or |Table| object for each block item in the body of `docx`.
+
+    `docx` is a path to a ``.docx`` file or a file-like object containing one. The body
+    is parsed incrementally rather than loaded as a whole, and each block item is
+    discarded once the next one is generated, so memory use stays flat regardless of the
+    size of the document. A generated object can be used, including its text, style and
+    table cells, only until the next one is generated. Other block-level items, like a
+    content control, are skipped.
+    """
+    from docx.table import Table
+    from docx.text.paragraph import Paragraph
+
+    package = Package.open(docx, lazy=True)
+    try:
+        document_part = _document_part(package, docx)
+        source = document_part.source
+        assert source is not None
+        with source.open() as stream:
+            for block in iter_child_elements(stream, "w:body"):
+                if isinstance(block, CT_P):
+                    yield Paragraph(block, document_part)
+                elif isinstance(block, CT_Tbl):
+                    yield Table(block, document_part)
+    finally:
+        package.close()
 
 
 def _default_docx_path():
@@ -41,6 +125,18 @@ def _default_docx_path():
     return os.path.join(_thisdir, "templates", "default.docx")
 
 
+def _document_part(package: Package, docx: str | IO[bytes]) -> DocumentPart:
+    """The main document part of `package`, opened from `docx`.
+
+    Raises |ValueError| if `package` is not a WordprocessingML package.
+    """
+    document_part = cast("DocumentPart", package.main_document_part)
+    if document_part.content_type != CT.WML_DOCUMENT_MAIN:
+        tmpl = "file '%s' is not a Word file, content type is '%s'"
+        raise ValueError(tmpl % (docx, document_part.content_type))
+    return document_part
+
+
 def element(element: Any, part: t.ProvidesStoryPart) -> Optional[Union[Paragraph, Table, Section]]:
     if (
         isinstance(element, type)
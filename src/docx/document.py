@@ -5,7 +5,7 @@
 
 from __future__ import annotations
 
-from typing import IO, TYPE_CHECKING, Iterator, List, Optional
+from typing import IO, TYPE_CHECKING, Any, Collection, Iterator, List, Optional
 
 from docx.blkcntnr import BlockItemContainer
 from docx.enum.section import WD_SECTION
@@ -15,6 +15,8 @@ from docx.section import Section, Sections
 from docx.shared import ElementProxy, Emu
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
     import docx.types as t
     from docx.oxml.document import CT_Body, CT_Document
     from docx.oxml.numbering import CT_AbstractNum
@@ -160,13 +162,101 @@ class Document(ElementProxy):
         """The |DocumentPart| object of this document."""
         return self._part
 
-    def save(self, path_or_stream: str | IO[bytes]):
+    def save(
+        self,
+        path_or_stream: str | IO[bytes],
+        compress_level: int | None = None,
+        compress_workers: int | None = None,
+        stored_content_types: Collection[str] = (),
+        incremental: bool = False,
+        deterministic: bool = False,
+    ):
         """Save this document to `path_or_stream`.
 
         `path_or_stream` can be either a path to a filesystem location (a string) or a
-        file-like object.
+        file-like object. The file-like object need not be seekable, it can be anything
+        with a `write()` method, like a pipe, `sys.stdout.buffer` or an HTTP response;
+        the package is then written front to back, each part reaching it as soon as it
+        is produced. A path to a directory, or ending with a path separator, saves the
+        package expanded into that directory rather than as a zip file, which
+        `Document()` can open again. A path ending in ``.xml`` saves the document as a
+        single Flat OPC XML file, the "Word XML Document" format.
+
+        `compress_level` is the zlib compression level (0-9) used for parts, the zlib
+        default when omitted. A level of 0 stores parts without compression at all,
+        the fastest way to save an intermediate document that is processed further.
+        Setting `compress_workers` above one compresses parts concurrently on that many
+        threads, which can noticeably cut save time for documents with a lot of images.
+        A part having a content type in `stored_content_types` is stored uncompressed;
+        passing `docx.opc.pkgwriter.PRECOMPRESSED_CONTENT_TYPES` avoids deflating JPEG,
+        PNG and other media that is already compressed.
+
+        When `incremental` is True, `path_or_stream` must be the ``.docx`` file this
+        document was opened from with `lazy` True, and it is updated in place rather
+        than rewritten: only the parts that changed are written, appended to the file,
+        along with a new zip directory. This is much faster than a full save when a small
+        part, like the core properties, is all that changed. The space taken by replaced
+        parts is not reclaimed; a full save compacts the file again.
+
+        When `deterministic` is True, saving the same document always produces the same
+        bytes, so its output can be hashed to tell whether anything changed. Parts are
+        written in partname order with a fixed timestamp, and XML in Canonical XML form,
+        with sorted attributes and namespace declarations. Parts of a lazily opened
+        document that were never touched are copied as they are in that file.
+
+        Once pictures have been added to a story, like the body or a header, any drawing
+        in it that repeats the id of an earlier drawing, like one copied in, is given a
+        new id on save, as Word reports duplicate drawing ids as corrupt.
+        """
+        self._part.save(
+            path_or_stream,
+            compress_level,
+            compress_workers,
+            stored_content_types,
+            incremental,
+            deterministic,
+        )
+
+    async def save_async(self, path_or_stream: str | IO[bytes], **kwargs: Any):
+        """Save this document to `path_or_stream` without blocking the event loop.
+
+        Coroutine that saves the document on the executor of :mod:`docx.aio`, taking a
+        snapshot of it before it first suspends. Arguments are those of
+        :meth:`save_in_background`, apart from `executor`.
+        """
+        from docx.aio import save_document
+
+        await save_document(self, path_or_stream, **kwargs)
+
+    def save_in_background(
+        self,
+        path_or_stream: str | IO[bytes],
+        compress_level: int | None = None,
+        compress_workers: int | None = None,
+        stored_content_types: Collection[str] = (),
+        deterministic: bool = False,
+        executor: Executor | None = None,
+    ) -> Future[None]:
+        """Save this document to `path_or_stream` on another thread.
+
+        Returns a |Future| that is done once the document is saved; its `result()`
+        raises any error the save raised. Only a quick snapshot of the document is taken
+        before this returns; serializing, compressing and writing it happen on a thread
+        of `executor`, or on a thread of its own when `executor` is omitted. The document
+        can be changed as soon as this returns, changes made from then on are not part
+        of this save. A document opened with `lazy` True must not be closed until the
+        save is done.
+
+        The other arguments are as for :meth:`save`.
         """
-        self._part.save(path_or_stream)
+        return self._part.save_in_background(
+            path_or_stream,
+            compress_level,
+            compress_workers,
+            stored_content_types,
+            deterministic,
+            executor,
+        )
 
     @property
     def sections(self) -> Sections:
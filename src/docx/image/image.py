@@ -9,9 +9,10 @@ from __future__ import annotations
 import hashlib
 import io
 import os
-from typing import IO, Tuple
+from typing import IO, Tuple, cast
 
 from docx.image.exceptions import UnrecognizedImageError
+from docx.opc.phys_pkg import FileBlob
 from docx.shared import Emu, Inches, Length, lazyproperty
 
 
@@ -19,7 +20,7 @@ class Image:
     """Graphical image stream such as JPEG, PNG, or GIF with properties and methods
     required by ImagePart."""
 
-    def __init__(self, blob: bytes, filename: str, image_header: BaseImageHeader):
+    def __init__(self, blob: bytes | FileBlob, filename: str, image_header: BaseImageHeader):
         super(Image, self).__init__()
         self._blob = blob
         self._filename = filename
@@ -35,23 +36,38 @@ class Image:
     @classmethod
     def from_file(cls, image_descriptor: str | IO[bytes]):
         """Return a new |Image| subclass instance loaded from the image file identified
-        by `image_descriptor`, a path or file-like object."""
+        by `image_descriptor`, a path or file-like object.
+
+        A large image is spooled to a temporary file rather than held in memory, only its
+        header is read to characterize it.
+        """
         if isinstance(image_descriptor, str):
             path = image_descriptor
             with open(path, "rb") as f:
-                blob = f.read()
-                stream = io.BytesIO(blob)
+                blob = FileBlob.spool(f)
+                stream = io.BytesIO(blob) if isinstance(blob, bytes) else None
             filename = os.path.basename(path)
         else:
             stream = image_descriptor
             stream.seek(0)
-            blob = stream.read()
+            blob = FileBlob.spool(stream)
             filename = None
-        return cls._from_stream(stream, blob, filename)
+        if isinstance(blob, FileBlob):
+            with blob.open() as spooled:
+                return cls._from_stream(spooled, blob, filename)
+        return cls._from_stream(cast(IO[bytes], stream), blob, filename)
 
     @property
-    def blob(self):
+    def blob(self) -> bytes:
         """The bytes of the image 'file'."""
+        if isinstance(self._blob, FileBlob):
+            return self._blob.read()
+        return self._blob
+
+    @property
+    def part_blob(self) -> bytes | FileBlob:
+        """The bytes of the image 'file', or a |FileBlob| handle when it is spooled to a
+        temporary file, the form an image part holds its content in."""
         return self._blob
 
     @property
@@ -148,13 +164,19 @@ class Image:
     @lazyproperty
     def sha1(self):
         """SHA1 hash digest of the image blob."""
-        return hashlib.sha1(self._blob).hexdigest()
+        if not isinstance(self._blob, FileBlob):
+            return hashlib.sha1(self._blob).hexdigest()
+        sha1 = hashlib.sha1()
+        with self._blob.open() as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha1.update(chunk)
+        return sha1.hexdigest()
 
     @classmethod
     def _from_stream(
         cls,
         stream: IO[bytes],
-        blob: bytes,
+        blob: bytes | FileBlob,
         filename: str | None = None,
     ) -> Image:
         """Return an instance of the |Image| subclass corresponding to the format of the
@@ -10,3 +10,11 @@ class OpcError(Exception):
 
 class PackageNotFoundError(OpcError):
     """Raised when a package cannot be found at the specified path."""
+
+
+class ReadOnlyPackageError(OpcError):
+    """Raised on an attempt to change or save a package opened read-only."""
+
+
+class PackageLimitError(OpcError):
+    """Raised when a package being opened exceeds a limit set by |ResourceLimits|."""
@@ -0,0 +1,123 @@
+# pyright: reportPrivateUsage=false
+
+"""Inventory of an OPC package, read from its metadata without loading its parts."""
+
+from __future__ import annotations
+
+from typing import IO, TYPE_CHECKING, List, cast
+
+from docx.opc.constants import CONTENT_TYPE as CT
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.coreprops import CoreProperties
+from docx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
+from docx.opc.phys_pkg import PhysPkgReader
+from docx.opc.pkgreader import PackageReader, _ContentTypeMap
+from docx.oxml.parser import parse_xml
+
+if TYPE_CHECKING:
+    from docx.oxml.coreprops import CT_CoreProperties
+
+
+class PackageInventory:
+    """Core properties and parts of a package, read without loading the package.
+
+    Only the content types item, the package relationships and the core properties part
+    are read; the size of each part comes from the zip directory. Producing an inventory
+    takes about the same time whatever the size of the package, which makes it cheap
+    enough to triage every package received, like uploads.
+    """
+
+    def __init__(self, core_properties: CoreProperties | None, parts: List[PartInfo]):
+        self._core_properties = core_properties
+        self._parts = parts
+
+    @classmethod
+    def from_file(cls, pkg_file: str | IO[bytes]) -> PackageInventory:
+        """Return a |PackageInventory| of the package `pkg_file`.
+
+        `pkg_file` is a path to a package, zip file or expanded directory, or a
+        file-like object containing a zip package.
+        """
+        phys_reader = PhysPkgReader(pkg_file)
+        try:
+            content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
+            pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
+            core_properties = None
+            for srel in pkg_srels:
+                if srel.reltype == RT.CORE_PROPERTIES and not srel.is_external:
+                    core_xml = phys_reader.blob_for(srel.target_partname)
+                    core_props_elm = cast("CT_CoreProperties", parse_xml(core_xml, True))
+                    core_properties = CoreProperties(core_props_elm)
+                    break
+            parts = [
+                PartInfo(pack_uri, _content_type_for(content_types, pack_uri), size, stored_size)
+                for pack_uri, size, stored_size in phys_reader.iter_member_sizes()
+                if pack_uri != CONTENT_TYPES_URI
+            ]
+        finally:
+            phys_reader.close()
+        return cls(core_properties, parts)
+
+    @property
+    def core_properties(self) -> CoreProperties | None:
+        """|CoreProperties| read from the core properties part of the package.
+
+        |None| when the package has no core properties part.
+        """
+        return self._core_properties
+
+    @property
+    def parts(self) -> List[PartInfo]:
+        """|PartInfo| object for each part in the package, in the order they are stored.
+
+        Relationship items are included, as parts of content type
+        ``application/vnd.openxmlformats-package.relationships+xml``.
+        """
+        return self._parts
+
+
+class PartInfo:
+    """Partname, content type and size of a part in a package inventory."""
+
+    def __init__(self, partname: PackURI, content_type: str | None, size: int, stored_size: int):
+        self._partname = partname
+        self._content_type = content_type
+        self._size = size
+        self._stored_size = stored_size
+
+    def __repr__(self) -> str:
+        return "<PartInfo %s %s (%d bytes)>" % (self._partname, self._content_type, self._size)
+
+    @property
+    def content_type(self) -> str | None:
+        """Content type of the part, |None| when the content types item has none for it."""
+        return self._content_type
+
+    @property
+    def partname(self) -> PackURI:
+        """|PackURI| partname of the part, like ``/word/document.xml``."""
+        return self._partname
+
+    @property
+    def size(self) -> int:
+        """Size in bytes of the content of the part."""
+        return self._size
+
+    @property
+    def stored_size(self) -> int:
+        """Size in bytes the part takes in the package, after any compression."""
+        return self._stored_size
+
+
+def _content_type_for(content_types: _ContentTypeMap, partname: PackURI) -> str | None:
+    """Content type of `partname` in `content_types`, |None| when it has none.
+
+    A relationships item has the relationships content type, including the package
+    relationships item `/_rels/.rels`, whose name has no extension to look it up by.
+    """
+    if partname.endswith(".rels"):
+        return CT.OPC_RELATIONSHIPS
+    try:
+        return content_types[partname]
+    except KeyError:
+        return None
@@ -0,0 +1,122 @@
+"""Limits on the resources opening a package can take, for packages from untrusted sources."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Tuple
+
+from docx.opc.exceptions import PackageLimitError
+
+if TYPE_CHECKING:
+    from docx.opc.packuri import PackURI
+
+
+class ResourceLimits:
+    """Limits a package must stay within to be opened, each unlimited when |None|.
+
+    A crafted or pathological package, like a zip bomb or deeply nested XML, can take far
+    more memory to open than its size suggests. The sizes of the members of a package are
+    checked against these limits before any member is inflated, and the depth and
+    element count of each XML part while it is parsed, so a package over a limit is
+    rejected before the memory is taken. |PackageLimitError| is raised when a limit is
+    exceeded.
+
+    `max_total_size` and `max_part_size` are the largest number of bytes the members of
+    the package may inflate to, all of them together and any one of them.
+    `max_compression_ratio` is the largest ratio of the inflated to the compressed size
+    of a member. `max_xml_depth` is the deepest an element of an XML part may be nested,
+    the root element being at depth 1, and `max_xml_elements` the most elements an XML
+    part may have.
+
+    libxml2 has limits of its own, rejecting XML nested deeper than 256 elements or having
+    a text node over 10 MB, like the base64 content of a large image in a Flat OPC
+    package. `huge_xml` lifts them, for a trusted package known to exceed them.
+    """
+
+    def __init__(
+        self,
+        max_total_size: int | None = None,
+        max_part_size: int | None = None,
+        max_compression_ratio: float | None = None,
+        max_xml_depth: int | None = None,
+        max_xml_elements: int | None = None,
+        huge_xml: bool = False,
+    ):
+        self._max_total_size = max_total_size
+        self._max_part_size = max_part_size
+        self._max_compression_ratio = max_compression_ratio
+        self._max_xml_depth = max_xml_depth
+        self._max_xml_elements = max_xml_elements
+        self._huge_xml = huge_xml
+
+    def check_members(self, member_sizes: Iterable[Tuple[PackURI, int, int]]):
+        """Raise |PackageLimitError| if the members of a package exceed these limits.
+
+        `member_sizes` is a `(pack_uri, size, stored_size)` triple for each member, like
+        those produced by `iter_member_sizes()` of a physical package reader.
+        """
+        total_size = 0
+        for pack_uri, size, stored_size in member_sizes:
+            if self._max_part_size is not None and size > self._max_part_size:
+                raise PackageLimitError(
+                    "part '%s' is %d bytes, over the limit of %d"
+                    % (pack_uri, size, self._max_part_size)
+                )
+            max_ratio = self._max_compression_ratio
+            if max_ratio is not None and size > max_ratio * max(stored_size, 1):
+                raise PackageLimitError(
+                    "part '%s' is compressed %.0f to 1, over the limit of %g to 1"
+                    % (pack_uri, size / max(stored_size, 1), max_ratio)
+                )
+            total_size += size
+            if self._max_total_size is not None and total_size > self._max_total_size:
+                raise PackageLimitError(
+                    "package parts exceed the limit of %d bytes" % self._max_total_size
+                )
+
+    def check_xml_element(self, depth: int, element_count: int):
+        """Raise |PackageLimitError| if an XML element started exceeds these limits.
+
+        `depth` is how deep the element is nested in its part, the root element being at
+        depth 1, and `element_count` the number of elements started in the part so far,
+        this one included.
+        """
+        max_depth, max_elements = self._max_xml_depth, self._max_xml_elements
+        if max_depth is not None and depth > max_depth:
+            raise PackageLimitError("XML is nested over the limit of %d deep" % max_depth)
+        if max_elements is not None and element_count > max_elements:
+            raise PackageLimitError("XML has over the limit of %d elements" % max_elements)
+
+    @property
+    def checks_xml(self) -> bool:
+        """True if these limits constrain the XML of a part, so parsing must check it."""
+        return self._max_xml_depth is not None or self._max_xml_elements is not None
+
+    @property
+    def huge_xml(self) -> bool:
+        """True if libxml2's own limits on XML depth and text-node size are lifted."""
+        return self._huge_xml
+
+    @property
+    def max_compression_ratio(self) -> float | None:
+        """Largest ratio of the inflated to the compressed size of a member."""
+        return self._max_compression_ratio
+
+    @property
+    def max_part_size(self) -> int | None:
+        """Largest number of bytes any one member may inflate to."""
+        return self._max_part_size
+
+    @property
+    def max_total_size(self) -> int | None:
+        """Largest number of bytes all members together may inflate to."""
+        return self._max_total_size
+
+    @property
+    def max_xml_depth(self) -> int | None:
+        """Deepest an element of an XML part may be nested, the root being at depth 1."""
+        return self._max_xml_depth
+
+    @property
+    def max_xml_elements(self) -> int | None:
+        """Most elements an XML part may have."""
+        return self._max_xml_elements
@@ -9,7 +9,7 @@ deleted or only hold the package related custom element classes.
 
 from __future__ import annotations
 
-from typing import cast
+from typing import IO, cast
 
 from lxml import etree
 
@@ -59,6 +59,24 @@ def serialize_part_xml(part_elm: etree._Element):
     return etree.tostring(part_elm, encoding="UTF-8", standalone=True)
 
 
+def write_part_xml(part_elm: etree._Element, stream: IO[bytes], canonical: bool = False):
+    """Serialize `part_elm` to binary `stream` as XML suitable for storage as an XML part.
+
+    Produces the same XML as :func:`serialize_part_xml`, but written to `stream` a chunk
+    at a time as it is serialized, so the XML is never held in memory as a whole.
+
+    When `canonical` is True, the XML is written in Canonical XML form, where namespace
+    declarations and attributes are sorted and empty elements have an end-tag, so the
+    same element produces the same bytes however it was built.
+    """
+    tree = etree.ElementTree(part_elm)
+    if canonical:
+        stream.write(b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n")
+        tree.write_c14n(stream)
+        return
+    tree.write(stream, encoding="UTF-8", standalone=True)
+
+
 def serialize_for_reading(element):
     """Serialize `element` to human-readable XML suitable for tests.
 
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from typing import IO, TYPE_CHECKING, Iterator, cast
+import itertools
+import os
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import IO, TYPE_CHECKING, Collection, Iterable, Iterator, cast
 
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.exceptions import ReadOnlyPackageError
 from docx.opc.packuri import PACKAGE_URI, PackURI
 from docx.opc.part import PartFactory
 from docx.opc.parts.coreprops import CorePropertiesPart
@@ -13,10 +17,12 @@ from docx.opc.pkgwriter import PackageWriter
 from docx.parts.comments import CommentsPart
 from docx.parts.footnotes import FootnotesPart
 from docx.opc.rel import Relationships
+from docx.opc.shared import walk_rels_graph
 from docx.shared import lazyproperty
 
 if TYPE_CHECKING:
     from docx.opc.coreprops import CoreProperties
+    from docx.opc.limits import ResourceLimits
     from docx.opc.part import Part
     from docx.opc.rel import _Relationship  # pyright: ignore[reportPrivateUsage]
 
@@ -30,6 +36,15 @@ class OpcPackage:
 
     def __init__(self):
         super(OpcPackage, self).__init__()
+        self._pkg_file: str | IO[bytes] | None = None
+        self._pkg_reader: PackageReader | None = None
+        self._read_only = False
+        self._resource_limits: ResourceLimits | None = None
+        # -- each change to the part graph takes the next version, atomically --
+        self._graph_changes = itertools.count(1)
+        self._graph_version = 0
+        self._parts_index: tuple[list[Part], set[PackURI]] = ([], set())
+        self._parts_index_version: int | None = None
 
     def after_unmarshal(self):
         """Entry point for any post-unmarshaling processing.
@@ -40,6 +55,17 @@ class OpcPackage:
         # subclass
         pass
 
+    def close(self):
+        """Close the package file this package lazily reads part content from.
+
+        Content of a part that has not been read yet cannot be read afterward. Does
+        nothing when the package was not opened lazily.
+        """
+        if self._pkg_reader is None:
+            return
+        self._pkg_reader.close()
+        self._pkg_file = self._pkg_reader = None
+
     @property
     def core_properties(self) -> CoreProperties:
         """|CoreProperties| object providing read/write access to the Dublin Core
@@ -75,45 +101,15 @@ class OpcPackage:
     def iter_rels(self) -> Iterator[_Relationship]:
         """Generate exactly one reference to each relationship in the package by
         performing a depth-first traversal of the rels graph."""
-
-        def walk_rels(
-            source: OpcPackage | Part, visited: list[Part] | None = None
-        ) -> Iterator[_Relationship]:
-            visited = [] if visited is None else visited
-            for rel in source.rels.values():
-                yield rel
-                if rel.is_external:
-                    continue
-                part = rel.target_part
-                if part in visited:
-                    continue
-                visited.append(part)
-                new_source = part
-                for rel in walk_rels(new_source, visited):
-                    yield rel
-
-        for rel in walk_rels(self):
+        for rel, _, _ in self._walk_rels():
             yield rel
 
     def iter_parts(self) -> Iterator[Part]:
         """Generate exactly one reference to each of the parts in the package by
         performing a depth-first traversal of the rels graph."""
-
-        def walk_parts(source, visited=[]):
-            for rel in source.rels.values():
-                if rel.is_external:
-                    continue
-                part = rel.target_part
-                if part in visited:
-                    continue
-                visited.append(part)
+        for _, part, _ in self._walk_rels():
+            if part is not None:
                 yield part
-                new_source = part
-                for part in walk_parts(new_source, visited):
-                    yield part
-
-        for part in walk_parts(self):
-            yield part
 
     def load_rel(self, reltype: str, target: Part | str, rId: str, is_external: bool = False):
         """Return newly added |_Relationship| instance of `reltype` between this part
@@ -135,6 +131,14 @@ class OpcPackage:
         """
         return self.part_related_by(RT.OFFICE_DOCUMENT)
 
+    def mark_graph_changed(self):
+        """Note a change to the part graph of this package, invalidating its part index.
+
+        Called by the relationships of this package and its parts when they change, and
+        when a part is renamed.
+        """
+        self._graph_version = next(self._graph_changes)
+
     def next_partname(self, template: str) -> PackURI:
         """Return a |PackURI| instance representing partname matching `template`.
 
@@ -142,19 +146,71 @@ class OpcPackage:
         from other parts of its type. `template` is a printf (%)-style template string
         containing a single replacement item, a '%d' to be used to insert the integer
         portion of the partname. Example: "/word/header%d.xml"
+
+        Raises |ReadOnlyPackageError| when this package is read-only, a new part cannot
+        be added to it.
         """
-        partnames = {part.partname for part in self.iter_parts()}
+        self._check_writable()
+        _, partnames = self._indexed_parts
         for n in range(1, len(partnames) + 2):
             candidate_partname = template % n
             if candidate_partname not in partnames:
                 return PackURI(candidate_partname)
 
     @classmethod
-    def open(cls, pkg_file: str | IO[bytes]) -> OpcPackage:
-        """Return an |OpcPackage| instance loaded with the contents of `pkg_file`."""
-        pkg_reader = PackageReader.from_file(pkg_file)
+    def open(
+        cls,
+        pkg_file: str | IO[bytes],
+        lazy: bool = False,
+        parse_workers: int | None = None,
+        read_only: bool = False,
+        exclude_reltypes: Collection[str] = (),
+        limits: ResourceLimits | None = None,
+    ) -> OpcPackage:
+        """Return an |OpcPackage| instance loaded with the contents of `pkg_file`.
+
+        When `lazy` is True, the content of each part is only read from `pkg_file` when
+        first needed and XML parts are only parsed when their element is first accessed.
+        `pkg_file` is held open for the lifetime of the package in that case, so a
+        file-like object must not be closed while the package is in use. A Flat OPC
+        package is always read whole as it is opened, so only the parsing of its XML
+        parts is deferred; the content of every part is held in memory meanwhile.
+
+        When `parse_workers` is greater than one, parts are loaded on a pool of that
+        many threads, so the XML of large parts is parsed concurrently.
+
+        When `read_only` is True, XML parts are parsed with the read-only parser profile
+        and the package cannot be changed or saved. Only a read-only package can leave
+        out the relationships having a type in `exclude_reltypes`, along with the parts
+        only reachable through them, since saving it would lose those parts.
+
+        A package at a path opened both lazily and read-only is memory-mapped, so the
+        content of a part stored without compression, typically an image, is a view on
+        the mapped file rather than a copy. The file must not be changed while the
+        package, or any such part content, is in use.
+
+        When `limits` is given, `pkg_file` is checked against those |ResourceLimits| as
+        it is opened, and |PackageLimitError| raised when it exceeds one. The XML of
+        parts parsed later, when opened lazily, is checked as it is parsed.
+        """
+        if exclude_reltypes and not read_only:
+            raise ValueError("only a read-only package can exclude relationship types")
+        pkg_reader = PackageReader.from_file(
+            pkg_file, lazy, exclude_reltypes, use_mmap=lazy and read_only, limits=limits
+        )
         package = cls()
-        Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
+        package._read_only = read_only
+        package._resource_limits = limits
+        try:
+            Unmarshaller.unmarshal(pkg_reader, package, PartFactory, parse_workers)
+        except BaseException:
+            pkg_reader.close()
+            raise
+        if not lazy:
+            pkg_reader.close()
+        else:
+            package._pkg_file = pkg_file
+            package._pkg_reader = pkg_reader
         return package
 
     def part_related_by(self, reltype: str) -> Part:
@@ -168,7 +224,18 @@ class OpcPackage:
     @property
     def parts(self) -> list[Part]:
         """Return a list containing a reference to each of the parts in this package."""
-        return list(self.iter_parts())
+        parts, _ = self._indexed_parts
+        return list(parts)
+
+    @property
+    def read_only(self) -> bool:
+        """True if this package was opened read-only and so cannot be changed or saved."""
+        return self._read_only
+
+    @property
+    def resource_limits(self) -> ResourceLimits | None:
+        """|ResourceLimits| this package was opened within, |None| when unlimited."""
+        return self._resource_limits
 
     def relate_to(self, part: Part, reltype: str):
         """Return rId key of new or existing relationship to `part`.
@@ -176,6 +243,7 @@ class OpcPackage:
         If a relationship of `reltype` to `part` already exists, its rId is returned. Otherwise a
         new relationship is created and that rId is returned.
         """
+        self._check_writable()
         rel = self.rels.get_or_add(reltype, part)
         return rel.rId
 
@@ -183,16 +251,157 @@ class OpcPackage:
     def rels(self):
         """Return a reference to the |Relationships| instance holding the collection of
         relationships for this package."""
-        return Relationships(PACKAGE_URI.baseURI)
-
-    def save(self, pkg_file: str | IO[bytes]):
+        return Relationships(PACKAGE_URI.baseURI, self)
+
+    def save(
+        self,
+        pkg_file: str | IO[bytes],
+        compress_level: int | None = None,
+        compress_workers: int | None = None,
+        stored_content_types: Collection[str] = (),
+        incremental: bool = False,
+        deterministic: bool = False,
+    ):
         """Save this package to `pkg_file`.
 
-        `pkg_file` can be either a file-path or a file-like object.
+        `pkg_file` can be either a file-path or a file-like object. `compress_level`,
+        `compress_workers` and `stored_content_types` control how parts are compressed,
+        and `deterministic` produces the same bytes for the same package, as described
+        for :meth:`.PackageWriter.write`.
+
+        When `incremental` is True, `pkg_file` must be the file this package was lazily
+        opened from, which is updated in place as described for
+        :meth:`.PackageWriter.update`: only changed parts are written, appended to it,
+        and the package remains open on it. Raises |ValueError| when `pkg_file` is not
+        that file, or when `deterministic` is also True; an incremental save only
+        appends to the file, so it cannot produce the bytes a full save does.
+
+        Raises |ReadOnlyPackageError| when this package is read-only.
+        """
+        self._check_writable()
+        if incremental and deterministic:
+            raise ValueError("an incremental save cannot be deterministic")
+        for part in self.parts:
+            part.before_marshal()
+        parts = self.parts
+        if incremental:
+            if not self._is_source(pkg_file):
+                raise ValueError(
+                    "incremental save requires the file the package was lazily opened from"
+                )
+            PackageWriter.update(pkg_file, self.rels, parts, compress_level, stored_content_types)
+            return
+        if self._is_source(pkg_file):
+            self._detach_from_source()
+        PackageWriter.write(
+            pkg_file,
+            self.rels,
+            parts,
+            compress_level,
+            compress_workers,
+            stored_content_types,
+            deterministic,
+        )
+
+    def save_in_background(
+        self,
+        pkg_file: str | IO[bytes],
+        compress_level: int | None = None,
+        compress_workers: int | None = None,
+        stored_content_types: Collection[str] = (),
+        deterministic: bool = False,
+        executor: Executor | None = None,
+    ) -> Future[None]:
+        """Save this package to `pkg_file` on another thread and return a |Future| for it.
+
+        Only a snapshot of each part is taken on the calling thread, copying its XML tree
+        rather than serializing it; the package can be changed again as soon as this
+        returns, without the changes reaching the saved package. Serializing,
+        compressing and writing the parts happen on a thread of `executor`, or on a
+        thread of its own when `executor` is |None|. Parts that were lazily loaded and
+        never changed are copied from the source package on that thread, so the package
+        must not be closed until the returned future is done.
+
+        The other arguments are as for :meth:`save`. Raises |ReadOnlyPackageError| when
+        this package is read-only.
         """
+        self._check_writable()
         for part in self.parts:
             part.before_marshal()
-        PackageWriter.write(pkg_file, self.rels, self.parts)
+        if self._is_source(pkg_file):
+            self._detach_from_source()
+        pkg_rels = self.rels.snapshot()
+        parts = [part.snapshot() for part in self.parts]
+        args = (
+            pkg_file,
+            pkg_rels,
+            parts,
+            compress_level,
+            compress_workers,
+            stored_content_types,
+            deterministic,
+        )
+        if executor is not None:
+            return executor.submit(PackageWriter.write, *args)
+        own_executor = ThreadPoolExecutor(max_workers=1)
+        future = own_executor.submit(PackageWriter.write, *args)
+        own_executor.shutdown(wait=False)
+        return future
+
+    def _check_writable(self):
+        """Raise |ReadOnlyPackageError| if this package is read-only."""
+        if self._read_only:
+            raise ReadOnlyPackageError(
+                "package was opened read-only and cannot be changed or saved"
+            )
+
+    def _detach_from_source(self):
+        """Read all content still held in the lazily-read source package and close it.
+
+        Required before overwriting the source package, which would otherwise be
+        truncated while parts not yet read still depend on it.
+        """
+        for part in self.parts:
+            part.detach()
+        self.close()
+
+    def _is_source(self, pkg_file: str | IO[bytes]) -> bool:
+        """True if `pkg_file` is the package this package is still lazily reading from."""
+        source = self._pkg_file
+        if self._pkg_reader is None or source is None:
+            return False
+        if not isinstance(pkg_file, str) or not isinstance(source, str):
+            return pkg_file is source
+        return os.path.exists(pkg_file) and os.path.samefile(pkg_file, source)
+
+    @property
+    def _indexed_parts(self) -> tuple[list[Part], set[PackURI]]:
+        """`(parts, partnames)` pair for the parts of this package, in traversal order.
+
+        The parts are those :meth:`iter_parts` generates, so two parts sharing a
+        partname are both there. The index is only rebuilt after a relationship or
+        partname in this package has changed.
+        """
+        graph_version = self._graph_version
+        if self._parts_index_version != graph_version:
+            parts = list(self.iter_parts())
+            self._parts_index = (parts, {part.partname for part in parts})
+            self._parts_index_version = graph_version
+        return self._parts_index
+
+    def _walk_rels(
+        self,
+    ) -> Iterator[tuple[_Relationship, Part | None, Iterable[_Relationship] | None]]:
+        """Generate `(rel, part, part_rels)` for each relationship in the package.
+
+        `part` and `part_rels` are None for an external relationship or a part already
+        visited.
+        """
+        return walk_rels_graph(
+            self.rels.values(),
+            lambda rel: rel.target_part,
+            lambda part: part.rels.values(),
+        )
 
     @property
     def _core_properties_part(self) -> CorePropertiesPart:
@@ -212,30 +421,39 @@ class Unmarshaller:
     """Hosts static methods for unmarshalling a package from a |PackageReader|."""
 
     @staticmethod
-    def unmarshal(pkg_reader, package, part_factory):
+    def unmarshal(pkg_reader, package, part_factory, parse_workers=None):
         """Construct graph of parts and realized relationships based on the contents of
         `pkg_reader`, delegating construction of each part to `part_factory`.
 
-        Package relationships are added to `pkg`.
+        Package relationships are added to `pkg`. Parts are constructed on
+        `parse_workers` threads when that is greater than one.
         """
-        parts = Unmarshaller._unmarshal_parts(pkg_reader, package, part_factory)
+        parts = Unmarshaller._unmarshal_parts(pkg_reader, package, part_factory, parse_workers)
         Unmarshaller._unmarshal_relationships(pkg_reader, package, parts)
         for part in parts.values():
             part.after_unmarshal()
         package.after_unmarshal()
 
     @staticmethod
-    def _unmarshal_parts(pkg_reader, package, part_factory):
+    def _unmarshal_parts(pkg_reader, package, part_factory, parse_workers=None):
         """Return a dictionary of |Part| instances unmarshalled from `pkg_reader`, keyed
         by partname.
 
         Side-effect is that each part in `pkg_reader` is constructed using
-        `part_factory`.
+        `part_factory`. When `parse_workers` is greater than one, parts are constructed
+        concurrently on a thread pool of that size. lxml releases the GIL while parsing,
+        so the XML parts of a large package are then parsed in parallel.
         """
-        parts = {}
-        for partname, content_type, reltype, blob in pkg_reader.iter_sparts():
-            parts[partname] = part_factory(partname, content_type, reltype, blob, package)
-        return parts
+
+        def load_part(spart):
+            partname, content_type, reltype, blob = spart
+            return partname, part_factory(partname, content_type, reltype, blob, package)
+
+        sparts = pkg_reader.iter_sparts()
+        if not parse_workers or parse_workers < 2:
+            return dict(load_part(spart) for spart in sparts)
+        with ThreadPoolExecutor(max_workers=parse_workers) as executor:
+            return dict(executor.map(load_part, sparts))
 
     @staticmethod
     def _unmarshal_relationships(pkg_reader, package, parts):
@@ -7,13 +7,17 @@ from __future__ import annotations
 
 import posixpath
 import re
+from typing import Dict
+
+from docx.shared import lazyproperty
 
 
 class PackURI(str):
     """Provides access to pack URI components such as the baseURI and the filename
     slice.
 
-    Behaves as |str| otherwise.
+    Behaves as |str| otherwise. Components are computed once, on first access, since a
+    partname is asked for them many times while a package is loaded and saved.
     """
 
     _filename_re = re.compile("([a-zA-Z]+)([1-9][0-9]*)?")
@@ -31,7 +35,7 @@ class PackURI(str):
         abs_uri = posixpath.abspath(joined_uri)
         return PackURI(abs_uri)
 
-    @property
+    @lazyproperty
     def baseURI(self) -> str:
         """The base URI of this pack URI, the directory portion, roughly speaking.
 
@@ -40,7 +44,7 @@ class PackURI(str):
         """
         return posixpath.split(self)[0]
 
-    @property
+    @lazyproperty
     def ext(self) -> str:
         """The extension portion of this pack URI, e.g. ``'xml'`` for ``'/word/document.xml'``.
 
@@ -50,7 +54,7 @@ class PackURI(str):
         raw_ext = posixpath.splitext(self)[1]
         return raw_ext[1:] if raw_ext.startswith(".") else raw_ext
 
-    @property
+    @lazyproperty
     def filename(self):
         """The "filename" portion of this pack URI, e.g. ``'slide1.xml'`` for
         ``'/ppt/slides/slide1.xml'``.
@@ -90,11 +94,22 @@ class PackURI(str):
         E.g. PackURI('/ppt/slideLayouts/slideLayout1.xml') would return
         '../slideLayouts/slideLayout1.xml' for baseURI '/ppt/slides'.
         """
-        # workaround for posixpath bug in 2.6, doesn't generate correct
-        # relative path when `start` (second) parameter is root ('/')
-        return self[1:] if baseURI == "/" else posixpath.relpath(self, baseURI)
-
-    @property
+        relative_refs = self._relative_refs
+        relative_ref = relative_refs.get(baseURI)
+        if relative_ref is None:
+            # workaround for posixpath bug in 2.6, doesn't generate correct
+            # relative path when `start` (second) parameter is root ('/')
+            relative_ref = relative_refs[baseURI] = (
+                self[1:] if baseURI == "/" else posixpath.relpath(self, baseURI)
+            )
+        return relative_ref
+
+    @lazyproperty
+    def _relative_refs(self) -> Dict[str, str]:
+        """Relative reference to this pack URI from each base URI it has been asked for."""
+        return {}
+
+    @lazyproperty
     def rels_uri(self):
         """The pack URI of the .rels part corresponding to the current pack URI.
 
@@ -4,19 +4,56 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Type, cast
+import copy
+from collections import Counter
+from typing import IO, TYPE_CHECKING, Callable, Iterable, List, Type, cast
 
-from docx.opc.oxml import serialize_part_xml
+from lxml import etree
+
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.oxml import serialize_part_xml, write_part_xml
 from docx.opc.packuri import PackURI
+from docx.opc.phys_pkg import FileBlob, LazyBlob, StreamedBlob
 from docx.opc.rel import Relationships
 from docx.opc.shared import cls_method_fn
-from docx.oxml.parser import parse_xml
+from docx.oxml.ns import nsmap
+from docx.oxml.parser import parse_xml, parse_xml_stream
 from docx.shared import lazyproperty
 
 if TYPE_CHECKING:
     from docx.oxml.xmlchemy import BaseOxmlElement
     from docx.package import Package
 
+# -- relationships of these types are only ever used through an rId in the XML of the part
+# -- they belong to, so are no longer needed once no element refers to them. A
+# -- relationship of another type, like one to the styles part, can be implicit.
+_EXPLICIT_RELTYPES = frozenset(
+    (
+        RT.AUDIO,
+        RT.A_F_CHUNK,
+        RT.CHART,
+        RT.CONTROL,
+        RT.DIAGRAM_COLORS,
+        RT.DIAGRAM_DATA,
+        RT.DIAGRAM_LAYOUT,
+        RT.DIAGRAM_QUICK_STYLE,
+        RT.FOOTER,
+        RT.HEADER,
+        RT.HYPERLINK,
+        RT.IMAGE,
+        RT.OLE_OBJECT,
+        RT.PACKAGE,
+        RT.VIDEO,
+    )
+)
+
+# -- every attribute in the relationships namespace, like `r:id` and `r:embed`, is an rId,
+# -- as is the `o:relid` attribute VML refers to an image with, like in `v:imagedata` --
+_rel_ref_count_xpath = etree.XPath(
+    "count(//@r:*[.=$rId] | //@o:relid[.=$rId])", namespaces={"o": nsmap["o"], "r": nsmap["r"]}
+)
+_rel_refs_xpath = etree.XPath("//@r:* | //@o:relid", namespaces={"o": nsmap["o"], "r": nsmap["r"]})
+
 
 class Part:
     """Base class for package parts.
@@ -35,7 +72,11 @@ class Part:
         super(Part, self).__init__()
         self._partname = partname
         self._content_type = content_type
+        # -- content streamed from a package being opened is read as the part is loaded --
+        if isinstance(blob, StreamedBlob):
+            blob = blob.read()
         self._blob = blob
+        self._source = blob if isinstance(blob, LazyBlob) else None
         self._package = package
 
     def after_unmarshal(self):
@@ -63,8 +104,14 @@ class Part:
         """Contents of this package part as a sequence of bytes.
 
         May be text or binary. Intended to be overridden by subclasses. Default behavior
-        is to return load blob.
+        is to return load blob, which for a lazily loaded part is read from the package
+        on first access. Content held in a file of its own is read from it on each access,
+        it is not kept in memory.
         """
+        if isinstance(self._blob, FileBlob):
+            return self._blob.read()
+        if isinstance(self._blob, LazyBlob):
+            self._blob = self._blob.read()
         return self._blob or b""
 
     @property
@@ -72,15 +119,73 @@ class Part:
         """Content type of this part."""
         return self._content_type
 
+    def detach(self):
+        """Read any content of this part still held only in the source package.
+
+        After this call the part no longer depends on the package it was lazily loaded
+        from, which can then be closed or overwritten. Does nothing for a part that is
+        already fully loaded.
+
+        Content provided as a |memoryview| on the source package, like a memory-mapped
+        file, is copied so it no longer refers to the package either. Content held in a
+        file of its own is left there.
+        """
+        if isinstance(self._blob, LazyBlob):
+            self._blob = self._blob.read()
+        if isinstance(self._blob, memoryview):
+            self._blob = bytes(self._blob)
+        self._source = None
+
     def drop_rel(self, rId: str):
         """Remove the relationship identified by `rId` if its reference count is less
         than 2.
 
-        Relationships with a reference count of 0 are implicit relationships.
+        Relationships with a reference count of 0 are implicit relationships. References
+        are counted afresh on each call, as the XML may have been changed since.
         """
         if self._rel_ref_count(rId) < 2:
             del self.rels[rId]
 
+    def drop_rels(self, rIds: Iterable[str]):
+        """Remove each relationship identified in `rIds` whose reference count is less than
+        2, like :meth:`drop_rel` does for one.
+
+        References are counted in one pass over the XML of this part, however many
+        relationships are dropped, so this is the way to drop many at once.
+        """
+        ref_counts = self._rel_ref_counts()
+        for rId in rIds:
+            if ref_counts[rId] < 2:
+                del self.rels[rId]
+
+    def drop_unreferenced_rels(self) -> List[str]:
+        """Remove each relationship no element of this part refers to anymore.
+
+        Only relationships of a type always referred to by rId, like those to an image or a
+        header, are removed; a relationship of another type can be implicit. A part no
+        longer related to any other part is not saved. Returns the rIds of the
+        relationships removed, in one pass over the XML of this part.
+        """
+        ref_counts = self._rel_ref_counts()
+        unreferenced = [
+            rId
+            for rId, rel in self.rels.items()
+            if ref_counts[rId] == 0 and rel.reltype in _EXPLICIT_RELTYPES
+        ]
+        for rId in unreferenced:
+            del self.rels[rId]
+        return unreferenced
+
+    @property
+    def is_dirty(self) -> bool:
+        """True if this part must be serialized on save.
+
+        A lazily loaded part is clean until its content may have changed, when it is
+        written on save by copying its compressed bytes verbatim from the source package.
+        A part created or loaded eagerly in this session is always dirty.
+        """
+        return self._source is None
+
     @classmethod
     def load(cls, partname: PackURI, content_type: str, blob: bytes, package: Package):
         return cls(partname, content_type, blob, package)
@@ -113,6 +218,8 @@ class Part:
             tmpl = "partname must be instance of PackURI, got '%s'"
             raise TypeError(tmpl % type(partname).__name__)
         self._partname = partname
+        if self._package is not None:
+            self._package.mark_graph_changed()
 
     def part_related_by(self, reltype: str) -> Part:
         """Return part to which this part has a relationship of `reltype`.
@@ -142,18 +249,61 @@ class Part:
         |Slide| instance."""
         return self.rels.related_parts
 
+    @property
+    def source(self) -> LazyBlob | None:
+        """|LazyBlob| handle to the package member this part is unchanged from.
+
+        |None| when this part is dirty.
+        """
+        return self._source
+
     @lazyproperty
     def rels(self):
         """|Relationships| instance holding the relationships for this part."""
         # -- prevent breakage in `python-docx-template` by retaining legacy `._rels` attribute --
-        self._rels = Relationships(self._partname.baseURI)
+        self._rels = Relationships(self._partname.baseURI, self._package)
         return self._rels
 
+    def snapshot(self) -> Part:
+        """Return a copy of this part holding its content and relationships as they are now.
+
+        The copy belongs to no package and later changes to this part do not reach it, so
+        it can be saved on another thread while this part is changed further. Content
+        still held in the source package or in a file of its own is not read, the copy
+        refers to it there.
+        """
+        if self._source is not None:
+            blob = self._source
+        elif isinstance(self._blob, FileBlob):
+            blob = self._blob
+        else:
+            blob = self.blob
+        snapshot = Part(self._partname, self._content_type, blob)
+        snapshot._copy_rels_from(self)
+        return snapshot
+
     def target_ref(self, rId: str) -> str:
         """Return URL contained in target ref of relationship identified by `rId`."""
         rel = self.rels[rId]
         return rel.target_ref
 
+    def write_blob(self, stream: IO[bytes], canonical: bool = False):
+        """Write the blob of this part to binary `stream`.
+
+        Default behavior is to write :attr:`blob`. Overridden by parts that can produce
+        their content incrementally, so it is not held in memory as a whole on save.
+        `canonical` asks for the content in a canonical form, which only XML has. Content
+        held in a file of its own is copied from it a chunk at a time.
+        """
+        if isinstance(self._blob, FileBlob):
+            self._blob.write_to(stream)
+            return
+        stream.write(self.blob)
+
+    def _copy_rels_from(self, part: Part):
+        """Give this part a snapshot of the relationships of `part`, resolved now."""
+        self._rels = self.__dict__["rels"] = part.rels.snapshot()
+
     def _rel_ref_count(self, rId: str) -> int:
         """Return the count of references in this part to the relationship identified by `rId`.
 
@@ -161,6 +311,13 @@ class Part:
         """
         return 0
 
+    def _rel_ref_counts(self) -> Counter[str]:
+        """The count of references in this part to each relationship, by rId.
+
+        Only an XML part can contain references, so this is empty for `Part`.
+        """
+        return Counter()
+
 
 class PartFactory:
     """Provides a way for client code to specify a subclass of |Part| to be constructed
@@ -219,8 +376,22 @@ class XmlPart(Part):
 
     @property
     def blob(self):
+        # -- XML of a lazily loaded part that has never been parsed is passed through as-is --
+        if self.__element is None and self._blob is not None:
+            return self._blob.read() if isinstance(self._blob, LazyBlob) else self._blob
         return serialize_part_xml(self._element)
 
+    def detach(self):
+        """Read the XML of this part into memory if it is still held in the source package.
+
+        The XML is not parsed by this call, that still only happens on first access.
+        """
+        if isinstance(self._blob, LazyBlob):
+            self._blob = self._blob.read()
+        if isinstance(self._blob, memoryview):
+            self._blob = bytes(self._blob)
+        self._source = None
+
     @property
     def element(self):
         """The root XML element of this XML part."""
@@ -228,7 +399,17 @@ class XmlPart(Part):
 
     @classmethod
     def load(cls, partname: PackURI, content_type: str, blob: bytes, package: Package):
-        element = parse_xml(blob)
+        # -- a lazily loaded part defers parsing its XML until its element is first used --
+        if isinstance(blob, LazyBlob):
+            part = cls(partname, content_type, None, package)  # pyright: ignore
+            part._blob = part._source = blob
+            return part
+        # -- XML streamed from a package being opened is parsed as it is read --
+        if isinstance(blob, StreamedBlob):
+            with blob.open() as stream:
+                element = parse_xml_stream(stream, package.read_only, package.resource_limits)
+            return cls(partname, content_type, element, package)
+        element = parse_xml(blob, package.read_only, package.resource_limits)
         return cls(partname, content_type, element, package)
 
     @property
@@ -240,8 +421,63 @@ class XmlPart(Part):
         """
         return self
 
+    def snapshot(self) -> XmlPart:
+        """Return a copy of this part holding its XML and relationships as they are now.
+
+        The element tree is copied, which is much faster than serializing it, so the copy
+        can be serialized on another thread while this part is changed further. XML not
+        yet parsed is not parsed by this call.
+        """
+        snapshot = XmlPart(self._partname, self._content_type, None, None)  # pyright: ignore
+        if self.__element is None and self._blob is not None:
+            snapshot._blob, snapshot._source = self._blob, self._source
+        else:
+            snapshot._element = copy.deepcopy(self._element)
+        snapshot._copy_rels_from(self)
+        return snapshot
+
+    def write_blob(self, stream: IO[bytes], canonical: bool = False):
+        """Write the XML of this part to binary `stream`, serialized as it is written.
+
+        When `canonical` is True, the XML is written in Canonical XML form. XML not yet
+        parsed from the package the part was loaded from is written as it was loaded.
+        """
+        if self.__element is None and self._blob is not None:
+            stream.write(self.blob)
+            return
+        write_part_xml(self._element, stream, canonical)
+
+    @property
+    def _element(self) -> BaseOxmlElement:
+        """Root element of this part, parsed from its load blob on first access.
+
+        Once parsed the element may be changed at any time, so the part becomes dirty.
+        """
+        if self.__element is None and self._blob is not None:
+            blob, self._blob, self._source = self._blob, None, None
+            package = self._package
+            read_only = package is not None and package.read_only
+            limits = None if package is None else package.resource_limits
+            self.__element = parse_xml(
+                blob.read() if isinstance(blob, LazyBlob) else blob, read_only, limits
+            )
+        return cast("BaseOxmlElement", self.__element)
+
+    @_element.setter
+    def _element(self, element: BaseOxmlElement | None):
+        self.__element = element
+        # -- ids a subclass allocator looked for in the old element say nothing about the
+        # -- new one, so it is created again on next use --
+        self.__dict__.pop("id_allocator", None)
+
     def _rel_ref_count(self, rId: str) -> int:
         """Return the count of references in this part's XML to the relationship
-        identified by `rId`."""
-        rIds = cast("list[str]", self._element.xpath("//@r:id"))
-        return len([_rId for _rId in rIds if _rId == rId])
+        identified by `rId`.
+
+        The attributes are counted by libxml2, without building a list of them.
+        """
+        return int(_rel_ref_count_xpath(self._element, rId=rId))
+
+    def _rel_ref_counts(self) -> Counter[str]:
+        """The count of references in this part's XML to each relationship, by rId."""
+        return Counter(cast("List[str]", _rel_refs_xpath(self._element)))
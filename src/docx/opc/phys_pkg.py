@@ -1,43 +1,240 @@
 """Provides a general interface to a `physical` OPC package, such as a zip file."""
 
+from __future__ import annotations
+
+import base64
+import contextlib
+import copy
+import io
+import mmap
 import os
-from zipfile import ZIP_DEFLATED, ZipFile, is_zipfile
+import shutil
+import struct
+import tempfile
+import time
+import weakref
+import zlib
+from typing import IO, Iterator, List, Tuple, cast
+from xml.sax.saxutils import quoteattr
+from zipfile import ZIP_DEFLATED, ZIP_STORED, BadZipFile, ZipFile, ZipInfo, is_zipfile
+
+from lxml import etree
 
+from docx.opc.constants import CONTENT_TYPE as CT
+from docx.opc.constants import NAMESPACE as NS
 from docx.opc.exceptions import PackageNotFoundError
-from docx.opc.packuri import CONTENT_TYPES_URI
+from docx.opc.limits import ResourceLimits
+from docx.opc.oxml import CT_Types, parse_xml, serialize_part_xml
+from docx.opc.packuri import CONTENT_TYPES_URI, PackURI
+
+# -- fixed-size portion of a zip local file header, up to the variable-length filename --
+_LOCAL_HEADER_SIZE = 30
+
+# -- modification time of every member of a deterministic zip package, 1980-01-01 --
+_DETERMINISTIC_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+# -- number of bytes at the start of a package searched for the Flat OPC namespace --
+_FLAT_OPC_SNIFF_SIZE = 4096
+
+# -- largest part content added from a file kept in memory, larger is spooled to disk --
+_SPOOL_MAX_SIZE = 1024 * 1024
+
+# -- size of the chunks content held in a file is copied in --
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# -- largest zip member written through a stream that is sized before being written, a
+# -- larger one is streamed into the archive with zip64 extensions --
+_ZIP_STREAM_BUFFER_SIZE = 16 * 1024 * 1024
 
 
 class PhysPkgReader:
-    """Factory for physical package reader objects."""
+    """Factory for physical package reader objects.
 
-    def __new__(cls, pkg_file):
+    A package can be a zip file, a directory it is expanded into or a Flat OPC file,
+    where the whole package is a single XML document, as Word saves it in "Word XML
+    Document" format.
+
+    When `use_mmap` is True, a zip package at a path is memory-mapped rather than read
+    through a file object. `limits` are checked by a reader that reads the whole package
+    up front, a Flat OPC reader, as it reads it.
+    """
+
+    def __new__(cls, pkg_file, use_mmap: bool = False, limits: ResourceLimits | None = None):
+        # -- a particular reader class constructed directly needs no detection --
+        if cls is not PhysPkgReader:
+            reader_cls = cls
         # if `pkg_file` is a string, treat it as a path
-        if isinstance(pkg_file, str):
+        elif isinstance(pkg_file, str):
             if os.path.isdir(pkg_file):
                 reader_cls = _DirPkgReader
             elif is_zipfile(pkg_file):
                 reader_cls = _ZipPkgReader
+            elif os.path.isfile(pkg_file) and _is_flat_opc(pkg_file):
+                reader_cls = _FlatOpcPkgReader
             else:
                 raise PackageNotFoundError("Package not found at '%s'" % pkg_file)
-        else:  # assume it's a stream and pass it to Zip reader to sort out
+        elif _is_flat_opc(pkg_file):
+            reader_cls = _FlatOpcPkgReader
+        else:  # assume it's a stream or bytes and pass it to Zip reader to sort out
             reader_cls = _ZipPkgReader
 
         return super(PhysPkgReader, cls).__new__(reader_cls)
 
 
 class PhysPkgWriter:
-    """Factory for physical package writer objects."""
+    """Factory for physical package writer objects.
+
+    When `pkg_file` is a path to a directory, or ends with a path separator, the package
+    is written expanded into that directory rather than as a zip file. When `flat` is
+    True, or `pkg_file` is a path with an ``.xml`` extension, the package is written as
+    a single Flat OPC XML document.
+
+    When `append` is True, the existing zip package `pkg_file` is opened for update
+    rather than a new one created. When `deterministic` is True, nothing that varies
+    from one save to the next, like the time members are written, is recorded in the
+    package, so the same members written in the same order produce the same bytes.
+    """
+
+    def __new__(
+        cls,
+        pkg_file,
+        compress_level: int | None = None,
+        append: bool = False,
+        flat: bool = False,
+        deterministic: bool = False,
+    ):
+        # -- a path to a directory, or ending with a separator, is an expanded package --
+        if isinstance(pkg_file, str) and (os.path.isdir(pkg_file) or pkg_file.endswith(os.sep)):
+            writer_cls = _DirPkgWriter
+        elif flat or isinstance(pkg_file, str) and pkg_file.lower().endswith(".xml"):
+            writer_cls = _FlatOpcPkgWriter
+        else:
+            writer_cls = _ZipPkgWriter
+        return super(PhysPkgWriter, cls).__new__(writer_cls)
+
+
+class LazyBlob:
+    """Handle to the content of a member of a physical package, read on demand.
+
+    Allows a part to be loaded without its content being read (and possibly inflated)
+    from the package; the member is only read when the part content is first needed. The
+    physical package reader must remain open for as long as the handle is in use.
+    """
+
+    def __init__(self, phys_reader: PhysPkgReader, pack_uri: PackURI):
+        self._phys_reader = phys_reader
+        self._pack_uri = pack_uri
+
+    @property
+    def pack_uri(self) -> PackURI:
+        """|PackURI| of the package member this handle refers to."""
+        return self._pack_uri
+
+    def open(self) -> IO[bytes]:
+        """Return a binary stream the content of the package member can be read from.
+
+        Allows the content to be processed incrementally, like by an incremental parser,
+        without ever being held in memory as a whole.
+        """
+        return self._phys_reader.open_member(self._pack_uri)
+
+    def read(self) -> bytes:
+        """Return the content of the package member as bytes, read from the package."""
+        return self._phys_reader.blob_for(self._pack_uri)
+
+    def read_raw(self) -> Tuple[ZipInfo, bytes] | None:
+        """Return `(zinfo, data)` pair for the member, `data` still compressed.
+
+        Returns |None| when the package is not a zip archive, like an expanded package
+        directory, so there is no compressed form to copy.
+        """
+        return self._phys_reader.raw_member_for(self._pack_uri)
+
+
+class StreamedBlob:
+    """Handle to the content of a member of a physical package, read as its part loads.
+
+    Unlike a |LazyBlob|, the handle is not kept by the part, it is only used while the
+    part is loaded, while the physical package is still open. An XML part is parsed
+    directly from the stream provided by :meth:`open`, so its XML is never held in
+    memory as a whole; any other part reads its content with :meth:`read`.
+    """
+
+    def __init__(self, phys_reader: PhysPkgReader, pack_uri: PackURI):
+        self._phys_reader = phys_reader
+        self._pack_uri = pack_uri
+
+    def open(self) -> IO[bytes]:
+        """Return a binary stream the content of the package member can be read from."""
+        return self._phys_reader.open_member(self._pack_uri)
 
-    def __new__(cls, pkg_file):
-        return super(PhysPkgWriter, cls).__new__(_ZipPkgWriter)
+    def read(self) -> bytes:
+        """Return the content of the package member as bytes, read from the package."""
+        return self._phys_reader.blob_for(self._pack_uri)
+
+
+class FileBlob:
+    """Handle to the content of a part held in a file of its own, outside any package.
+
+    Allows a part with large binary content, like a high-resolution image or an embedded
+    OLE object, to be added to a package without its content being held in memory. The
+    content is streamed from the file into the package when the package is saved.
+
+    A handle is produced by :meth:`spool`, which copies the content to a temporary file
+    removed once the handle is no longer used, so the file the content came from can be
+    changed or deleted as soon as the part is added.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+
+    @classmethod
+    def spool(cls, stream: IO[bytes]) -> bytes | FileBlob:
+        """Return the content read from `stream`, as a handle on a temporary copy when large.
+
+        Content of no more than `_SPOOL_MAX_SIZE` bytes is returned as bytes, it is not
+        worth a file of its own.
+        """
+        head = stream.read(_SPOOL_MAX_SIZE + 1)
+        if len(head) <= _SPOOL_MAX_SIZE:
+            return head
+        fd, path = tempfile.mkstemp(prefix="docx-", suffix=".bin")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(head)
+                shutil.copyfileobj(stream, f, _COPY_CHUNK_SIZE)
+        except BaseException:
+            _remove_file(path)
+            raise
+        blob = cls(path)
+        weakref.finalize(blob, _remove_file, path)
+        return blob
+
+    def open(self) -> IO[bytes]:
+        """Return a binary stream the content can be read from, independent of any other."""
+        return open(self._path, "rb")
+
+    def read(self) -> bytes:
+        """Return the content as bytes, read from the file."""
+        with self.open() as f:
+            return f.read()
+
+    def write_to(self, stream: IO[bytes]):
+        """Copy the content to `stream`, a chunk at a time."""
+        with self.open() as f:
+            shutil.copyfileobj(f, stream, _COPY_CHUNK_SIZE)
 
 
 class _DirPkgReader(PhysPkgReader):
     """Implements |PhysPkgReader| interface for an OPC package extracted into a
     directory."""
 
-    def __init__(self, path):
-        """`path` is the path to a directory containing an expanded package."""
+    def __init__(self, path, use_mmap: bool = False, limits: ResourceLimits | None = None):
+        """`path` is the path to a directory containing an expanded package.
+
+        `use_mmap` and `limits` are accepted for interface consistency, the files of a
+        directory are not memory-mapped and are only read on demand.
+        """
         super(_DirPkgReader, self).__init__()
         self._path = os.path.abspath(path)
 
@@ -53,6 +250,27 @@ class _DirPkgReader(PhysPkgReader):
         directory file system doesn't need closing."""
         pass
 
+    def iter_member_sizes(self) -> Iterator[Tuple[PackURI, int, int]]:
+        """Generate `(pack_uri, size, stored_size)` for each file in the package directory.
+
+        A file is stored uncompressed, so both sizes are the size of the file.
+        """
+        for dirpath, _, filenames in os.walk(self._path):
+            for filename in sorted(filenames):
+                path = os.path.join(dirpath, filename)
+                membername = os.path.relpath(path, self._path).replace(os.sep, "/")
+                size = os.path.getsize(path)
+                yield PackURI("/%s" % membername), size, size
+
+    def open_member(self, pack_uri: PackURI) -> IO[bytes]:
+        """Return a binary stream on the file corresponding to `pack_uri`."""
+        return open(os.path.join(self._path, pack_uri.membername), "rb")
+
+    def raw_member_for(self, pack_uri: PackURI) -> None:
+        """Provides interface consistency with |_ZipPkgReader|, but a directory member
+        has no compressed form, so this is always |None|."""
+        return None
+
     @property
     def content_types_xml(self):
         """Return the `[Content_Types].xml` blob from the package."""
@@ -69,28 +287,117 @@ class _DirPkgReader(PhysPkgReader):
 
 
 class _ZipPkgReader(PhysPkgReader):
-    """Implements |PhysPkgReader| interface for a zip file OPC package."""
+    """Implements |PhysPkgReader| interface for a zip file OPC package.
+
+    `pkg_file` can be a path, a file-like object or a bytes-like object holding the
+    package. A bytes-like object is read in place, without being copied. A path is
+    memory-mapped when `use_mmap` is True. In both of those cases a member stored
+    without compression is provided as a |memoryview| slice of the package rather than
+    as a copy of its bytes. `limits` is accepted for interface consistency, members are
+    only read on demand.
+    """
 
-    def __init__(self, pkg_file):
+    def __init__(self, pkg_file, use_mmap: bool = False, limits: ResourceLimits | None = None):
         super(_ZipPkgReader, self).__init__()
-        self._zipf = ZipFile(pkg_file, "r")
+        self._mmap: mmap.mmap | None = None
+        self._buffer: memoryview | None = None
+        if isinstance(pkg_file, (bytes, bytearray, memoryview)):
+            self._buffer = memoryview(pkg_file).cast("B")
+        elif isinstance(pkg_file, str) and use_mmap:
+            with open(pkg_file, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._buffer = memoryview(self._mmap)
+        source = pkg_file if self._buffer is None else _BufferReader(self._buffer)
+        self._zipf = ZipFile(source, "r")
 
     def blob_for(self, pack_uri):
         """Return blob corresponding to `pack_uri`.
 
-        Raises |ValueError| if no matching member is present in zip archive.
+        The blob is a |memoryview| on the package for a member stored without
+        compression in a package read in place, |bytes| otherwise. Raises |KeyError| if
+        no matching member is present in zip archive.
         """
-        return self._zipf.read(pack_uri.membername)
+        zinfo = self._zipf.getinfo(pack_uri.membername)
+        if self._buffer is None or zinfo.compress_type != ZIP_STORED or zinfo.flag_bits & 0x1:
+            return self._zipf.read(zinfo)
+        data = self._member_data(zinfo)
+        if zlib.crc32(data) != zinfo.CRC:
+            raise BadZipFile("bad CRC-32 for file '%s'" % zinfo.filename)
+        return data
 
     def close(self):
-        """Close the zip archive, releasing any resources it is using."""
+        """Close the zip archive, releasing any resources it is using.
+
+        A memory-mapped package is unmapped once no blob provided as a |memoryview| on
+        it remains in use.
+        """
         self._zipf.close()
+        if self._buffer is not None:
+            self._buffer.release()
+        if self._mmap is not None:
+            with contextlib.suppress(BufferError):
+                self._mmap.close()
 
     @property
     def content_types_xml(self):
         """Return the `[Content_Types].xml` blob from the zip package."""
         return self.blob_for(CONTENT_TYPES_URI)
 
+    def iter_member_sizes(self) -> Iterator[Tuple[PackURI, int, int]]:
+        """Generate `(pack_uri, size, stored_size)` for each member of the zip archive.
+
+        Sizes come from the zip directory, no member is read. `stored_size` is the size
+        of the member after compression.
+        """
+        for zinfo in self._zipf.infolist():
+            if zinfo.is_dir():
+                continue
+            yield PackURI("/%s" % zinfo.filename), zinfo.file_size, zinfo.compress_size
+
+    def open_member(self, pack_uri: PackURI) -> IO[bytes]:
+        """Return a binary stream the member corresponding to `pack_uri` is inflated from
+        as it is read."""
+        return self._zipf.open(pack_uri.membername)
+
+    def raw_member_for(self, pack_uri: PackURI) -> Tuple[ZipInfo, bytes | memoryview] | None:
+        """Return `(zinfo, data)` pair for the member corresponding to `pack_uri`.
+
+        `data` is the member content exactly as stored in the archive, still compressed,
+        so it can be copied into another archive without being inflated and deflated.
+        Returns |None| when the package is read from a file and the file cannot be shared
+        with the zip file safely, as described for |_ZipInternals|.
+        """
+        zinfo = self._zipf.getinfo(pack_uri.membername)
+        if self._buffer is None and not _ZipInternals.available:
+            return None
+        return zinfo, self._member_data(zinfo)
+
+    def _member_data(self, zinfo: ZipInfo) -> bytes | memoryview:
+        """The data of member `zinfo` as stored in the archive, following its local header.
+
+        A slice of the package when it is read in place, read from the package otherwise.
+        """
+        buffer = self._buffer
+        if buffer is not None:
+            header = bytes(buffer[zinfo.header_offset : zinfo.header_offset + _LOCAL_HEADER_SIZE])
+            offset = self._data_offset(zinfo, header)
+            return buffer[offset : offset + zinfo.compress_size]
+        zipf = self._zipf
+        with _ZipInternals.lock(zipf):
+            fp = zipf.fp
+            assert fp is not None
+            fp.seek(zinfo.header_offset)
+            fp.seek(self._data_offset(zinfo, fp.read(_LOCAL_HEADER_SIZE)))
+            return fp.read(zinfo.compress_size)
+
+    @staticmethod
+    def _data_offset(zinfo: ZipInfo, header: bytes) -> int:
+        """Offset of the data of member `zinfo` in the archive, after local `header`."""
+        if header[:4] != b"PK\x03\x04":
+            raise BadZipFile("bad local file header for '%s'" % zinfo.filename)
+        name_len, extra_len = struct.unpack("<HH", header[26:30])
+        return zinfo.header_offset + _LOCAL_HEADER_SIZE + name_len + extra_len
+
     def rels_xml_for(self, source_uri):
         """Return rels item XML for source with `source_uri` or None if no rels item is
         present."""
@@ -101,19 +408,896 @@ class _ZipPkgReader(PhysPkgReader):
         return rels_xml
 
 
+class _FlatOpcPkgReader(PhysPkgReader):
+    """Implements |PhysPkgReader| interface for a Flat OPC package.
+
+    A Flat OPC package is a single XML document with a `pkg:part` element for each part,
+    holding its XML or its base64-encoded binary content, and its content type in place
+    of a content types item. The document is parsed incrementally as it is read, each
+    part element being discarded once its content is extracted, so only the content of
+    the parts is held in memory.
+
+    A Flat OPC package is always loaded eagerly. A part cannot be read from the document
+    on demand without parsing it again, so the content of every part, binary content
+    decoded, is held until the reader is closed, for as long as a package lazily opened
+    on it is in use.
+
+    The whole document is read as the reader is constructed, so `limits` are checked
+    then: the size of each part as it is extracted, and the depth and element count of
+    the XML of each part as it is parsed. |PackageLimitError| is raised as soon as one is
+    exceeded. libxml2's limits on depth and text-node size apply only when `limits` are
+    given and do not lift them with `huge_xml`; otherwise a package holding a binary part
+    of more than about 7.5 MB could not be read.
+    """
+
+    def __init__(self, pkg_file, use_mmap: bool = False, limits: ResourceLimits | None = None):
+        super(_FlatOpcPkgReader, self).__init__()
+        if isinstance(pkg_file, (bytes, bytearray, memoryview)):
+            pkg_file = io.BytesIO(pkg_file)
+        self._content_types: dict[str, str] = {}
+        self._blobs: dict[str, bytes] = {}
+        # -- limits of None still consume the parts, checking nothing --
+        (limits or ResourceLimits()).check_members(self._load_parts(pkg_file, limits))
+
+    def blob_for(self, pack_uri: PackURI) -> bytes:
+        """Return the content of the part corresponding to `pack_uri`.
+
+        Raises |KeyError| if no such part is present.
+        """
+        return self._blobs[pack_uri.membername]
+
+    def close(self):
+        """Release the part content held by this reader."""
+        self._blobs = {}
+
+    @property
+    def content_types_xml(self) -> bytes:
+        """Return a content types item composed from the content type of each part."""
+        types_elm = CT_Types.new()
+        for membername, content_type in self._content_types.items():
+            types_elm.add_override("/%s" % membername, content_type)
+        return serialize_part_xml(types_elm)
+
+    def iter_member_sizes(self) -> Iterator[Tuple[PackURI, int, int]]:
+        """Generate `(pack_uri, size, stored_size)` for each part in the package.
+
+        Parts are not compressed, so both sizes are the size of the part content.
+        """
+        for membername, blob in self._blobs.items():
+            yield PackURI("/%s" % membername), len(blob), len(blob)
+
+    def open_member(self, pack_uri: PackURI) -> IO[bytes]:
+        """Return a binary stream on the content of the part corresponding to `pack_uri`."""
+        return io.BytesIO(self.blob_for(pack_uri))
+
+    def raw_member_for(self, pack_uri: PackURI) -> None:
+        """Provides interface consistency with |_ZipPkgReader|, but a Flat OPC part has
+        no compressed form, so this is always |None|."""
+        return None
+
+    def rels_xml_for(self, source_uri: PackURI) -> bytes | None:
+        """Return rels item XML for source with `source_uri`, or None if the source has
+        no rels item."""
+        return self._blobs.get(source_uri.rels_uri.membername)
+
+    def _load_parts(
+        self, pkg_file, limits: ResourceLimits | None
+    ) -> Iterator[Tuple[PackURI, int, int]]:
+        """Generate `(pack_uri, size, size)` for each part as its content is extracted.
+
+        Each element is checked against `limits` as it starts, at its depth and count
+        within the XML of the part it is in.
+        """
+        part_tag = _flat_opc_qn("part")
+        context = etree.iterparse(
+            pkg_file,
+            events=("start", "end"),
+            resolve_entities=False,
+            # -- the base64 text of a large binary part, like an image of some MB, is over
+            # -- libxml2's limit on text-node size, so it is lifted unless limits are set --
+            huge_tree=limits is None or limits.huge_xml,
+        )
+        depth = element_count = 0
+        # -- depth of the `pkg:xmlData` element of the part being parsed, if any --
+        data_depth: int | None = None
+        for event, elm in context:
+            if event == "start":
+                depth += 1
+                if elm.tag == part_tag:
+                    data_depth, element_count = depth + 1, 0
+                elif limits is not None and data_depth is not None and depth > data_depth:
+                    element_count += 1
+                    limits.check_xml_element(depth - data_depth, element_count)
+                continue
+            depth -= 1
+            if elm.tag != part_tag:
+                continue
+            data_depth = None
+            membername = elm.get(_flat_opc_qn("name"), "").lstrip("/")
+            self._content_types[membername] = elm.get(_flat_opc_qn("contentType"), "")
+            blob = self._blobs[membername] = _flat_opc_part_blob(elm)
+            elm.clear()
+            while elm.getprevious() is not None:
+                del elm.getparent()[0]  # pyright: ignore[reportOptionalSubscript]
+            yield PackURI("/%s" % membername), len(blob), len(blob)
+
+
+class _FlatOpcPkgWriter(PhysPkgWriter):
+    """Implements |PhysPkgWriter| interface for a Flat OPC package.
+
+    The package is written front to back as a single XML document, so `pkg_file` can be
+    any stream with a `write()` method. The content types item is not written as a part,
+    it provides the content type of each part written after it, unless the content type
+    is given to :meth:`open`. Nothing is compressed; `compress_level` and
+    `compress_type` arguments are accepted for interface consistency but ignored.
+    """
+
+    def __init__(
+        self,
+        pkg_file,
+        compress_level: int | None = None,
+        append: bool = False,
+        flat: bool = False,
+        deterministic: bool = False,
+    ):
+        super(_FlatOpcPkgWriter, self).__init__()
+        if append:
+            raise ValueError("a Flat OPC package cannot be updated in place")
+        self._owns_file = isinstance(pkg_file, str)
+        self._file: IO[bytes] = open(pkg_file, "wb") if self._owns_file else pkg_file  # noqa: SIM115
+        self._written: set[str] = set()
+        self._defaults: dict[str, str] = {}
+        self._overrides: dict[str, str] = {}
+        self._file.write(
+            b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+            b'<?mso-application progid="Word.Document"?>\n'
+            b'<pkg:package xmlns:pkg="%s">' % NS.OPC_FLAT_PACKAGE.encode()
+        )
+
+    def __contains__(self, pack_uri: PackURI) -> bool:
+        """True if a member for `pack_uri` has already been written to this package."""
+        return pack_uri.membername in self._written
+
+    def close(self):
+        """Write the end of the package document and close `pkg_file` if it was opened
+        here; a stream passed in is only flushed."""
+        self._file.write(b"</pkg:package>")
+        if self._owns_file:
+            self._file.close()
+            return
+        flush = getattr(self._file, "flush", None)
+        if flush is not None:
+            flush()
+
+    def compress(
+        self, pack_uri: PackURI, blob: bytes, compress_type: int = ZIP_DEFLATED
+    ) -> Tuple[PackURI, bytes]:
+        """Return `(pack_uri, blob)`, ready for :meth:`write_compressed`.
+
+        Provides interface consistency with |_ZipPkgWriter|; nothing is compressed.
+        """
+        return pack_uri, blob
+
+    def copy(self, pack_uri: PackURI, source: LazyBlob, compress_type: int = ZIP_DEFLATED):
+        """Write the content of the member `source` refers to as part `pack_uri`."""
+        self.write(pack_uri, source.read())
+
+    def discard(self):
+        """Abandon the package without writing its end.
+
+        A file opened here is closed and removed; a stream passed in is left holding an
+        incomplete package document.
+        """
+        if self._owns_file:
+            self._file.close()
+            _remove_file(self._file.name)
+
+    def open(
+        self, pack_uri: PackURI, compress_type: int = ZIP_DEFLATED, content_type: str | None = None
+    ) -> IO[bytes]:
+        """Return a writable stream for the content of part `pack_uri`.
+
+        XML content is written as-is, less any XML declaration; other content is base64
+        encoded as it is written. `content_type` defaults to the content type of
+        `pack_uri` in the content types item already written. No other part can be
+        written until the stream is closed.
+        """
+        if content_type is None:
+            content_type = self._content_type_for(pack_uri)
+        self._written.add(pack_uri.membername)
+        is_xml = content_type.endswith("xml")
+        self._file.write(
+            b"<pkg:part pkg:name=%s pkg:contentType=%s%s>"
+            % (
+                quoteattr(pack_uri).encode("utf-8"),
+                quoteattr(content_type).encode("utf-8"),
+                b"" if is_xml else b' pkg:compression="store"',
+            )
+        )
+        return _FlatOpcPartStream(self._file, is_xml)
+
+    def prepare_copy(
+        self, pack_uri: PackURI, source: LazyBlob, compress_type: int = ZIP_DEFLATED
+    ) -> Tuple[PackURI, bytes]:
+        """Return `(pack_uri, content)` for a copy of `source`, for :meth:`write_compressed`."""
+        return pack_uri, source.read()
+
+    def write(self, pack_uri: PackURI, blob: bytes, compress_type: int = ZIP_DEFLATED):
+        """Write `blob` as the content of part `pack_uri`.
+
+        The content types item is not written, it is read for the content types of the
+        parts that follow.
+        """
+        if pack_uri == CONTENT_TYPES_URI:
+            self._load_content_types(blob)
+            self._written.add(pack_uri.membername)
+            return
+        with self.open(pack_uri) as stream:
+            stream.write(blob)
+
+    def write_compressed(self, pack_uri: PackURI, blob: bytes):
+        """Write `blob` as returned by :meth:`compress` or :meth:`prepare_copy`."""
+        self.write(pack_uri, blob)
+
+    def _content_type_for(self, pack_uri: PackURI) -> str:
+        """Content type of `pack_uri` in the content types item written so far."""
+        if pack_uri.endswith(".rels"):
+            return CT.OPC_RELATIONSHIPS
+        content_type = self._overrides.get(pack_uri.lower())
+        if content_type is None:
+            content_type = self._defaults.get(pack_uri.ext.lower())
+        if content_type is None:
+            raise KeyError("no content type for partname '%s'" % pack_uri)
+        return content_type
+
+    def _load_content_types(self, content_types_xml: bytes):
+        """Record the defaults and overrides of the content types item."""
+        types_elm = cast(CT_Types, parse_xml(content_types_xml))
+        for default in types_elm.defaults:
+            self._defaults[default.extension.lower()] = default.content_type
+        for override in types_elm.overrides:
+            self._overrides[override.partname.lower()] = override.content_type
+
+
+class _ZipMemberStream(io.RawIOBase):
+    """Write-only stream for one member of a zip package, of a size not known up front.
+
+    The size of a member decides whether it needs zip64 extensions, which a member can
+    only be given before it is written. Content is buffered until it exceeds
+    `_ZIP_STREAM_BUFFER_SIZE`; a member no larger is sized and written whole, like one
+    written from a blob. A larger member is streamed into the archive with zip64
+    extensions, so it can grow past the 2 GiB a member without them is limited to.
+    """
+
+    def __init__(self, zipf: ZipFile, zinfo: ZipInfo):
+        super(_ZipMemberStream, self).__init__()
+        self._zipf = zipf
+        self._zinfo = zinfo
+        self._buffer: io.BytesIO | None = io.BytesIO()
+        self._member: IO[bytes] | None = None
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self._member is not None:
+                self._member.close()
+            elif self._buffer is not None:
+                data = self._buffer.getvalue()
+                self._zinfo.file_size = len(data)
+                with self._zipf.open(self._zinfo, "w") as member:
+                    member.write(data)
+        finally:
+            self._buffer = None
+            super(_ZipMemberStream, self).close()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: bytes | bytearray | memoryview) -> int:  # pyright: ignore[reportIncompatibleMethodOverride]
+        if self._member is not None:
+            self._member.write(b)
+            return len(b)
+        buffer = cast(io.BytesIO, self._buffer)
+        buffer.write(b)
+        if buffer.tell() > _ZIP_STREAM_BUFFER_SIZE:
+            self._member = self._zipf.open(self._zinfo, "w", force_zip64=True)
+            self._member.write(buffer.getvalue())
+            self._buffer = None
+        return len(b)
+
+
+class _FlatOpcPartStream(io.RawIOBase):
+    """Write-only stream for the content of one part of a Flat OPC package.
+
+    Closing the stream ends the part element. XML content has its XML declaration
+    dropped, it cannot appear within the package document. Binary content is base64
+    encoded, three bytes at a time being carried over between writes so the encoding is
+    continuous.
+    """
+
+    def __init__(self, file: IO[bytes], is_xml: bool):
+        super(_FlatOpcPartStream, self).__init__()
+        self._file = file
+        self._is_xml = is_xml
+        self._pending = b""
+        self._started = False
+        file.write(b"<pkg:xmlData>" if is_xml else b"<pkg:binaryData>")
+
+    def close(self):
+        if self.closed:
+            return
+        if self._is_xml:
+            self._file.write(self._strip_declaration(self._pending, final=True))
+            self._file.write(b"</pkg:xmlData></pkg:part>")
+        else:
+            self._file.write(base64.b64encode(self._pending))
+            self._file.write(b"</pkg:binaryData></pkg:part>")
+        self._pending = b""
+        super(_FlatOpcPartStream, self).close()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: bytes | bytearray | memoryview) -> int:  # pyright: ignore[reportIncompatibleMethodOverride]
+        data = self._pending + bytes(b)
+        if self._is_xml:
+            self._pending = b""
+            self._file.write(self._strip_declaration(data, final=False))
+        else:
+            whole = len(data) - len(data) % 3
+            self._file.write(base64.b64encode(data[:whole]))
+            self._pending = data[whole:]
+        return len(b)
+
+    def _strip_declaration(self, data: bytes, final: bool) -> bytes:
+        """Return `data` less any leading XML declaration.
+
+        Until it is known whether `data` starts with a declaration, it is held back in
+        `_pending` and nothing is returned, unless `final` is True.
+        """
+        if self._started:
+            return data
+        head = data.lstrip()
+        if len(head) < 5 or head.startswith(b"<?xml") and b"?>" not in head:
+            if not final:
+                self._pending = data
+                return b""
+            self._started = True
+            return data
+        self._started = True
+        if not head.startswith(b"<?xml"):
+            return data
+        return head[head.index(b"?>") + 2 :].lstrip()
+
+
+def _flat_opc_part_blob(part_elm: etree._Element) -> bytes:
+    """Content of the Flat OPC part `part_elm`, serialized XML or decoded binary data."""
+    data_elm = part_elm[0] if len(part_elm) else None
+    if data_elm is None:
+        return b""
+    if data_elm.tag == _flat_opc_qn("xmlData"):
+        if not len(data_elm):
+            return b""
+        # -- a copy sheds the namespace declarations of the package elements it is in --
+        root_elm = copy.deepcopy(data_elm[0])
+        etree.cleanup_namespaces(root_elm)
+        return serialize_part_xml(root_elm)
+    return base64.b64decode(data_elm.text or "")
+
+
+def _flat_opc_qn(name: str) -> str:
+    """Clark-notation name of `name` in the Flat OPC package namespace."""
+    return "{%s}%s" % (NS.OPC_FLAT_PACKAGE, name)
+
+
+def _is_flat_opc(pkg_file) -> bool:
+    """True if `pkg_file`, a path, stream or bytes, starts like a Flat OPC document.
+
+    A stream is returned to its original position; one that cannot seek is never
+    recognized, it is left for the zip reader.
+    """
+    if isinstance(pkg_file, str):
+        with open(pkg_file, "rb") as f:
+            head = f.read(_FLAT_OPC_SNIFF_SIZE)
+    elif isinstance(pkg_file, (bytes, bytearray, memoryview)):
+        head = bytes(memoryview(pkg_file).cast("B")[:_FLAT_OPC_SNIFF_SIZE])
+    elif _is_seekable(pkg_file):
+        position = pkg_file.tell()
+        head = pkg_file.read(_FLAT_OPC_SNIFF_SIZE)
+        pkg_file.seek(position)
+    else:
+        return False
+    return head[:2] != b"PK" and NS.OPC_FLAT_PACKAGE.encode() in head
+
+
+class _BufferReader(io.RawIOBase):
+    """Read-only, seekable binary stream on a buffer, like a |memoryview|.
+
+    Unlike |BytesIO|, the buffer is read in place rather than copied on construction.
+    """
+
+    def __init__(self, buffer: memoryview):
+        super(_BufferReader, self).__init__()
+        self._buffer = buffer
+        self._position = 0
+
+    def read(self, size: int | None = -1) -> bytes:
+        start = min(self._position, len(self._buffer))
+        end = len(self._buffer) if size is None or size < 0 else start + size
+        self._position = min(end, len(self._buffer))
+        return bytes(self._buffer[start : self._position])
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: bytearray | memoryview) -> int:  # pyright: ignore[reportIncompatibleMethodOverride]
+        data = self.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._buffer)
+        if offset < 0:
+            raise ValueError("negative seek position %d" % offset)
+        self._position = offset
+        return offset
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+
+class _DirPkgWriter(PhysPkgWriter):
+    """Implements |PhysPkgWriter| interface for an OPC package expanded into a directory.
+
+    Each member is written to a file at its membername below the directory, which is
+    created when it does not exist. Nothing is compressed, so `compress_level` and
+    `compress_type` arguments are accepted for interface consistency but ignored. Files
+    already in the directory are left as they are unless a member replaces them, which
+    makes `append` a no-op; the directory is always updated in place.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        compress_level: int | None = None,
+        append: bool = False,
+        flat: bool = False,
+        deterministic: bool = False,
+    ):
+        super(_DirPkgWriter, self).__init__()
+        self._path = os.path.abspath(path)
+        self._written: set[str] = set()
+        os.makedirs(self._path, exist_ok=True)
+
+    def __contains__(self, pack_uri: PackURI) -> bool:
+        """True if a member for `pack_uri` has already been written to this package."""
+        return pack_uri.membername in self._written
+
+    def blob_for(self, pack_uri: PackURI) -> bytes:
+        """Return the content of the file for existing member `pack_uri`.
+
+        Raises |KeyError| if no such file is present.
+        """
+        try:
+            with open(self._path_for(pack_uri), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            raise KeyError(pack_uri)
+
+    def close(self):
+        """Provides interface consistency with |_ZipPkgWriter|, but does nothing, each
+        file is closed as soon as it is written."""
+        pass
+
+    def compress(
+        self, pack_uri: PackURI, blob: bytes, compress_type: int = ZIP_DEFLATED
+    ) -> Tuple[PackURI, bytes]:
+        """Return `(pack_uri, blob)`, ready for :meth:`write_compressed`.
+
+        Provides interface consistency with |_ZipPkgWriter|; nothing is compressed.
+        """
+        return pack_uri, blob
+
+    def copy(self, pack_uri: PackURI, source: LazyBlob, compress_type: int = ZIP_DEFLATED):
+        """Write the content of the member `source` refers to, to the file for `pack_uri`."""
+        self.write(pack_uri, source.read())
+
+    def discard(self):
+        """Abandon the package, removing each file written to it so far."""
+        for membername in self._written:
+            _remove_file(os.path.join(self._path, *membername.split("/")))
+        self._written.clear()
+
+    def open(
+        self, pack_uri: PackURI, compress_type: int = ZIP_DEFLATED, content_type: str | None = None
+    ) -> IO[bytes]:
+        """Return a writable stream on the file for member `pack_uri`.
+
+        `content_type` is accepted for interface consistency, it is not recorded here.
+        """
+        path = self._path_for(pack_uri)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._written.add(pack_uri.membername)
+        return open(path, "wb")
+
+    @property
+    def pack_uris(self) -> List[PackURI]:
+        """|PackURI| of each file in the package directory."""
+        return [pack_uri for pack_uri, _, _ in _DirPkgReader(self._path).iter_member_sizes()]
+
+    def prepare_copy(
+        self, pack_uri: PackURI, source: LazyBlob, compress_type: int = ZIP_DEFLATED
+    ) -> Tuple[PackURI, bytes]:
+        """Return `(pack_uri, content)` for a copy of `source`, for :meth:`write_compressed`."""
+        return pack_uri, source.read()
+
+    def remove(self, pack_uri: PackURI):
+        """Delete the file for member `pack_uri`, if there is one."""
+        self._written.discard(pack_uri.membername)
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._path_for(pack_uri))
+
+    def write(self, pack_uri: PackURI, blob: bytes, compress_type: int = ZIP_DEFLATED):
+        """Write `blob` to the file for member `pack_uri`."""
+        with self.open(pack_uri) as f:
+            f.write(blob)
+
+    def write_compressed(self, pack_uri: PackURI, blob: bytes):
+        """Write `blob` as returned by :meth:`compress` or :meth:`prepare_copy`."""
+        self.write(pack_uri, blob)
+
+    def _path_for(self, pack_uri: PackURI) -> str:
+        return os.path.join(self._path, *pack_uri.membername.split("/"))
+
+
+class _UnseekableWriter(io.RawIOBase):
+    """Write-only binary stream wrapping `stream`, which only needs a `write()` method.
+
+    Keeps track of its own position, which is all the zip file needs to write to a
+    target it cannot seek, like a pipe or a network connection. Each member is then
+    followed by a data descriptor holding its CRC and sizes rather than them being filled
+    into its header once known.
+    """
+
+    def __init__(self, stream: IO[bytes]):
+        super(_UnseekableWriter, self).__init__()
+        self._stream = stream
+        self._position = 0
+
+    def flush(self):
+        flush = getattr(self._stream, "flush", None)
+        if flush is not None:
+            flush()
+
+    def tell(self) -> int:
+        return self._position
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: bytes | bytearray | memoryview) -> int:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """Write all of `b` to the wrapped stream, in as many calls as that takes.
+
+        A raw stream, like a socket or pipe, may write only some of the bytes it is
+        given and return how many it wrote; the rest are written again. A `write()`
+        returning |None|, like that of many file-like objects, is taken to write them all.
+        """
+        size = memoryview(b).nbytes
+        data = b
+        while True:
+            written = self._stream.write(data)
+            if written is None or written >= len(data):
+                break
+            if written <= 0:
+                raise OSError("stream wrote none of the %d bytes given it" % len(data))
+            data = memoryview(data)[written:]
+        self._position += size
+        return size
+
+
+def _is_seekable(stream: IO[bytes]) -> bool:
+    """True if `stream` reports it can be repositioned."""
+    seekable = getattr(stream, "seekable", None)
+    try:
+        return bool(seekable()) if seekable is not None else False
+    except (OSError, ValueError):
+        return False
+
+
 class _ZipPkgWriter(PhysPkgWriter):
-    """Implements |PhysPkgWriter| interface for a zip file OPC package."""
+    """Implements |PhysPkgWriter| interface for a zip file OPC package.
+
+    `pkg_file` can be a path, a seekable file-like object or a write-only stream like a
+    pipe or a network connection, which is written front to back.
 
-    def __init__(self, pkg_file):
+    When `append` is True, `pkg_file` is an existing zip package that is updated in
+    place. Its members stay where they are; a member can be removed from its central
+    directory with :meth:`remove`, and new members are written after the end of the
+    archive, followed by a new directory when the package is closed. Nothing is written
+    when nothing changed. :meth:`discard` truncates the file back to its original size,
+    undoing the update. The update is not atomic: a package whose update is interrupted
+    by a crash has its new members but no directory for them at its end, though the old
+    directory is left intact, so truncating the file to its original size restores it.
+
+    Members can be written in one step with :meth:`write` or :meth:`copy`, or in two
+    steps by compressing them with :meth:`compress` or :meth:`prepare_copy`, both of
+    which are thread-safe, and then writing the result with :meth:`write_compressed` in
+    the order members should appear in the archive.
+
+    Updating a package in place and writing members compressed beforehand rely on
+    |_ZipInternals|. Where they are not available, a package cannot be updated in place
+    and members are compressed as they are written instead.
+    """
+
+    def __init__(
+        self,
+        pkg_file,
+        compress_level: int | None = None,
+        append: bool = False,
+        flat: bool = False,
+        deterministic: bool = False,
+    ):
         super(_ZipPkgWriter, self).__init__()
-        self._zipf = ZipFile(pkg_file, "w", compression=ZIP_DEFLATED)
+        if append and not _ZipInternals.available:
+            raise ValueError("this version of zipfile cannot update a package in place")
+        if not isinstance(pkg_file, str) and not _is_seekable(pkg_file):
+            pkg_file = _UnseekableWriter(pkg_file)
+        mode = "a" if append else "w"
+        self._zipf = ZipFile(pkg_file, mode, compression=ZIP_DEFLATED, compresslevel=compress_level)
+        # -- size of a package being updated, which it is truncated back to if discarded --
+        self._original_size: int | None = None
+        if append:
+            # -- members are written after the existing central directory rather than
+            # -- over it, so it is intact until the new one is written --
+            self._original_size = _ZipInternals.append_after_directory(self._zipf)
+        self._owns_file = isinstance(pkg_file, str)
+        # -- a new package file created here is removed when it is discarded --
+        self._path: str | None = pkg_file if self._owns_file and not append else None
+        self._compress_level = compress_level
+        self._deterministic = deterministic
+
+    def __contains__(self, pack_uri: PackURI) -> bool:
+        """True if a member for `pack_uri` has already been written to this package."""
+        return pack_uri.membername in self._zipf.NameToInfo
+
+    def blob_for(self, pack_uri: PackURI) -> bytes:
+        """Return the content of existing member `pack_uri` of a package being updated.
+
+        Raises |KeyError| if no such member is present.
+        """
+        return self._zipf.read(pack_uri.membername)
 
     def close(self):
         """Close the zip archive, flushing any pending physical writes and releasing any
         resources it's using."""
         self._zipf.close()
 
-    def write(self, pack_uri, blob):
+    def compress(
+        self, pack_uri: PackURI, blob: bytes, compress_type: int = ZIP_DEFLATED
+    ) -> Tuple[ZipInfo, bytes]:
+        """Return `(zinfo, data)` pair for member `pack_uri` having content `blob`.
+
+        `data` is `blob` compressed with `compress_type` at this writer's compression
+        level, ready for :meth:`write_compressed`. Safe to call from a worker thread;
+        zlib releases the GIL while compressing, so members can be compressed in
+        parallel. `data` is `blob` itself when |_ZipInternals| are not available, and is
+        compressed as it is written.
+        """
+        compress_type = self._compress_type_for(compress_type)
+        zinfo = self._new_zinfo(pack_uri, compress_type)
+        zinfo.file_size = len(blob)
+        zinfo.CRC = zlib.crc32(blob)
+        if compress_type == ZIP_STORED or not _ZipInternals.available:
+            data = blob
+        else:
+            level = (
+                zlib.Z_DEFAULT_COMPRESSION if self._compress_level is None else self._compress_level
+            )
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+            data = compressor.compress(blob) + compressor.flush()
+        zinfo.compress_size = len(data)
+        return zinfo, data
+
+    def copy(self, pack_uri: PackURI, source: LazyBlob, compress_type: int = ZIP_DEFLATED):
+        """Write the member `source` refers to, to the membername for `pack_uri`.
+
+        The compressed bytes of a zip-archive member are copied verbatim, without being
+        inflated or deflated again. `compress_type` only applies when `source` has no
+        compressed form.
+        """
+        self.write_compressed(*self.prepare_copy(pack_uri, source, compress_type))
+
+    def discard(self):
+        """Abandon the package without writing its central directory.
+
+        Any member stream must be closed first. A package being updated is truncated back
+        to its size before the update, leaving it as it was. Otherwise a package file
+        created here is closed and removed; a stream passed in is left holding members
+        that no zip reader can find.
+        """
+        fp, self._zipf.fp = self._zipf.fp, None
+        if fp is None:
+            return
+        if self._original_size is not None:
+            fp.truncate(self._original_size)
+        if self._owns_file:
+            fp.close()
+        if self._path is not None:
+            _remove_file(self._path)
+
+    def open(
+        self, pack_uri: PackURI, compress_type: int = ZIP_DEFLATED, content_type: str | None = None
+    ) -> IO[bytes]:
+        """Return a writable stream for member `pack_uri`, compressed as it is written.
+
+        Allows a member to be written incrementally without its content ever being held
+        in memory as a whole. No other member can be written until the stream is closed.
+        `content_type` is accepted for interface consistency, a zip package records
+        content types in its content types item.
+        """
+        zinfo = self._new_zinfo(pack_uri, self._compress_type_for(compress_type))
+        _ZipInternals.set_compress_level(zinfo, self._compress_level)
+        return _ZipMemberStream(self._zipf, zinfo)
+
+    def prepare_copy(
+        self, pack_uri: PackURI, source: LazyBlob, compress_type: int = ZIP_DEFLATED
+    ) -> Tuple[ZipInfo, bytes]:
+        """Return `(zinfo, data)` pair for a copy of `source` named by `pack_uri`.
+
+        Like :meth:`compress`, but for the content of an existing member, which is only
+        compressed when it has no compressed form that can be copied verbatim.
+        """
+        raw_member = source.read_raw()
+        if raw_member is None:
+            return self.compress(pack_uri, source.read(), compress_type)
+        src_zinfo, data = raw_member
+        zinfo = self._new_zinfo(pack_uri, src_zinfo.compress_type)
+        zinfo.CRC = src_zinfo.CRC
+        zinfo.file_size = src_zinfo.file_size
+        zinfo.compress_size = len(data)
+        return zinfo, data
+
+    @property
+    def pack_uris(self) -> List[PackURI]:
+        """|PackURI| of each member in this package, in the order they were written."""
+        return [PackURI("/%s" % zinfo.filename) for zinfo in self._zipf.filelist]
+
+    def remove(self, pack_uri: PackURI):
+        """Remove member `pack_uri` from the central directory of this package.
+
+        The content of the member is left where it is in the archive, no longer
+        referenced, so nothing else needs to be moved. Does nothing when no such member
+        is present.
+        """
+        zipf = self._zipf
+        zinfo = zipf.NameToInfo.pop(pack_uri.membername, None)
+        if zinfo is None:
+            return
+        zipf.filelist.remove(zinfo)
+        _ZipInternals.mark_modified(zipf)
+
+    def write(self, pack_uri, blob, compress_type: int = ZIP_DEFLATED):
         """Write `blob` to this zip package with the membername corresponding to
         `pack_uri`."""
-        self._zipf.writestr(pack_uri.membername, blob)
+        zinfo = self._new_zinfo(pack_uri, self._compress_type_for(compress_type))
+        self._zipf.writestr(zinfo, blob, compresslevel=self._compress_level)
+
+    def write_compressed(self, zinfo: ZipInfo, data: bytes):
+        """Write member `zinfo` having already-compressed content `data`.
+
+        `zinfo` must have its CRC, sizes and compression type set to match `data`, as
+        :meth:`compress` and :meth:`prepare_copy` leave it.
+        """
+        if not _ZipInternals.available:
+            self._zipf.writestr(zinfo, data, compresslevel=self._compress_level)
+            return
+        _ZipInternals.write_compressed(self._zipf, zinfo, data)
+
+    def _compress_type_for(self, compress_type: int) -> int:
+        """The compression type a new member requested as `compress_type` is written with.
+
+        A compression level of 0 stores every member without compression, which is
+        faster than deflating it at level 0 and produces nearly the same output.
+        """
+        return ZIP_STORED if self._compress_level == 0 else compress_type
+
+    def _new_zinfo(self, pack_uri: PackURI, compress_type: int) -> ZipInfo:
+        """Return a new |ZipInfo| for `pack_uri`, with the same defaults `writestr` uses.
+
+        A deterministic package has every member dated at the earliest time a zip file
+        can record and marked as created on the same system, whatever the platform.
+        """
+        if self._deterministic:
+            zinfo = ZipInfo(pack_uri.membername, date_time=_DETERMINISTIC_DATE_TIME)
+            zinfo.create_system = 3
+        else:
+            zinfo = ZipInfo(pack_uri.membername, date_time=time.localtime(time.time())[:6])
+        zinfo.compress_type = compress_type
+        zinfo.external_attr = 0o600 << 16
+        return zinfo
+
+
+def _has_zip_internals() -> bool:
+    """True if |ZipFile| has every private attribute |_ZipInternals| uses."""
+    with ZipFile(io.BytesIO(), "w") as zipf:
+        return all(
+            hasattr(zipf, name)
+            for name in ("_didModify", "_lock", "_seekable", "_writecheck", "start_dir")
+        )
+
+
+class _ZipInternals:
+    """The private state of |ZipFile| this module relies on, used only through here.
+
+    `ZipFile` has no public way to write a member already compressed, to drop a member
+    from its central directory, or to add members after an existing directory rather
+    than over it. These are done here the way `ZipFile` does them itself, with the
+    private attributes it has had since Python 3.7. Whether they are all present is
+    checked on import; `available` is False when any is missing, as it may be in a
+    later Python, and callers then fall back to public `ZipFile` methods.
+    """
+
+    available = _has_zip_internals()
+
+    @staticmethod
+    def append_after_directory(zipf: ZipFile) -> int:
+        """Have members added to `zipf`, open in append mode, written after the end of
+        the archive, leaving its central directory intact. Returns the archive size."""
+        fp = zipf.fp
+        assert fp is not None
+        size = fp.seek(0, os.SEEK_END)
+        zipf.start_dir = size  # pyright: ignore[reportAttributeAccessIssue]
+        return size
+
+    @staticmethod
+    def lock(zipf: ZipFile) -> contextlib.AbstractContextManager[object]:
+        """The lock `zipf` holds while using its file, to share the file safely."""
+        return zipf._lock  # pyright: ignore[reportAttributeAccessIssue]
+
+    @staticmethod
+    def mark_modified(zipf: ZipFile):
+        """Have `zipf` write its central directory on close, even when no member was
+        written."""
+        zipf._didModify = True  # pyright: ignore[reportAttributeAccessIssue]
+
+    @staticmethod
+    def set_compress_level(zinfo: ZipInfo, level: int | None):
+        """Have member `zinfo` compressed at `level` when written through `ZipFile.open()`.
+
+        Left at the default level when `zinfo` has no attribute for it.
+        """
+        for name in ("compress_level", "_compresslevel"):
+            if hasattr(zinfo, name):
+                setattr(zinfo, name, level)
+                return
+
+    @staticmethod
+    def write_compressed(zipf: ZipFile, zinfo: ZipInfo, data: bytes):
+        """Write member `zinfo` having already-compressed content `data` to `zipf`, the
+        same way `ZipFile` adds a member."""
+        fp = zipf.fp
+        assert fp is not None
+        with zipf._lock:  # pyright: ignore[reportAttributeAccessIssue]
+            if zipf._seekable:  # pyright: ignore[reportAttributeAccessIssue]
+                fp.seek(zipf.start_dir)  # pyright: ignore[reportAttributeAccessIssue]
+            zinfo.header_offset = fp.tell()
+            zipf._writecheck(zinfo)  # pyright: ignore[reportAttributeAccessIssue]
+            zipf._didModify = True  # pyright: ignore[reportAttributeAccessIssue]
+            fp.write(zinfo.FileHeader())
+            fp.write(data)
+            zipf.filelist.append(zinfo)
+            zipf.NameToInfo[zinfo.filename] = zinfo
+            zipf.start_dir = fp.tell()  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def _remove_file(path: str):
+    """Remove the file at `path`, if it is still there."""
+    with contextlib.suppress(OSError):
+        os.remove(path)
@@ -3,30 +3,67 @@
 from docx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from docx.opc.oxml import parse_xml
 from docx.opc.packuri import PACKAGE_URI, PackURI
-from docx.opc.phys_pkg import PhysPkgReader
-from docx.opc.shared import CaseInsensitiveDict
+from docx.opc.phys_pkg import LazyBlob, PhysPkgReader, StreamedBlob
+from docx.opc.shared import CaseInsensitiveDict, walk_rels_graph
 
 
 class PackageReader:
     """Provides access to the contents of a zip-format OPC package via its
     :attr:`serialized_parts` and :attr:`pkg_srels` attributes."""
 
-    def __init__(self, content_types, pkg_srels, sparts):
+    def __init__(self, content_types, pkg_srels, sparts, phys_reader=None):
         super(PackageReader, self).__init__()
         self._pkg_srels = pkg_srels
         self._sparts = sparts
+        self._phys_reader = phys_reader
 
     @staticmethod
-    def from_file(pkg_file):
-        """Return a |PackageReader| instance loaded with contents of `pkg_file`."""
-        phys_reader = PhysPkgReader(pkg_file)
-        content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
-        pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
-        sparts = PackageReader._load_serialized_parts(
-            phys_reader, pkg_srels, content_types
-        )
-        phys_reader.close()
-        return PackageReader(content_types, pkg_srels, sparts)
+    def from_file(pkg_file, lazy=False, exclude_reltypes=(), use_mmap=False, limits=None):
+        """Return a |PackageReader| instance loaded with contents of `pkg_file`.
+
+        The blob of each serialized part is a handle on the physical package, which is
+        left open so part content can be read from it; a |LazyBlob| when `lazy` is True,
+        so content is read on demand, and a |StreamedBlob| read as the part is loaded
+        otherwise. The caller is responsible for calling :meth:`close` once done, which
+        when not lazy is as soon as the parts are loaded.
+
+        Relationships having a type in `exclude_reltypes` are left out, along with the
+        parts only reachable through them.
+
+        When `use_mmap` is True, a zip package at a path is memory-mapped, so members
+        stored without compression are read as views on the mapping rather than copied.
+
+        When `limits` is a |ResourceLimits|, the sizes of the package members are checked
+        against it before any is read, raising |PackageLimitError| when over a limit.
+        The size of a zip member is that in the zip directory, which is also the most
+        that is inflated when it is read.
+        """
+        phys_reader = PhysPkgReader(pkg_file, use_mmap=use_mmap, limits=limits)
+        # -- the physical package is left open only once it is loaded without error --
+        try:
+            if limits is not None:
+                limits.check_members(phys_reader.iter_member_sizes())
+            content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
+            pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
+            if exclude_reltypes:
+                pkg_srels = [srel for srel in pkg_srels if srel.reltype not in exclude_reltypes]
+            sparts = PackageReader._load_serialized_parts(
+                phys_reader, pkg_srels, content_types, lazy, exclude_reltypes
+            )
+        except BaseException:
+            phys_reader.close()
+            raise
+        return PackageReader(content_types, pkg_srels, sparts, phys_reader)
+
+    def close(self):
+        """Close the physical package this reader reads part content from.
+
+        Does nothing when it is already closed.
+        """
+        if self._phys_reader is None:
+            return
+        self._phys_reader.close()
+        self._phys_reader = None
 
     def iter_sparts(self):
         """Generate a 4-tuple `(partname, content_type, reltype, blob)` for each of the
@@ -44,12 +81,17 @@ class PackageReader:
                 yield (spart.partname, srel)
 
     @staticmethod
-    def _load_serialized_parts(phys_reader, pkg_srels, content_types):
+    def _load_serialized_parts(
+        phys_reader, pkg_srels, content_types, lazy=False, exclude_reltypes=()
+    ):
         """Return a list of |_SerializedPart| instances corresponding to the parts in
         `phys_reader` accessible by walking the relationship graph starting with
-        `pkg_srels`."""
+        `pkg_srels`, without following relationships having a type in
+        `exclude_reltypes`."""
         sparts = []
-        part_walker = PackageReader._walk_phys_parts(phys_reader, pkg_srels)
+        part_walker = PackageReader._walk_phys_parts(
+            phys_reader, pkg_srels, lazy, exclude_reltypes
+        )
         for partname, blob, reltype, srels in part_walker:
             content_type = content_types[partname]
             spart = _SerializedPart(partname, content_type, reltype, blob, srels)
@@ -64,27 +106,28 @@ class PackageReader:
         return _SerializedRelationships.load_from_xml(source_uri.baseURI, rels_xml)
 
     @staticmethod
-    def _walk_phys_parts(phys_reader, srels, visited_partnames=None):
+    def _walk_phys_parts(phys_reader, srels, lazy=False, exclude_reltypes=()):
         """Generate a 4-tuple `(partname, blob, reltype, srels)` for each of the parts
-        in `phys_reader` by walking the relationship graph rooted at srels."""
-        if visited_partnames is None:
-            visited_partnames = []
-        for srel in srels:
-            if srel.is_external:
-                continue
-            partname = srel.target_partname
-            if partname in visited_partnames:
+        in `phys_reader` by walking the relationship graph rooted at srels.
+
+        `blob` is a handle on the part content rather than the content itself, which is
+        not read here; a |LazyBlob| when `lazy` is True and a |StreamedBlob| otherwise.
+        Relationships having a type in
+        `exclude_reltypes` are neither followed nor included in the generated `srels`.
+        """
+
+        def srels_for(partname):
+            srels = PackageReader._srels_for(phys_reader, partname)
+            if not exclude_reltypes:
+                return srels
+            return [srel for srel in srels if srel.reltype not in exclude_reltypes]
+
+        rels_walker = walk_rels_graph(srels, lambda srel: srel.target_partname, srels_for)
+        for srel, partname, part_srels in rels_walker:
+            if partname is None:
                 continue
-            visited_partnames.append(partname)
-            reltype = srel.reltype
-            part_srels = PackageReader._srels_for(phys_reader, partname)
-            blob = phys_reader.blob_for(partname)
-            yield (partname, blob, reltype, part_srels)
-            next_walker = PackageReader._walk_phys_parts(
-                phys_reader, part_srels, visited_partnames
-            )
-            for partname, blob, reltype, srels in next_walker:
-                yield (partname, blob, reltype, srels)
+            blob_cls = LazyBlob if lazy else StreamedBlob
+            yield (partname, blob_cls(phys_reader, partname), srel.reltype, part_srels)
 
 
 class _ContentTypeMap:
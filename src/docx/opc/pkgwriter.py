@@ -6,7 +6,11 @@ OpcPackage.save().
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterable
+import io
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Collection, Deque, Iterable, Tuple
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipInfo
 
 from docx.opc.constants import CONTENT_TYPE as CT
 from docx.opc.oxml import CT_Types, serialize_part_xml
@@ -16,26 +20,165 @@ from docx.opc.shared import CaseInsensitiveDict
 from docx.opc.spec import default_content_types
 
 if TYPE_CHECKING:
+    from docx.opc.packuri import PackURI
     from docx.opc.part import Part
 
+# -- content types of media that is already compressed, so gains next to nothing from
+# -- being deflated again; suitable for `stored_content_types` when saving.
+PRECOMPRESSED_CONTENT_TYPES = frozenset((CT.GIF, CT.JPEG, CT.MS_PHOTO, CT.PNG))
+
 
 class PackageWriter:
     """Writes a zip-format OPC package to `pkg_file`, where `pkg_file` can be either a
     path to a zip file (a string) or a file-like object.
 
-    Its single API method, :meth:`write`, is static, so this class is not intended to be
-    instantiated.
+    Its API methods, :meth:`write` and :meth:`write_to`, are static, so this class is
+    not intended to be instantiated.
     """
 
     @staticmethod
-    def write(pkg_file, pkg_rels, parts):
+    def write(
+        pkg_file,
+        pkg_rels,
+        parts,
+        compress_level: int | None = None,
+        compress_workers: int | None = None,
+        stored_content_types: Collection[str] = (),
+        deterministic: bool = False,
+    ):
         """Write a physical package (.pptx file) to `pkg_file` containing `pkg_rels` and
-        `parts` and a content types stream based on the content types of the parts."""
-        phys_writer = PhysPkgWriter(pkg_file)
+        `parts` and a content types stream based on the content types of the parts.
+
+        `compress_level` is the zlib compression level, the zlib default when |None|.
+        When `compress_workers` is greater than one, parts are compressed concurrently
+        by that many threads. A part having a content type in `stored_content_types` is
+        stored without compression, useful for media that is already compressed, like
+        the content types in `PRECOMPRESSED_CONTENT_TYPES`.
+
+        When `deterministic` is True, the same parts always produce the same bytes: parts
+        are written in partname order rather than in the order the relationship graph is
+        walked, XML is written in Canonical XML form and members get a fixed timestamp.
+        """
+        phys_writer = PhysPkgWriter(pkg_file, compress_level, deterministic=deterministic)
+        if deterministic:
+            parts = sorted(parts, key=lambda part: part.partname)
+        PackageWriter.write_to(
+            phys_writer, pkg_rels, parts, compress_workers, stored_content_types, deterministic
+        )
+        phys_writer.close()
+
+    @staticmethod
+    def update(
+        pkg_file,
+        pkg_rels,
+        parts,
+        compress_level: int | None = None,
+        stored_content_types: Collection[str] = (),
+    ):
+        """Update the existing zip package `pkg_file` to contain `pkg_rels` and `parts`.
+
+        `pkg_file` must be the package `parts` were lazily loaded from. Only members
+        that changed are written, appended to the archive after the members already in
+        it, followed by a new central directory; the content of a part unchanged from
+        its member is not even read. A part that was loaded, like an XML part that was
+        parsed, is compared with its member and only written when it differs. Members
+        of parts no longer in the package are removed from the directory. Their
+        content, like that of a replaced member, is left in the archive unreferenced
+        rather than the archive being compacted.
+
+        An exception raised partway through the update discards it, truncating the file
+        back to its size before the update. The update is not crash-safe though. The old
+        central directory is not overwritten, but an update interrupted by a crash leaves
+        a file zip readers may not open until it is truncated back to its size before the
+        update.
+
+        `compress_level` and `stored_content_types` apply to the members written, as
+        described for :meth:`write`.
+        """
+        phys_writer = PhysPkgWriter(pkg_file, compress_level, append=True)
+        try:
+            PackageWriter._update_members(phys_writer, pkg_rels, parts, stored_content_types)
+        except BaseException:
+            phys_writer.discard()
+            raise
+        phys_writer.close()
+
+    @staticmethod
+    def write_to(
+        phys_writer: PhysPkgWriter,
+        pkg_rels,
+        parts,
+        compress_workers: int | None = None,
+        stored_content_types: Collection[str] = (),
+        canonical: bool = False,
+    ):
+        """Write `pkg_rels`, `parts` and a content types stream to `phys_writer`.
+
+        Like :meth:`write` but to an already open physical package, which is left open.
+        The content of a part already written to `phys_writer`, like one streamed into
+        the package while it was produced, is not written again; its rels item still is.
+        When `canonical` is True, XML parts are written in Canonical XML form.
+        """
         PackageWriter._write_content_types_stream(phys_writer, parts)
         PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
-        PackageWriter._write_parts(phys_writer, parts)
-        phys_writer.close()
+        PackageWriter._write_parts(
+            phys_writer, parts, compress_workers, stored_content_types, canonical
+        )
+
+    @staticmethod
+    def _update_member(
+        phys_writer: PhysPkgWriter,
+        pack_uri: PackURI,
+        blob: bytes,
+        compress_type: int = ZIP_DEFLATED,
+    ):
+        """Write `blob` to member `pack_uri` of a package being updated, unless it is
+        already the content of that member."""
+        if pack_uri in phys_writer:
+            if phys_writer.blob_for(pack_uri) == blob:
+                return
+            phys_writer.remove(pack_uri)
+        phys_writer.write(pack_uri, blob, compress_type)
+
+    @staticmethod
+    def _update_members(
+        phys_writer: PhysPkgWriter,
+        pkg_rels,
+        parts,
+        stored_content_types: Collection[str] = (),
+    ):
+        """Write the members of `pkg_rels` and `parts` that changed to a package being
+        updated, and remove those of parts no longer in the package."""
+        parts = list(parts)
+        pack_uris = {CONTENT_TYPES_URI, PACKAGE_URI.rels_uri}
+        cti = _ContentTypesItem.from_parts(parts)
+        PackageWriter._update_member(phys_writer, CONTENT_TYPES_URI, cti.blob)
+        PackageWriter._update_member(phys_writer, PACKAGE_URI.rels_uri, pkg_rels.xml)
+        for part in parts:
+            pack_uris.add(part.partname)
+            source = part.source
+            if source is None or source.pack_uri != part.partname:
+                compress_type = (
+                    ZIP_STORED if part.content_type in stored_content_types else ZIP_DEFLATED
+                )
+                if source is not None:
+                    phys_writer.remove(part.partname)
+                    phys_writer.copy(part.partname, source, compress_type)
+                elif part.partname in phys_writer:
+                    PackageWriter._update_member(
+                        phys_writer, part.partname, part.blob, compress_type
+                    )
+                else:
+                    with phys_writer.open(
+                        part.partname, compress_type, part.content_type
+                    ) as stream:
+                        part.write_blob(stream)
+            if len(part.rels):
+                pack_uris.add(part.partname.rels_uri)
+                PackageWriter._update_member(phys_writer, part.partname.rels_uri, part.rels.xml)
+        for pack_uri in phys_writer.pack_uris:
+            if pack_uri not in pack_uris:
+                phys_writer.remove(pack_uri)
 
     @staticmethod
     def _write_content_types_stream(phys_writer, parts):
@@ -45,20 +188,102 @@ class PackageWriter:
         phys_writer.write(CONTENT_TYPES_URI, cti.blob)
 
     @staticmethod
-    def _write_parts(phys_writer: PhysPkgWriter, parts: Iterable[Part]):
+    def _write_parts(
+        phys_writer: PhysPkgWriter,
+        parts: Iterable[Part],
+        compress_workers: int | None = None,
+        stored_content_types: Collection[str] = (),
+        canonical: bool = False,
+    ):
         """Write the blob of each part in `parts` to the package, along with a rels item
-        for its relationships if and only if it has any."""
+        for its relationships if and only if it has any.
+
+        A part that is unchanged from the member it was lazily loaded from is copied
+        from the source package as-is rather than serialized and compressed again. Any
+        other part is written into a member stream, so an XML part is compressed as it is
+        serialized rather than first being serialized as a whole.
+        """
+        if compress_workers is not None and compress_workers > 1:
+            PackageWriter._write_parts_concurrently(
+                phys_writer, parts, compress_workers, stored_content_types, canonical
+            )
+            return
         for part in parts:
-            phys_writer.write(part.partname, part.blob)
+            compress_type = (
+                ZIP_STORED if part.content_type in stored_content_types else ZIP_DEFLATED
+            )
+            source = part.source
+            if part.partname in phys_writer:
+                pass
+            elif source is None:
+                with phys_writer.open(part.partname, compress_type, part.content_type) as stream:
+                    part.write_blob(stream, canonical)
+            else:
+                phys_writer.copy(part.partname, source, compress_type)
             if len(part.rels):
                 phys_writer.write(part.partname.rels_uri, part.rels.xml)
 
+    @staticmethod
+    def _write_parts_concurrently(
+        phys_writer: PhysPkgWriter,
+        parts: Iterable[Part],
+        compress_workers: int,
+        stored_content_types: Collection[str],
+        canonical: bool = False,
+    ):
+        """Write `parts` like :meth:`_write_parts`, compressing in `compress_workers` threads.
+
+        Part blobs are produced whole on this thread, then compressed by the worker threads and
+        written to the package in the same order :meth:`_write_parts` writes them. The
+        number of members in flight is bounded so memory use stays proportional to the
+        number of workers rather than to the size of the package.
+        """
+        max_pending = compress_workers * 2
+        with ThreadPoolExecutor(max_workers=compress_workers) as executor:
+            pending: Deque[Future[Tuple[ZipInfo, bytes]]] = deque()
+
+            def submit(fn: Callable[..., Tuple[ZipInfo, bytes]], *args: Any):
+                if len(pending) >= max_pending:
+                    phys_writer.write_compressed(*pending.popleft().result())
+                pending.append(executor.submit(fn, *args))
+
+            for part in parts:
+                compress_type = (
+                    ZIP_STORED if part.content_type in stored_content_types else ZIP_DEFLATED
+                )
+                source = part.source
+                if part.partname in phys_writer:
+                    pass
+                elif source is None:
+                    submit(
+                        phys_writer.compress,
+                        part.partname,
+                        _blob_of(part, canonical),
+                        compress_type,
+                    )
+                else:
+                    submit(phys_writer.prepare_copy, part.partname, source, compress_type)
+                if len(part.rels):
+                    submit(phys_writer.compress, part.partname.rels_uri, part.rels.xml)
+
+            while pending:
+                phys_writer.write_compressed(*pending.popleft().result())
+
     @staticmethod
     def _write_pkg_rels(phys_writer, pkg_rels):
         """Write the XML rels item for `pkg_rels` ('/_rels/.rels') to the package."""
         phys_writer.write(PACKAGE_URI.rels_uri, pkg_rels.xml)
 
 
+def _blob_of(part: Part, canonical: bool) -> bytes:
+    """The blob of `part`, in canonical form when `canonical` is True."""
+    if not canonical:
+        return part.blob
+    stream = io.BytesIO()
+    part.write_blob(stream, canonical)
+    return stream.getvalue()
+
+
 class _ContentTypesItem:
     """Service class that composes a content types item ([Content_Types].xml) based on a
     list of parts.
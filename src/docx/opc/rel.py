@@ -2,21 +2,88 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, cast
+import copy
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, cast
 
 from docx.opc.oxml import CT_Relationships
 
 if TYPE_CHECKING:
+    from docx.opc.package import OpcPackage
     from docx.opc.part import Part
 
 
 class Relationships(Dict[str, "_Relationship"]):
-    """Collection object for |_Relationship| instances, having list semantics."""
+    """Collection object for |_Relationship| instances, having list semantics.
 
-    def __init__(self, baseURI: str):
+    Relationships are also indexed by type and by type and target, so finding one is a
+    dict lookup rather than a scan of the collection, and the next available rId is
+    tracked as relationships are added and removed. The indexes are kept up to date by
+    every way of changing the collection: item assignment, `del`, :meth:`pop`,
+    :meth:`popitem`, :meth:`setdefault`, :meth:`update` and :meth:`clear`.
+
+    Each change is reported to `package`, the package the relationships belong to, so it
+    can tell when its cached view of the part graph is stale.
+    """
+
+    def __init__(self, baseURI: str, package: OpcPackage | None = None):
         super(Relationships, self).__init__()
         self._baseURI = baseURI
+        self._package = package
         self._target_parts_by_rId: dict[str, Any] = {}
+        self._rels_by_key: dict[Tuple[str, bool, Any], List[_Relationship]] = {}
+        self._rels_by_reltype: dict[str, List[_Relationship]] = {}
+        # -- every rId of the form "rId{n}" for n below this is in use --
+        self._rId_floor = 1
+
+    def __setitem__(self, rId: str, rel: _Relationship):
+        replaced = self.get(rId)
+        if replaced is not None:
+            self._unindex(rId, replaced)
+        super(Relationships, self).__setitem__(rId, rel)
+        self._index(rel)
+        self._mark_graph_changed()
+
+    def __delitem__(self, rId: str):
+        rel = self[rId]
+        super(Relationships, self).__delitem__(rId)
+        self._unindex(rId, rel)
+        self._mark_graph_changed()
+
+    def clear(self):
+        super(Relationships, self).clear()
+        self._target_parts_by_rId.clear()
+        self._rels_by_key.clear()
+        self._rels_by_reltype.clear()
+        self._rId_floor = 1
+        self._mark_graph_changed()
+
+    def pop(self, rId: str, *args: Any) -> _Relationship:
+        if rId in self:
+            rel = self[rId]
+            del self[rId]
+            return rel
+        rel = super(Relationships, self).pop(rId, *args)
+        self._mark_graph_changed()
+        return rel
+
+    def popitem(self) -> Tuple[str, _Relationship]:
+        rId, rel = super(Relationships, self).popitem()
+        self._unindex(rId, rel)
+        self._mark_graph_changed()
+        return rId, rel
+
+    def setdefault(self, rId: str, rel: _Relationship) -> _Relationship:  # pyright: ignore
+        if rId not in self:
+            self[rId] = rel
+        return self[rId]
+
+    def update(self, *args: Any, **kwargs: _Relationship):  # pyright: ignore
+        for rId, rel in dict(*args, **kwargs).items():
+            self[rId] = rel
+
+    def __ior__(self, other: Any) -> Relationships:  # pyright: ignore
+        self.update(other)
+        return self
 
     def add_relationship(
         self, reltype: str, target: Part | str, rId: str, is_external: bool = False
@@ -28,6 +95,19 @@ class Relationships(Dict[str, "_Relationship"]):
             self._target_parts_by_rId[rId] = target
         return rel
 
+    def snapshot(self) -> Relationships:
+        """Return a copy of this collection with each relationship resolved as it is now.
+
+        The target reference of each relationship is worked out on the calling thread, so
+        the copy refers to no part and can be serialized on another thread while the
+        parts are changed or renamed. The copy belongs to no package and is only for
+        serializing; relationships are not looked up in it, so it is not indexed.
+        """
+        rels = Relationships(self._baseURI)
+        for rId, rel in self.items():
+            rels._add_unindexed(rId, rel.resolved())
+        return rels
+
     def get_or_add(self, reltype: str, target_part: Part) -> _Relationship:
         """Return relationship of `reltype` to `target_part`, newly added if not already
         present in collection."""
@@ -67,26 +147,27 @@ class Relationships(Dict[str, "_Relationship"]):
             rels_elm.add_rel(rel.rId, rel.reltype, rel.target_ref, rel.is_external)
         return rels_elm.xml
 
+    def _mark_graph_changed(self):
+        """Report a change to these relationships to the package they belong to."""
+        if self._package is not None:
+            self._package.mark_graph_changed()
+
+    def _add_unindexed(self, rId: str, rel: _Relationship):
+        """Add `rel` keyed by `rId` without indexing it, for a collection that is only
+        serialized, like a snapshot, whose resolved relationships have no target part to
+        index them by."""
+        super(Relationships, self).__setitem__(rId, rel)
+
     def _get_matching(
         self, reltype: str, target: Part | str, is_external: bool = False
     ) -> _Relationship | None:
         """Return relationship of matching `reltype`, `target`, and `is_external` from
-        collection, or None if not found."""
-
-        def matches(rel: _Relationship, reltype: str, target: Part | str, is_external: bool):
-            if rel.reltype != reltype:
-                return False
-            if rel.is_external != is_external:
-                return False
-            rel_target = rel.target_ref if rel.is_external else rel.target_part
-            if rel_target != target:
-                return False
-            return True
+        collection, or None if not found.
 
-        for rel in self.values():
-            if matches(rel, reltype, target, is_external):
-                return rel
-        return None
+        When more than one relationship matches, the one added first is returned.
+        """
+        matching = self._rels_by_key.get((reltype, is_external, target))
+        return matching[0] if matching else None
 
     def _get_rel_of_type(self, reltype: str):
         """Return single relationship of type `reltype` from the collection.
@@ -94,7 +175,7 @@ class Relationships(Dict[str, "_Relationship"]):
         Raises |KeyError| if no matching relationship is found. Raises |ValueError| if
         more than one matching relationship is found.
         """
-        matching = [rel for rel in self.values() if rel.reltype == reltype]
+        matching = self._rels_by_reltype.get(reltype, [])
         if len(matching) == 0:
             tmpl = "no relationship of type '%s' in collection"
             raise KeyError(tmpl % reltype)
@@ -103,14 +184,43 @@ class Relationships(Dict[str, "_Relationship"]):
             raise ValueError(tmpl % reltype)
         return matching[0]
 
+    def _index(self, rel: _Relationship):
+        """Add `rel` to the indexes of this collection."""
+        target = rel.target_ref if rel.is_external else rel.target_part
+        key = (rel.reltype, rel.is_external, target)
+        self._rels_by_key.setdefault(key, []).append(rel)
+        self._rels_by_reltype.setdefault(rel.reltype, []).append(rel)
+
     @property
-    def _next_rId(self) -> str:  # pyright: ignore[reportReturnType]
+    def _next_rId(self) -> str:
         """Next available rId in collection, starting from 'rId1' and making use of any
-        gaps in numbering, e.g. 'rId2' for rIds ['rId1', 'rId3']."""
-        for n in range(1, len(self) + 2):
-            rId_candidate = "rId%d" % n  # like 'rId19'
-            if rId_candidate not in self:
-                return rId_candidate
+        gaps in numbering, e.g. 'rId2' for rIds ['rId1', 'rId3'].
+
+        The search starts from the lowest rId that can be free rather than from 'rId1',
+        so allocating an rId for each of many relationships added in turn takes constant
+        time rather than time proportional to the number already added.
+        """
+        n = self._rId_floor
+        while "rId%d" % n in self:
+            n += 1
+        self._rId_floor = n
+        return "rId%d" % n
+
+    def _unindex(self, rId: str, rel: _Relationship):
+        """Remove `rel`, keyed by `rId`, from the indexes of this collection."""
+        target = rel.target_ref if rel.is_external else rel.target_part
+        key = (rel.reltype, rel.is_external, target)
+        for index, index_key in ((self._rels_by_key, key), (self._rels_by_reltype, rel.reltype)):
+            rels = index.get(index_key)
+            if rels is None:
+                continue
+            rels.remove(rel)
+            if not rels:
+                del index[index_key]
+        self._target_parts_by_rId.pop(rId, None)
+        n = _rId_number(rId)
+        if n is not None and n < self._rId_floor:
+            self._rId_floor = n
 
 
 class _Relationship:
@@ -125,6 +235,8 @@ class _Relationship:
         self._target = target
         self._baseURI = baseURI
         self._is_external = bool(external)
+        # -- the target reference of a resolved relationship, fixed when it was resolved --
+        self._target_ref: str | None = None
 
     @property
     def is_external(self) -> bool:
@@ -138,18 +250,45 @@ class _Relationship:
     def rId(self) -> str:
         return self._rId
 
+    def resolved(self) -> _Relationship:
+        """Return a copy of this relationship with its target reference fixed as it is now.
+
+        The copy does not refer to the target part, so it is unchanged when that part is
+        renamed and can be serialized on another thread while the part is changed.
+        """
+        rel = copy.copy(self)
+        rel._target_ref = self.target_ref
+        if not self._is_external:
+            rel._target = None  # pyright: ignore[reportAttributeAccessIssue]
+        return rel
+
     @property
     def target_part(self) -> Part:
         if self._is_external:
             raise ValueError(
                 "target_part property on _Relationship is undef" "ined when target mode is External"
             )
+        if self._target is None:
+            raise ValueError("a resolved relationship does not refer to its target part")
         return cast("Part", self._target)
 
     @property
     def target_ref(self) -> str:
+        if self._target_ref is not None:
+            return self._target_ref
         if self._is_external:
             return cast(str, self._target)
         else:
             target = cast("Part", self._target)
             return target.partname.relative_ref(self._baseURI)
+
+
+def _rId_number(rId: str) -> int | None:
+    """The number `n` of an rId of the form "rId{n}", like 42 for "rId42".
+
+    |None| for an rId not of that form, which is never one allocated by `_next_rId`.
+    """
+    digits = rId[3:] if isinstance(rId, str) and rId.startswith("rId") else ""
+    if not digits.isdigit() or digits.startswith("0"):
+        return None
+    return int(digits)
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, TypeVar
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Tuple, TypeVar
 
 _T = TypeVar("_T")
+_TargetT = TypeVar("_TargetT", bound=Hashable)
 
 
 class CaseInsensitiveDict(Dict[str, Any]):
@@ -29,3 +30,38 @@ class CaseInsensitiveDict(Dict[str, Any]):
 def cls_method_fn(cls: type, method_name: str):
     """Return method of `cls` having `method_name`."""
     return getattr(cls, method_name)
+
+
+def walk_rels_graph(
+    rels: Iterable[Any],
+    target_of: Callable[[Any], _TargetT],
+    rels_of: Callable[[_TargetT], Iterable[Any]],
+) -> Iterator[Tuple[Any, _TargetT | None, Iterable[Any] | None]]:
+    """Generate a `(rel, target, target_rels)` 3-tuple for each relationship reachable
+    from `rels`, in depth-first order.
+
+    `target_of` returns the target of an internal relationship and `rels_of` the
+    relationships of a target. `target` and `target_rels` are both None when `rel` is
+    external or its target has already been visited, so each target is descended into
+    exactly once. The walk is iterative and tracks visited targets in a set, so it
+    neither hits the recursion limit on deep relationship chains nor slows down
+    quadratically with the number of parts.
+    """
+    visited: set[_TargetT] = set()
+    stack = [iter(rels)]
+    while stack:
+        for rel in stack[-1]:
+            if rel.is_external:
+                yield rel, None, None
+                continue
+            target = target_of(rel)
+            if target in visited:
+                yield rel, None, None
+                continue
+            visited.add(target)
+            target_rels = rels_of(target)
+            yield rel, target, target_rels
+            stack.append(iter(target_rels))
+            break
+        else:
+            stack.pop()
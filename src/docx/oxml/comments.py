@@ -64,11 +64,12 @@ class CT_Comments(BaseOxmlElement):
 
     comment = ZeroOrMore("w:comment", successors=("w:comments",))
 
-    def add_comment(self, author: str, initials: str, date: str) -> CT_Com:
-        _next_id = self._next_commentId
+    def add_comment(
+        self, author: str, initials: str, date: str, _id: Optional[int] = None
+    ) -> CT_Com:
+        _next_id = self._next_commentId if _id is None else _id
         comment: CT_Com = CT_Com.new(initials, _next_id, date, author)
         self.append(comment)
-        print(self.xml)
         return comment
 
     @property
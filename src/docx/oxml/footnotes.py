@@ -28,8 +28,8 @@ class CT_Footnotes(BaseOxmlElement):
 
         return int(ids[-1]) + 1
 
-    def add_footnote(self) -> "CT_Footnote":
-        _next_id = self._next_id
+    def add_footnote(self, _id: Optional[int] = None) -> "CT_Footnote":
+        _next_id = self._next_id if _id is None else _id
         footnote = CT_Footnote.new(_next_id)
         footnote = self._insert_footnote(footnote)
         return footnote
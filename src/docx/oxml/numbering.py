@@ -90,10 +90,13 @@ class CT_Numbering(BaseOxmlElement):
     abstractNum = ZeroOrMore("w:abstractNum", successors=("w:num",))
     num = ZeroOrMore("w:num", successors=("w:numIdMacAtCleanup",))
 
-    def add_num(self, abstractNum_id):
+    def add_num(self, abstractNum_id, num_id=None):
         """Return a newly added CT_Num (<w:num>) element referencing the abstract
-        numbering definition identified by `abstractNum_id`."""
-        next_num_id = self._next_numId
+        numbering definition identified by `abstractNum_id`.
+
+        The new element has `num_id` as its ``numId``, or the first one unused when
+        `num_id` is omitted, which takes a scan of the ``<w:num>`` elements."""
+        next_num_id = self._next_numId if num_id is None else num_id
         num = CT_Num.new(next_num_id, abstractNum_id)
         return self._insert_num(num)
 
@@ -111,7 +114,7 @@ class CT_Numbering(BaseOxmlElement):
         """The first ``numId`` unused by a ``<w:num>`` element, starting at 1 and
         filling any gaps in numbering between existing ``<w:num>`` elements."""
         numId_strs = self.xpath("./w:num/@w:numId")
-        num_ids = [int(numId_str) for numId_str in numId_strs]
+        num_ids = {int(numId_str) for numId_str in numId_strs}
         for num in range(1, len(num_ids) + 2):
             if num not in num_ids:
                 break
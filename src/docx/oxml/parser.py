@@ -4,13 +4,16 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Type, cast
+import io
+import threading
+from typing import IO, TYPE_CHECKING, Dict, Iterator, Type, cast
 
 from lxml import etree
 
 from docx.oxml.ns import NamespacePrefixedTag, nsmap
 
 if TYPE_CHECKING:
+    from docx.opc.limits import ResourceLimits
     from docx.oxml.xmlchemy import BaseOxmlElement
 
 
@@ -19,14 +22,138 @@ element_class_lookup = etree.ElementNamespaceClassLookup()
 oxml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
 oxml_parser.set_element_class_lookup(element_class_lookup)
 
+# -- an lxml parser must not be used by more than one thread at a time, so each thread
+# -- parses with its own parsers, all sharing the same element-class lookup
+_thread_local = threading.local()
+_thread_local.parsers = {(False, False): oxml_parser}
 
-def parse_xml(xml: str | bytes) -> "BaseOxmlElement":
+# -- bytes of XML fed to the parser at a time when parsing within resource limits --
+_PARSE_CHUNK_SIZE = 64 * 1024
+
+
+def parse_xml(
+    xml: str | bytes, read_only: bool = False, limits: ResourceLimits | None = None
+) -> "BaseOxmlElement":
     """Root lxml element obtained by parsing XML character string `xml`.
 
     The custom parser is used, so custom element classes are produced for elements in
-    `xml` that have them.
+    `xml` that have them. Safe to call from multiple threads concurrently.
+
+    When `read_only` is True, a parser for XML that is only read is used. It does not
+    index `xml:id` attributes, which saves the work and memory of an index nothing uses.
+    Entities are never resolved in either case.
+
+    When `limits` constrain XML depth or element count, they are checked as `xml` is
+    parsed, raising |PackageLimitError| as soon as one is exceeded. libxml2's own limits
+    on depth and text-node size always apply unless `limits` lift them with `huge_xml`.
+    """
+    if limits is not None and limits.checks_xml:
+        return _parse_within_limits(io.BytesIO(_bytes(xml)), read_only, limits)
+    parser = _thread_parser(read_only, limits is not None and limits.huge_xml)
+    return cast("BaseOxmlElement", etree.fromstring(xml, parser))
+
+
+def parse_xml_stream(
+    stream: IO[bytes], read_only: bool = False, limits: ResourceLimits | None = None
+) -> "BaseOxmlElement":
+    """Root lxml element obtained by parsing the XML read from binary `stream`.
+
+    Like `parse_xml()`, but `stream` is read and parsed a chunk at a time, so the XML
+    itself is never held in memory as a whole, only the tree parsed from it.
+    """
+    if limits is not None and limits.checks_xml:
+        return _parse_within_limits(stream, read_only, limits)
+    tree = etree.parse(stream, _thread_parser(read_only, limits is not None and limits.huge_xml))
+    return cast("BaseOxmlElement", tree.getroot())
+
+
+def iter_child_elements(source: IO[bytes], parent_tag: str) -> Iterator[BaseOxmlElement]:
+    """Generate each child of the first `parent_tag` element in the XML read from `source`.
+
+    `source` is parsed incrementally, with the same element classes as `parse_xml()`
+    produces. Each child is complete when generated, but is cleared and removed from the
+    tree as soon as the next one is requested, so the memory used does not grow with the
+    size of the XML. `parent_tag` is a namespace-prefixed tag like `"w:body"`.
+    """
+    parent_clark_name = NamespacePrefixedTag(parent_tag).clark_name
+    context = etree.iterparse(
+        source, events=("start", "end"), remove_blank_text=True, resolve_entities=False
+    )
+    context.set_element_class_lookup(element_class_lookup)
+    depth, child_depth = 0, None
+    for event, element in context:
+        if event == "start":
+            depth += 1
+            if child_depth is None and element.tag == parent_clark_name:
+                child_depth = depth + 1
+            continue
+        if depth == child_depth:
+            yield cast("BaseOxmlElement", element)
+            element.clear()
+            element.getparent().remove(element)  # pyright: ignore[reportOptionalMemberAccess]
+        elif depth + 1 == child_depth:
+            return
+        depth -= 1
+
+
+def _bytes(xml: str | bytes) -> bytes:
+    """`xml` as bytes, UTF-8 encoded when it is a str."""
+    return xml.encode("utf-8") if isinstance(xml, str) else xml
+
+
+def _parse_within_limits(
+    stream: IO[bytes], read_only: bool, limits: ResourceLimits
+) -> "BaseOxmlElement":
+    """Root element parsed from `stream` as `parse_xml()` does, checked against `limits`.
+
+    The XML is fed to a pull parser a chunk at a time and the elements it starts are
+    counted after each chunk, so parsing stops with |PackageLimitError| after at most a
+    chunk more of XML than the limits allow.
+    """
+    parser = etree.XMLPullParser(
+        events=("start", "end"),
+        remove_blank_text=True,
+        resolve_entities=False,
+        collect_ids=not read_only,
+        huge_tree=limits.huge_xml,
+    )
+    parser.set_element_class_lookup(element_class_lookup)
+    depth = element_count = 0
+    while True:
+        chunk = stream.read(_PARSE_CHUNK_SIZE)
+        if not chunk:
+            break
+        parser.feed(chunk)
+        for event, _ in parser.read_events():
+            if event == "end":
+                depth -= 1
+                continue
+            depth += 1
+            element_count += 1
+            limits.check_xml_element(depth, element_count)
+    return cast("BaseOxmlElement", parser.close())
+
+
+def _thread_parser(read_only: bool = False, huge_tree: bool = False) -> etree.XMLParser:
+    """The oxml parser for the calling thread, created on first use in that thread.
+
+    The read-only parser profile is used when `read_only` is True. libxml2's limits on
+    depth and text-node size are lifted only when `huge_tree` is True.
     """
-    return cast("BaseOxmlElement", etree.fromstring(xml, oxml_parser))
+    parsers = getattr(_thread_local, "parsers", None)
+    if parsers is None:
+        parsers = _thread_local.parsers = {}
+    parser = parsers.get((read_only, huge_tree))
+    if parser is None:
+        parser = etree.XMLParser(
+            remove_blank_text=True,
+            resolve_entities=False,
+            collect_ids=not read_only,
+            huge_tree=huge_tree,
+        )
+        parser.set_element_class_lookup(element_class_lookup)
+        parsers[(read_only, huge_tree)] = parser
+    return parser
 
 
 def register_element_cls(tag: str, cls: Type["BaseOxmlElement"]):
@@ -62,8 +62,9 @@ class CT_P(BaseOxmlElement):
         rangeStart: int,
         rangeEnd: int,
         comment_part_comments: CT_Comments,
+        _id: int | None = None,
     ) -> CT_Com:
-        comment: CT_Com = comment_part_comments.add_comment(author, initials, dtime)
+        comment: CT_Com = comment_part_comments.add_comment(author, initials, dtime, _id)
         comment._add_p(comment_text)
         _r: CT_R = self.add_r()
         _r.add_comment_reference(comment._id)
@@ -71,8 +72,8 @@ class CT_P(BaseOxmlElement):
 
         return comment
 
-    def add_fn(self, text: str, footnotes: CT_Footnotes):
-        footnote = footnotes.add_footnote()
+    def add_fn(self, text: str, footnotes: CT_Footnotes, _id: int | None = None):
+        footnote = footnotes.add_footnote(_id)
         footnote._add_p(text)
         _r = self.add_r()
         _r.add_footnote_reference(footnote._id)
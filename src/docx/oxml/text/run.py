@@ -70,8 +70,9 @@ class CT_R(BaseOxmlElement):
         dtime: str,
         comment_text: str,
         comment_part_comments: CT_Comments,
+        _id: int | None = None,
     ) -> CT_Com:
-        comment: CT_Com = comment_part_comments.add_comment(author, initials, dtime)
+        comment: CT_Com = comment_part_comments.add_comment(author, initials, dtime, _id)
         _p = comment._add_p(comment_text)
         self.add_comment_reference(comment._id)
         self.link_comment(comment._id)
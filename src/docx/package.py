@@ -18,16 +18,20 @@ class Package(OpcPackage):
     def after_unmarshal(self):
         """Called by loading code after all parts and relationships have been loaded.
 
-        This method affords the opportunity for any required post-processing.
+        This method affords the opportunity for any required post-processing. Images
+        are not gathered for a read-only package, no image can be added to it.
         """
+        if self.read_only:
+            return
         self._gather_image_parts()
 
     def get_or_add_image_part(self, image_descriptor: str | IO[bytes]) -> ImagePart:
         """Return |ImagePart| containing image specified by `image_descriptor`.
 
         The image-part is newly created if a matching one is not already present in the
-        collection.
+        collection. Raises |ReadOnlyPackageError| when this package is read-only.
         """
+        self._check_writable()
         return self.image_parts.get_or_add_image_part(image_descriptor)
 
     @lazyproperty
@@ -48,10 +52,20 @@ class Package(OpcPackage):
 
 
 class ImageParts:
-    """Collection of |ImagePart| objects corresponding to images in the package."""
+    """Collection of |ImagePart| objects corresponding to images in the package.
+
+    Image parts are indexed by SHA1 digest and the partname numbers in use are tracked, so
+    adding an image takes constant time apart from hashing the new image. The digest of
+    an image part is only computed when an image is first looked up, once for each part.
+    """
 
     def __init__(self):
         self._image_parts: list[ImagePart] = []
+        self._image_parts_by_sha1: dict[str, ImagePart] = {}
+        self._unindexed_image_parts: list[ImagePart] = []
+        self._used_partname_idxs: set[int] = set()
+        # -- every partname number below this is in use --
+        self._partname_idx_floor = 1
 
     def __contains__(self, item: object):
         return self._image_parts.__contains__(item)
@@ -64,6 +78,10 @@ class ImageParts:
 
     def append(self, item: ImagePart):
         self._image_parts.append(item)
+        self._unindexed_image_parts.append(item)
+        idx = item.partname.idx
+        if idx is not None:
+            self._used_partname_idxs.add(idx)
 
     def get_or_add_image_part(self, image_descriptor: str | IO[bytes]) -> ImagePart:
         """Return |ImagePart| object containing image identified by `image_descriptor`.
@@ -87,10 +105,10 @@ class ImageParts:
     def _get_by_sha1(self, sha1: str) -> ImagePart | None:
         """Return the image part in this collection having a SHA1 hash matching `sha1`,
         or |None| if not found."""
-        for image_part in self._image_parts:
-            if image_part.sha1 == sha1:
-                return image_part
-        return None
+        for image_part in self._unindexed_image_parts:
+            self._image_parts_by_sha1.setdefault(image_part.sha1, image_part)
+        self._unindexed_image_parts.clear()
+        return self._image_parts_by_sha1.get(sha1)
 
     def _next_image_partname(self, ext: str) -> PackURI:
         """The next available image partname, starting from ``/word/media/image1.{ext}``
@@ -100,11 +118,8 @@ class ImageParts:
         not include the leading period.
         """
 
-        def image_partname(n: int) -> PackURI:
-            return PackURI("/word/media/image%d.%s" % (n, ext))
-
-        used_numbers = [image_part.partname.idx for image_part in self]
-        for n in range(1, len(self) + 1):
-            if n not in used_numbers:
-                return image_partname(n)
-        return image_partname(len(self) + 1)
+        n = self._partname_idx_floor
+        while n in self._used_partname_idxs:
+            n += 1
+        self._partname_idx_floor = n
+        return PackURI("/word/media/image%d.%s" % (n, ext))
@@ -1,13 +1,14 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 
 from docx.opc.constants import CONTENT_TYPE as CT
 from docx.oxml import parse_xml
 
 from ..opc.packuri import PackURI
 from ..opc.part import XmlPart
+from ..shared import IdAllocator, lazyproperty
 
 if TYPE_CHECKING:
     from docx.package import Package
@@ -34,3 +35,16 @@ class CommentsPart(XmlPart):
     @property
     def comments(self) -> "CT_Comments":
         return self.element  # type: ignore
+
+    @lazyproperty
+    def id_allocator(self) -> IdAllocator:
+        """|IdAllocator| handing out the ids of new comments.
+
+        The comments are scanned for the ids in use only once, or again when comments
+        are added or removed other than through this allocator.
+        """
+        return IdAllocator(self._used_ids, lambda: len(self.element), first=0)
+
+    def _used_ids(self) -> Iterator[int]:
+        for id_str in self.element.xpath("./w:comment/@w:id"):
+            yield int(id_str)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import IO, TYPE_CHECKING, cast
+from typing import IO, TYPE_CHECKING, Collection, cast
 
 from docx.document import Document
 from docx.enum.style import WD_STYLE_TYPE
@@ -18,6 +18,8 @@ from docx.parts.comments import CommentsPart
 from docx.parts.footnotes import FootnotesPart
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
     from docx.opc.coreprops import CoreProperties
     from docx.settings import Settings
     from docx.styles.style import BaseStyle
@@ -104,10 +106,47 @@ class DocumentPart(StoryPart):
             self.relate_to(numbering_part, RT.NUMBERING)
             return numbering_part
 
-    def save(self, path_or_stream: str | IO[bytes]):
+    def save(
+        self,
+        path_or_stream: str | IO[bytes],
+        compress_level: int | None = None,
+        compress_workers: int | None = None,
+        stored_content_types: Collection[str] = (),
+        incremental: bool = False,
+        deterministic: bool = False,
+    ):
         """Save this document to `path_or_stream`, which can be either a path to a
         filesystem location (a string) or a file-like object."""
-        self.package.save(path_or_stream)
+        self.package.save(
+            path_or_stream,
+            compress_level,
+            compress_workers,
+            stored_content_types,
+            incremental,
+            deterministic,
+        )
+
+    def save_in_background(
+        self,
+        path_or_stream: str | IO[bytes],
+        compress_level: int | None = None,
+        compress_workers: int | None = None,
+        stored_content_types: Collection[str] = (),
+        deterministic: bool = False,
+        executor: Executor | None = None,
+    ) -> Future[None]:
+        """Save this document to `path_or_stream` on another thread.
+
+        Returns a |Future| for the save, which is done once the package is written.
+        """
+        return self.package.save_in_background(
+            path_or_stream,
+            compress_level,
+            compress_workers,
+            stored_content_types,
+            deterministic,
+            executor,
+        )
 
     @property
     def settings(self) -> Settings:
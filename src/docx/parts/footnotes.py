@@ -1,12 +1,13 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 
 from ..opc.constants import CONTENT_TYPE as CT
 from ..opc.packuri import PackURI
 from ..opc.part import XmlPart
 from ..oxml import parse_xml
+from ..shared import IdAllocator, lazyproperty
 
 if TYPE_CHECKING:
     from docx.oxml.footnotes import CT_Footnotes
@@ -35,3 +36,16 @@ class FootnotesPart(XmlPart):
     @property
     def footnotes(self) -> "CT_Footnotes":
         return self.element  # type: ignore
+
+    @lazyproperty
+    def id_allocator(self) -> IdAllocator:
+        """|IdAllocator| handing out the ids of new footnotes.
+
+        The footnotes are scanned for the ids in use only once, or again when footnotes
+        are added or removed other than through this allocator.
+        """
+        return IdAllocator(self._used_ids, lambda: len(self.element))
+
+    def _used_ids(self) -> Iterator[int]:
+        for id_str in self.element.xpath("./w:footnote/@w:id"):
+            yield int(id_str)
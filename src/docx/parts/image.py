@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 
 from docx.image.image import Image
 from docx.opc.part import Part
-from docx.shared import Emu, Inches
+from docx.shared import Emu, Inches, lazyproperty
 
 if TYPE_CHECKING:
     from docx.opc.package import OpcPackage
@@ -59,8 +59,11 @@ class ImagePart(Part):
     @classmethod
     def from_image(cls, image: Image, partname: PackURI):
         """Return an |ImagePart| instance newly created from `image` and assigned
-        `partname`."""
-        return ImagePart(partname, image.content_type, image.blob, image)
+        `partname`.
+
+        An image spooled to a temporary file stays there, it is only read when saved.
+        """
+        return ImagePart(partname, image.content_type, image.part_blob, image)  # pyright: ignore
 
     @property
     def image(self) -> Image:
@@ -74,7 +77,13 @@ class ImagePart(Part):
         package being opened by ``Document(...)`` call."""
         return cls(partname, content_type, blob)
 
-    @property
-    def sha1(self):
-        """SHA1 hash digest of the blob of this image part."""
+    @lazyproperty
+    def sha1(self) -> str:
+        """SHA1 hash digest of the blob of this image part.
+
+        Computed once, on first access, or taken from the image this part was created
+        from, which already knows it.
+        """
+        if self._image is not None:
+            return self._image.sha1
         return hashlib.sha1(self.blob).hexdigest()
@@ -1,7 +1,9 @@
 """|NumberingPart| and closely related objects."""
 
+from typing import Iterator
+
 from ..opc.part import XmlPart
-from ..shared import lazyproperty
+from ..shared import IdAllocator, lazyproperty
 
 
 class NumberingPart(XmlPart):
@@ -14,12 +16,32 @@ class NumberingPart(XmlPart):
         ``<w:numbering>`` element."""
         raise NotImplementedError
 
+    def add_num(self, abstractNum_id: int):
+        """Return a newly added ``<w:num>`` element referencing the abstract numbering
+        definition identified by `abstractNum_id`, having a ``numId`` from
+        :attr:`id_allocator`."""
+        return self._element.add_num(abstractNum_id, self.id_allocator.next_id())
+
+    @lazyproperty
+    def id_allocator(self) -> IdAllocator:
+        """|IdAllocator| handing out the ``numId`` values of new numbering definitions.
+
+        The ``<w:num>`` elements are scanned for the ids in use only once, or again when
+        children are added or removed other than through this allocator. Unlike the
+        ``numId`` chosen by ``CT_Numbering.add_num()``, gaps are not filled.
+        """
+        return IdAllocator(self._used_num_ids, lambda: len(self._element))
+
     @lazyproperty
     def numbering_definitions(self):
         """The |_NumberingDefinitions| instance containing the numbering definitions
         (<w:num> element proxies) for this numbering part."""
         return _NumberingDefinitions(self._element)
 
+    def _used_num_ids(self) -> Iterator[int]:
+        for numId_str in self._element.xpath("./w:num/@w:numId"):
+            yield int(numId_str)
+
 
 class _NumberingDefinitions:
     """Collection of |_NumberingDefinition| instances corresponding to the ``<w:num>``
@@ -19,12 +19,6 @@ if TYPE_CHECKING:
 class SettingsPart(XmlPart):
     """Document-level settings part of a WordprocessingML (WML) package."""
 
-    def __init__(
-        self, partname: PackURI, content_type: str, element: CT_Settings, package: Package
-    ):
-        super().__init__(partname, content_type, element, package)
-        self._settings = element
-
     @classmethod
     def default(cls, package: Package):
         """Return a newly created settings part, containing a default `w:settings`
@@ -40,7 +34,7 @@ class SettingsPart(XmlPart):
 
         Contains the document-level settings for this document.
         """
-        return Settings(self._settings)
+        return Settings(cast("CT_Settings", self.element))
 
     @classmethod
     def _default_settings_xml(cls):
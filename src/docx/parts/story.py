@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-from typing import IO, TYPE_CHECKING, Tuple, cast
+from typing import IO, TYPE_CHECKING, Iterator, Tuple, cast
 
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.part import XmlPart
 from docx.oxml.shape import CT_Inline
-from docx.shared import Length, lazyproperty
+from docx.shared import IdAllocator, Length, lazyproperty
 
 if TYPE_CHECKING:
     from docx.enum.style import WD_STYLE_TYPE
     from docx.image.image import Image
+    from docx.oxml.xmlchemy import BaseOxmlElement
     from docx.parts.document import DocumentPart
     from docx.styles.style import BaseStyle
 
@@ -24,6 +25,29 @@ class StoryPart(XmlPart):
     `.add_paragraph()`, `.add_table()` etc.
     """
 
+    def before_marshal(self):
+        """Give a drawing sharing its id with an earlier one in this story a new id.
+
+        An id handed out in this session can be taken by XML carrying ids of its own
+        added after it, like a picture copied from another document, so each drawing id
+        is checked once on save. Word reports a document having duplicate drawing ids
+        as corrupt.
+        """
+        if "id_allocator" not in self.__dict__:
+            return
+        seen: set[str] = set()
+        duplicates: list[BaseOxmlElement] = []
+        for docPr in self._element.xpath("//wp:docPr"):
+            id_str = docPr.get("id")
+            if id_str in seen:
+                duplicates.append(docPr)
+            seen.add(id_str)
+        if not duplicates:
+            return
+        self.id_allocator.reset()
+        for docPr in duplicates:
+            docPr.set("id", str(self.id_allocator.next_id()))
+
     def get_or_add_image(self, image_descriptor: str | IO[bytes]) -> Tuple[str, Image]:
         """Return (rId, image) pair for image identified by `image_descriptor`.
 
@@ -70,9 +94,19 @@ class StoryPart(XmlPart):
         """
         rId, image = self.get_or_add_image(image_descriptor)
         cx, cy = image.scaled_dimensions(width, height)
-        shape_id, filename = self.next_id, image.filename
+        shape_id, filename = self.id_allocator.next_id(), image.filename
         return CT_Inline.new_pic_inline(shape_id, rId, filename, cx, cy)
 
+    @lazyproperty
+    def id_allocator(self) -> IdAllocator:
+        """|IdAllocator| handing out the id values of new elements of this story.
+
+        The XML is scanned for the ids in use only once, so adding many pictures takes
+        time proportional to their number. The XML is scanned again when the root element
+        of this part is replaced, or after `id_allocator.reset()`.
+        """
+        return IdAllocator(self._used_ids)
+
     @property
     def next_id(self) -> int:
         """Next available positive integer id value in this story XML document.
@@ -80,12 +114,13 @@ class StoryPart(XmlPart):
         The value is determined by incrementing the maximum existing id value. Gaps in
         the existing id sequence are not filled. The id attribute value is unique in the
         document, without regard to the element type it appears on.
+
+        This is the id :attr:`id_allocator` hands out next, so it costs no scan of the
+        XML once ids have been looked for. Ids added to the XML by other means since, like
+        a copied drawing, are not accounted for until `id_allocator.reset()` is called;
+        a drawing id repeated that way is renumbered on save.
         """
-        id_str_lst = self._element.xpath("//@id")
-        used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
-        if not used_ids:
-            return 1
-        return max(used_ids) + 1
+        return self.id_allocator.peek()
 
     @lazyproperty
     def _document_part(self) -> DocumentPart:
@@ -93,3 +128,9 @@ class StoryPart(XmlPart):
         package = self.package
         assert package is not None
         return cast("DocumentPart", package.main_document_part)
+
+    def _used_ids(self) -> Iterator[int]:
+        """Generate each integer id value used in this story XML document."""
+        for id_str in self._element.xpath("//@id"):
+            if id_str.isdigit():
+                yield int(id_str)
@@ -8,6 +8,7 @@ from typing import (
     Any,
     Callable,
     Generic,
+    Iterable,
     Iterator,
     List,
     Tuple,
@@ -318,6 +319,63 @@ class ElementProxy:
         return self._parent.part
 
 
+class IdAllocator:
+    """Hands out unused integer ids for the elements of an XML part.
+
+    `scan` produces the ids in use, which are looked for only once, on first use. After
+    that each id is handed out in constant time, counting up from the highest id in use;
+    gaps in the ids in use are not filled.
+
+    `count`, when given, produces the number of elements carrying an id, and must be cheap
+    to compute. It is expected to grow by one for each id handed out, as the element
+    given the id is added. When it does not, the XML was changed by other means, like
+    adding elements that carry ids of their own, and the ids in use are scanned for again
+    so an id handed out is never one already in use.
+    """
+
+    def __init__(
+        self,
+        scan: Callable[[], Iterable[int]],
+        count: Callable[[], int] | None = None,
+        first: int = 1,
+    ):
+        self._scan = scan
+        self._count = count
+        self._first = first
+        self._next: int | None = None
+        self._expected_count: int | None = None
+
+    def next_id(self) -> int:
+        """Return an id not in use, and not handed out before, marking it used."""
+        next_id = self.peek()
+        self._next = next_id + 1
+        if self._expected_count is not None:
+            self._expected_count += 1
+        return next_id
+
+    def peek(self) -> int:
+        """The id :meth:`next_id` would hand out next, without marking it used."""
+        if self._next is None or (
+            self._count is not None and self._count() != self._expected_count
+        ):
+            self._seed()
+        return cast(int, self._next)
+
+    def reserve(self, id_: int):
+        """Mark `id_` as used, as when an element carrying it is added by other means."""
+        if self._next is not None and id_ >= self._next:
+            self._next = id_ + 1
+
+    def reset(self):
+        """Forget the ids in use, so they are scanned for again on next use."""
+        self._next = None
+
+    def _seed(self):
+        """Find the ids in use and the number of elements carrying one."""
+        self._next = max(max(self._scan(), default=self._first - 1) + 1, self._first)
+        self._expected_count = None if self._count is None else self._count()
+
+
 class Parented:
     """Provides common services for document elements that occur below a part but may
     occasionally require an ancestor object to provide a service, such as add or drop a
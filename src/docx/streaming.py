@@ -0,0 +1,271 @@
+# pyright: reportPrivateUsage=false
+
+"""|StreamingDocument| object, for writing very large documents with bounded memory."""
+
+from __future__ import annotations
+
+from typing import IO, TYPE_CHECKING, cast
+from xml.sax.saxutils import quoteattr
+
+from lxml import etree
+
+from docx.api import _default_docx_path
+from docx.opc.oxml import serialize_part_xml
+from docx.opc.phys_pkg import PhysPkgWriter
+from docx.opc.pkgwriter import PackageWriter
+from docx.oxml.parser import OxmlElement
+from docx.package import Package
+
+if TYPE_CHECKING:
+    from docx.opc.coreprops import CoreProperties
+    from docx.oxml.document import CT_Body, CT_Document
+    from docx.oxml.xmlchemy import BaseOxmlElement
+    from docx.parts.document import DocumentPart
+    from docx.section import Sections
+    from docx.settings import Settings
+    from docx.shared import Length
+    from docx.styles.style import ParagraphStyle, _TableStyle
+    from docx.styles.styles import Styles
+    from docx.table import Table
+    from docx.text.paragraph import Paragraph
+
+# -- characters escaped in an attribute value, beyond those `quoteattr()` always escapes --
+_ATTR_ENTITIES = {"\n": "&#10;", "\r": "&#13;", "\t": "&#9;"}
+
+
+class StreamingDocument:
+    """Write-only document whose body content is written to `pkg_file` as it is added.
+
+    The styles, section properties and any other parts come from `template`, the default
+    template when it is omitted; any content already in the template body comes first.
+
+    Each block item added is written to the ``word/document.xml`` member of `pkg_file`
+    as soon as the next one is added, and then discarded, so memory use is bounded by
+    the size of a block item rather than the size of the document. The object returned
+    by :meth:`add_paragraph` or :meth:`add_table` can be used to fill in that block
+    item only until the next block item is added; later changes to it are lost.
+
+    The package is complete once :meth:`close` is called. Use as a context manager to
+    have that done automatically, or the output discarded when an exception is raised::
+
+        with StreamingDocument("report.docx") as document:
+            for record in records:
+                document.add_paragraph(record.text)
+    """
+
+    def __init__(
+        self,
+        pkg_file: str | IO[bytes],
+        template: str | IO[bytes] | None = None,
+        compress_level: int | None = None,
+    ):
+        template = _default_docx_path() if template is None else template
+        self._package = Package.open(template)
+        self._document_part = cast("DocumentPart", self._package.main_document_part)
+        self._document = self._document_part.document
+        self._phys_writer = PhysPkgWriter(pkg_file, compress_level)
+        self._stream = self._phys_writer.open(
+            self._document_part.partname, content_type=self._document_part.content_type
+        )
+        self._tail = self._start_document_xml()
+        self._closed = False
+        # -- drawing ids are looked for while the whole template body is still there, so a
+        # -- picture added later never takes the id of a drawing in the template --
+        self._document_part.id_allocator.peek()
+        self.flush()
+
+    def __enter__(self) -> StreamingDocument:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: object):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def add_heading(self, text: str = "", level: int = 1) -> Paragraph:
+        """Return a heading paragraph newly added to the end of the document.
+
+        The heading paragraph has `text` and a style determined by `level`, as for
+        :meth:`.Document.add_heading`.
+        """
+        self.flush()
+        return self._document.add_heading(text, level)
+
+    def add_page_break(self) -> Paragraph:
+        """Return newly |Paragraph| object containing only a page break."""
+        self.flush()
+        return self._document.add_page_break()
+
+    def add_paragraph(self, text: str = "", style: str | ParagraphStyle | None = None) -> Paragraph:
+        """Return paragraph newly added to the end of the document.
+
+        The paragraph is populated with `text` and has paragraph style `style`, as for
+        :meth:`.Document.add_paragraph`.
+        """
+        self.flush()
+        return self._document.add_paragraph(text, style)
+
+    def add_picture(
+        self,
+        image_path_or_stream: str | IO[bytes],
+        width: int | Length | None = None,
+        height: int | Length | None = None,
+    ):
+        """Return new picture shape added in its own paragraph at end of the document.
+
+        The image is added as for :meth:`.Document.add_picture`; the image part itself
+        is kept in memory until the document is closed.
+        """
+        self.flush()
+        return self._document.add_picture(image_path_or_stream, width, height)
+
+    def add_table(self, rows: int, cols: int, style: str | _TableStyle | None = None) -> Table:
+        """Add a table having row and column counts of `rows` and `cols` respectively.
+
+        `style` may be a table style object or a table style name, as for
+        :meth:`.Document.add_table`.
+        """
+        self.flush()
+        return self._document.add_table(rows, cols, style)
+
+    def close(self):
+        """Write the rest of the document and the other parts, and close `pkg_file`.
+
+        Does nothing when already closed.
+        """
+        if self._closed:
+            return
+        self.flush()
+        sectPr = self._body.sectPr
+        if sectPr is not None:
+            self._write(sectPr)
+        self._stream.write(self._tail)
+        self._stream.close()
+
+        package = self._package
+        for part in package.parts:
+            part.before_marshal()
+        PackageWriter.write_to(self._phys_writer, package.rels, package.parts)
+        self._phys_writer.close()
+        self._closed = True
+
+    @property
+    def core_properties(self) -> CoreProperties:
+        """A |CoreProperties| object providing Dublin Core properties of document."""
+        return self._document.core_properties
+
+    def discard(self):
+        """Abandon the document, leaving no package that looks complete behind.
+
+        A file `pkg_file` names is removed; a stream is left holding an incomplete
+        package. Called in place of :meth:`close` when the block of a `with` statement
+        raises. Does nothing when already closed.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._stream.close()
+        self._phys_writer.discard()
+
+    def flush(self):
+        """Write the block items added so far and discard them from memory.
+
+        Called automatically whenever a block item is added.
+        """
+        if self._closed:
+            raise ValueError("streaming document is closed")
+        body = self._body
+        for block in body.xpath("./*[not(self::w:sectPr)]"):
+            self._write(block)
+            body.remove(block)
+
+    @property
+    def sections(self) -> Sections:
+        """|Sections| object providing access to the sections of this document.
+
+        Only the last section, along with any added since the last block item was
+        written, remains accessible.
+        """
+        return self._document.sections
+
+    @property
+    def settings(self) -> Settings:
+        """A |Settings| object providing access to the document-level settings."""
+        return self._document.settings
+
+    @property
+    def styles(self) -> Styles:
+        """A |Styles| object providing access to the styles in this document."""
+        return self._document.styles
+
+    @property
+    def _body(self) -> CT_Body:
+        """The `w:body` element of the document, holding only what is not yet written."""
+        return self._document_element.body
+
+    @property
+    def _document_element(self) -> CT_Document:
+        return cast("CT_Document", self._document.element)
+
+    def _start_document_xml(self) -> bytes:
+        """Open the document-part member and write it up to the first body content.
+
+        Returns the closing markup of the document, written when the document is closed.
+        """
+        document_elm = self._document_element
+        body = self._body
+        empty_body = OxmlElement("w:body")
+        document_elm.replace(body, empty_body)
+        head, tail = serialize_part_xml(document_elm).split(b"<w:body/>")
+        document_elm.replace(empty_body, body)
+        self._stream.write(head + b"<w:body>")
+        return b"</w:body>" + tail
+
+    def _write(self, element: BaseOxmlElement):
+        """Write `element`, a child of `w:body`, to the document-part member.
+
+        An element serialized on its own declares every namespace in scope on its start
+        tag, which `w:document` has already declared. The start and end tags are written
+        from the element instead, declaring only namespaces the document does not.
+        """
+        xml = etree.tostring(element, encoding="UTF-8", with_tail=False)
+        end_of_start_tag = xml.index(b">") + 1
+        tag_name = self._qualified_name(element.tag, element.nsmap)
+        attrs = "".join(
+            " %s=%s"
+            % (self._qualified_name(key, element.nsmap, True), quoteattr(value, _ATTR_ENTITIES))
+            for key, value in element.attrib.items()
+        )
+        document_nsmap = self._document_element.nsmap
+        nsdecls = "".join(
+            " %s=%s" % ("xmlns" if prefix is None else "xmlns:" + prefix, quoteattr(uri))
+            for prefix, uri in element.nsmap.items()
+            if document_nsmap.get(prefix) != uri
+        )
+        if xml[end_of_start_tag - 2 : end_of_start_tag] == b"/>":
+            self._stream.write(("<%s%s%s/>" % (tag_name, nsdecls, attrs)).encode("utf-8"))
+            return
+        end_tag = ("</%s>" % tag_name).encode("utf-8")
+        self._stream.write(("<%s%s%s>" % (tag_name, nsdecls, attrs)).encode("utf-8"))
+        self._stream.write(memoryview(xml)[end_of_start_tag : len(xml) - len(end_tag)])
+        self._stream.write(end_tag)
+
+    @staticmethod
+    def _qualified_name(
+        clark_name: str, nsmap: dict[str | None, str], is_attribute: bool = False
+    ) -> str:
+        """Prefixed name for `clark_name`, like "w:p" for "{http://...}p".
+
+        An attribute is never in the default namespace, so when `is_attribute` is True the
+        name has the prefix lxml declares for its namespace besides the default one.
+        """
+        qname = etree.QName(clark_name)
+        if qname.namespace is None:
+            return qname.localname
+        prefix = next(
+            p
+            for p, uri in nsmap.items()
+            if uri == qname.namespace and not (is_attribute and p is None)
+        )
+        return qname.localname if prefix is None else "%s:%s" % (prefix, qname.localname)
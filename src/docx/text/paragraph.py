@@ -67,22 +67,29 @@ class Paragraph(StoryChild):
         rangeEnd: int = 0,
         comment_part_comments: CT_Comments | None = None,
     ) -> Comment:
-        _comment_part_comments: CT_Comments = (
-            comment_part_comments if comment_part_comments else self.part._comments_part.element  # pyright: ignore[reportPrivateUsage]
-        )
+        _id = None
+        if comment_part_comments:
+            _comment_part_comments: CT_Comments = comment_part_comments
+        else:
+            comments_part = self.part._comments_part  # pyright: ignore[reportPrivateUsage]
+            _comment_part_comments = comments_part.element
+            _id = comments_part.id_allocator.next_id()
 
         if dtime is None:
             dtime = str(datetime.now()).replace(" ", "T")
 
         comment: CT_Com = self._p.add_comm(
-            author, initials, dtime, text, rangeStart, rangeEnd, _comment_part_comments
+            author, initials, dtime, text, rangeStart, rangeEnd, _comment_part_comments, _id
         )
 
         return Comment(comment, self.part)
 
     def add_footnote(self, text: str) -> Footnote:
-        footnotes_part_footnotes: CT_Footnotes = self.part._footnotes_part.element  # pyright: ignore[reportPrivateUsage]
-        footnote = self._p.add_fn(text, footnotes_part_footnotes)
+        footnotes_part = self.part._footnotes_part  # pyright: ignore[reportPrivateUsage]
+        footnotes_part_footnotes: CT_Footnotes = footnotes_part.element
+        footnote = self._p.add_fn(
+            text, footnotes_part_footnotes, footnotes_part.id_allocator.next_id()
+        )
         return Footnote(footnote, self.part)
 
     def merge_paragraph(self, otherParagraph: Paragraph):
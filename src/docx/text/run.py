@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from datetime import datetime
 from typing import IO, TYPE_CHECKING, Iterator, List, cast
 
@@ -23,7 +24,6 @@ from docx.text.pagebreak import RenderedPageBreak
 if TYPE_CHECKING:
     import docx.types as t
     from docx.enum.text import WD_UNDERLINE
-    from docx.opc.part import Part
     from docx.oxml.comments import CT_Com, CT_Comments, CT_CRef
     from docx.oxml.footnotes import CT_Footnotes
     from docx.oxml.text.run import CT_R, CT_Text
@@ -120,7 +120,10 @@ class Run(StoryChild):
             dtime = datetime.now()
         date = str(dtime).replace(" ", "T")
 
-        comment: CT_Com = self._r.add_comment(author, initials, date, text, comments_part_comments)
+        _id = comments_part.id_allocator.next_id()
+        comment: CT_Com = self._r.add_comment(
+            author, initials, date, text, comments_part_comments, _id
+        )
 
         return Comment(comment, comments_part)
 
@@ -321,16 +324,20 @@ class Run(StoryChild):
         Add saved OLE Object in the disk to an run and retun the newly created relationship ID
         Note: OLE Objects must be stored in the disc as `.bin` file
         """
+        from docx.opc.part import Part
+        from docx.opc.phys_pkg import FileBlob
+
         reltype: str = (
             "http://schemas.openxmlformats.org/officeDocument/2006/relationships/oleObject"
         )
-        pack_path: str = "/word/embeddings/" + ole_object_path.split("\\")[-1]
+        pack_path: str = "/word/embeddings/" + os.path.basename(ole_object_path)
         partname: PackURI = PackURI(pack_path)
         content_type: str = "application/vnd.openxmlformats-officedocument.oleObject"
 
+        # -- a large object is spooled to a temporary file, not held in memory --
         with open(ole_object_path, "rb") as f:
-            blob = f.read()
-        target_part: Part = Part(partname=partname, content_type=content_type, blob=blob)
+            blob = FileBlob.spool(f)
+        target_part: Part = Part(partname=partname, content_type=content_type, blob=blob)  # pyright: ignore
         rel_id: str = self.part.rels._next_rId  # pyright: ignore[reportPrivateUsage]
         self.part.rels.add_relationship(reltype=reltype, target=target_part, rId=rel_id)
         return rel_id
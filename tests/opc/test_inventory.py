@@ -0,0 +1,70 @@
+"""Unit test suite for the docx.opc.inventory module."""
+
+from __future__ import annotations
+
+import io
+from zipfile import ZipFile
+
+from docx.opc.constants import CONTENT_TYPE as CT
+from docx.opc.inventory import PackageInventory, PartInfo
+from docx.opc.packuri import PackURI
+
+from ..unitutil.file import docx_path, test_file
+
+
+class DescribePackageInventory:
+    """Unit-test suite for `docx.opc.inventory.PackageInventory` objects."""
+
+    def it_can_take_an_inventory_of_a_zip_package(self):
+        inventory = PackageInventory.from_file(docx_path("having-images"))
+
+        core_properties = inventory.core_properties
+        assert core_properties is not None
+        assert core_properties.author == "Steve Canny"
+        parts = {part.partname: part for part in inventory.parts}
+        assert "/[Content_Types].xml" not in parts
+        assert parts["/_rels/.rels"].content_type == CT.OPC_RELATIONSHIPS
+        assert parts["/word/document.xml"].content_type == CT.WML_DOCUMENT_MAIN
+        with ZipFile(docx_path("having-images")) as zipf:
+            zinfo = zipf.getinfo("word/media/image2.png")
+        image = parts["/word/media/image2.png"]
+        assert image.content_type == CT.PNG
+        assert (image.size, image.stored_size) == (zinfo.file_size, zinfo.compress_size)
+
+    def it_can_take_an_inventory_of_an_expanded_package(self):
+        inventory = PackageInventory.from_file(test_file("expanded_docx"))
+
+        parts = {part.partname: part for part in inventory.parts}
+        assert parts["/word/document.xml"].content_type == CT.WML_DOCUMENT_MAIN
+        assert parts["/word/document.xml"].size == parts["/word/document.xml"].stored_size
+
+    def it_has_no_core_properties_when_the_package_has_none(self):
+        pkg_file = io.BytesIO()
+        with ZipFile(pkg_file, "w") as zipf:
+            zipf.writestr(
+                "[Content_Types].xml",
+                '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                '<Default Extension="xml" ContentType="application/xml"/></Types>',
+            )
+            zipf.writestr("word/other.xml", "<foo/>")
+            zipf.writestr("word/unknown.bin", b"\x00")
+
+        inventory = PackageInventory.from_file(pkg_file)
+
+        assert inventory.core_properties is None
+        assert [(p.partname, p.content_type, p.size) for p in inventory.parts] == [
+            ("/word/other.xml", CT.XML, 6),
+            ("/word/unknown.bin", None, 1),
+        ]
+
+
+class DescribePartInfo:
+    """Unit-test suite for `docx.opc.inventory.PartInfo` objects."""
+
+    def it_knows_the_partname_content_type_and_sizes_of_its_part(self):
+        part_info = PartInfo(PackURI("/word/document.xml"), CT.WML_DOCUMENT_MAIN, 42, 24)
+
+        assert part_info.partname == "/word/document.xml"
+        assert part_info.content_type == CT.WML_DOCUMENT_MAIN
+        assert part_info.size == 42
+        assert part_info.stored_size == 24
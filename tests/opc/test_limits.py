@@ -0,0 +1,51 @@
+"""Unit test suite for the docx.opc.limits module."""
+
+from __future__ import annotations
+
+import pytest
+
+from docx.opc.exceptions import PackageLimitError
+from docx.opc.limits import ResourceLimits
+from docx.opc.packuri import PackURI
+
+member_sizes = [
+    (PackURI("/word/document.xml"), 4000, 1000),
+    (PackURI("/word/media/image1.png"), 3000, 3000),
+]
+
+
+class DescribeResourceLimits:
+    def it_is_unlimited_by_default(self):
+        limits = ResourceLimits()
+
+        limits.check_members(member_sizes)
+
+        assert limits.checks_xml is False
+        assert limits.huge_xml is False
+
+    def it_accepts_members_within_its_limits(self):
+        limits = ResourceLimits(
+            max_total_size=7000, max_part_size=4000, max_compression_ratio=4, max_xml_depth=9
+        )
+
+        limits.check_members(member_sizes)
+
+        assert limits.checks_xml is True
+
+    @pytest.mark.parametrize(
+        ("limits", "match"),
+        [
+            (ResourceLimits(max_total_size=6999), "parts exceed the limit of 6999 bytes"),
+            (
+                ResourceLimits(max_part_size=3999),
+                "part '/word/document.xml' is 4000 bytes, over the limit of 3999",
+            ),
+            (
+                ResourceLimits(max_compression_ratio=3.5),
+                "part '/word/document.xml' is compressed 4 to 1, over the limit of 3.5 to 1",
+            ),
+        ],
+    )
+    def it_raises_when_members_exceed_a_limit(self, limits: ResourceLimits, match: str):
+        with pytest.raises(PackageLimitError, match=match):
+            limits.check_members(member_sizes)
@@ -8,6 +8,7 @@ import pytest
 
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.coreprops import CoreProperties
+from docx.opc.exceptions import ReadOnlyPackageError
 from docx.opc.package import OpcPackage, Unmarshaller
 from docx.opc.packuri import PACKAGE_URI, PackURI
 from docx.opc.part import Part
@@ -38,14 +39,28 @@ class DescribeOpcPackage:
         # exercise ---------------------
         pkg = OpcPackage.open(pkg_file)
         # verify -----------------------
-        PackageReader_.from_file.assert_called_once_with(pkg_file)
-        Unmarshaller_.unmarshal.assert_called_once_with(pkg_reader, pkg, PartFactory_)
+        PackageReader_.from_file.assert_called_once_with(
+            pkg_file, False, (), use_mmap=False, limits=None
+        )
+        Unmarshaller_.unmarshal.assert_called_once_with(pkg_reader, pkg, PartFactory_, None)
+        pkg_reader.close.assert_called_once_with()
         assert isinstance(pkg, OpcPackage)
 
+    def it_closes_the_pkg_reader_when_a_lazy_open_fails(
+        self, PackageReader_, PartFactory_, Unmarshaller_
+    ):
+        pkg_reader = PackageReader_.from_file.return_value
+        Unmarshaller_.unmarshal.side_effect = KeyError("no such member")
+
+        with pytest.raises(KeyError, match="no such member"):
+            OpcPackage.open(Mock(name="pkg_file"), lazy=True)
+
+        pkg_reader.close.assert_called_once_with()
+
     def it_initializes_its_rels_collection_on_first_reference(self, Relationships_):
         pkg = OpcPackage()
         rels = pkg.rels
-        Relationships_.assert_called_once_with(PACKAGE_URI.baseURI)
+        Relationships_.assert_called_once_with(PACKAGE_URI.baseURI, pkg)
         assert rels == Relationships_.return_value
 
     def it_can_add_a_relationship_to_a_part(self, rels_prop_: Mock, rels_: Mock, part_: Mock):
@@ -99,6 +114,91 @@ class DescribeOpcPackage:
         assert part2 in pkg.iter_parts()
         assert len(list(pkg.iter_parts())) == 2
 
+    def it_refuses_to_exclude_reltypes_unless_read_only(self):
+        with pytest.raises(ValueError, match="only a read-only package can exclude"):
+            OpcPackage.open("foo.docx", exclude_reltypes={RT.IMAGE})
+
+    def it_can_only_save_incrementally_to_the_file_it_was_opened_from(self):
+        pkg = OpcPackage()
+
+        with pytest.raises(ValueError, match="incremental save requires the file"):
+            pkg.save("foo.docx", incremental=True)
+
+    def it_cannot_save_incrementally_and_deterministically(self):
+        pkg = OpcPackage()
+
+        with pytest.raises(ValueError, match="incremental save cannot be deterministic"):
+            pkg.save("foo.docx", incremental=True, deterministic=True)
+
+    def it_cannot_be_changed_or_saved_when_read_only(self, part_: Mock):
+        pkg = OpcPackage()
+        pkg._read_only = True
+
+        assert pkg.read_only is True
+        with pytest.raises(ReadOnlyPackageError, match="package was opened read-only"):
+            pkg.save("foo.docx")
+        with pytest.raises(ReadOnlyPackageError):
+            pkg.save_in_background("foo.docx")
+        with pytest.raises(ReadOnlyPackageError):
+            pkg.relate_to(part_, RT.IMAGE)
+        with pytest.raises(ReadOnlyPackageError):
+            pkg.next_partname("/word/header%d.xml")
+
+    def it_can_close_the_package_it_reads_lazily(self):
+        pkg = OpcPackage()
+        pkg_reader = Mock(name="pkg_reader")
+        pkg._pkg_file, pkg._pkg_reader = "foo.docx", pkg_reader
+
+        pkg.close()
+        pkg.close()
+
+        pkg_reader.close.assert_called_once_with()
+        assert pkg._pkg_file is None
+
+    def it_can_walk_a_deep_rels_graph_without_recursing(self):
+        pkg = OpcPackage()
+        source = pkg
+        for n in range(1, 2001):
+            part = Part(PackURI("/part%d.xml" % n), "app/vnd.type")
+            source.rels.add_relationship("http://rel/type", part, "rId1")
+            source = part
+
+        assert len(list(pkg.iter_parts())) == 2000
+        assert len(list(pkg.iter_rels())) == 2000
+
+    def it_indexes_its_parts_until_its_rels_graph_changes(self, iter_parts_: Mock):
+        pkg = OpcPackage()
+        part_1 = Part(PackURI("/part1.xml"), "app/vnd.type", package=pkg)
+        part_2 = Part(PackURI("/part2.xml"), "app/vnd.type", package=pkg)
+        iter_parts_.side_effect = lambda pkg: iter([part_1])
+
+        assert pkg.parts == [part_1]
+        assert pkg.parts == [part_1]
+        assert iter_parts_.call_count == 1
+
+        iter_parts_.side_effect = lambda pkg: iter([part_1, part_2])
+        part_1.rels.add_relationship("http://rel/type", part_2, "rId1")
+        assert pkg.parts == [part_1, part_2]
+        assert iter_parts_.call_count == 2
+
+        part_2.partname = PackURI("/part3.xml")
+        assert pkg._indexed_parts == ([part_1, part_2], {"/part1.xml", "/part3.xml"})
+        assert iter_parts_.call_count == 3
+
+        Part(PackURI("/part4.xml"), "app/vnd.type").rels.add_relationship(
+            "http://rel/type", part_1, "rId1"
+        )
+        OpcPackage().rels.add_relationship("http://rel/type", part_1, "rId1")
+        assert pkg.parts == [part_1, part_2]
+        assert iter_parts_.call_count == 3
+
+    def it_keeps_each_part_when_two_share_a_partname(self, iter_parts_: Mock):
+        part_1 = Part(PackURI("/part1.xml"), "app/vnd.type")
+        part_2 = Part(PackURI("/part1.xml"), "app/vnd.type")
+        iter_parts_.side_effect = lambda pkg: iter([part_1, part_2])
+
+        assert OpcPackage().parts == [part_1, part_2]
+
     def it_can_find_the_next_available_vector_partname(
         self, next_partname_fixture, iter_parts_, PackURI_, packuri_
     ):
@@ -127,7 +227,9 @@ class DescribeOpcPackage:
         pkg.save(pkg_file_)
         for part in parts_:
             part.before_marshal.assert_called_once_with()
-        PackageWriter_.write.assert_called_once_with(pkg_file_, pkg.rels, parts_)
+        PackageWriter_.write.assert_called_once_with(
+            pkg_file_, pkg.rels, parts_, None, None, (), False
+        )
 
     def it_provides_access_to_the_core_properties(self, core_props_fixture):
         opc_package, core_properties_ = core_props_fixture
@@ -289,7 +391,7 @@ class DescribeUnmarshaller:
         _unmarshal_parts_.return_value = parts_dict_
         Unmarshaller.unmarshal(pkg_reader_, pkg_, part_factory_)
 
-        _unmarshal_parts_.assert_called_once_with(pkg_reader_, pkg_, part_factory_)
+        _unmarshal_parts_.assert_called_once_with(pkg_reader_, pkg_, part_factory_, None)
         _unmarshal_relationships_.assert_called_once_with(pkg_reader_, pkg_, parts_dict_)
         for part in parts_dict_.values():
             part.after_unmarshal.assert_called_once_with()
@@ -320,6 +422,17 @@ class DescribeUnmarshaller:
         ]
         assert parts == parts_dict_
 
+    def it_can_unmarshal_parts_on_a_thread_pool(self, pkg_reader_, pkg_):
+        sparts = [("/part%d.xml" % n, "app/vnd.type", "reltype", b"blob") for n in range(16)]
+        pkg_reader_.iter_sparts.return_value = iter(sparts)
+
+        def part_factory(partname, content_type, reltype, blob, package):
+            return (partname, package)
+
+        parts = Unmarshaller._unmarshal_parts(pkg_reader_, pkg_, part_factory, 4)
+
+        assert list(parts.items()) == [(s[0], (s[0], pkg_)) for s in sparts]
+
     def it_can_unmarshal_relationships(self):
         # test data --------------------
         reltype = "http://reltype"
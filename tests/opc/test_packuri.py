@@ -79,6 +79,13 @@ class DescribePackURI:
             pack_uri = PackURI(uri_str)
             assert pack_uri.relative_ref(baseURI) == expected_relative_ref
 
+    def it_computes_each_component_only_once(self):
+        pack_uri = PackURI("/ppt/slides/slide1.xml")
+
+        assert pack_uri.rels_uri is pack_uri.rels_uri
+        assert pack_uri.relative_ref("/ppt") is pack_uri.relative_ref("/ppt")
+        assert pack_uri.relative_ref("/ppt/slideLayouts") == "../slides/slide1.xml"
+
     def it_can_calculate_rels_uri(self):
         expected_values = (
             "/_rels/.rels",
@@ -4,11 +4,16 @@
 
 from __future__ import annotations
 
+import copy
+import io
+
 import pytest
 
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.package import OpcPackage
 from docx.opc.packuri import PackURI
 from docx.opc.part import Part, PartFactory, XmlPart
+from docx.opc.phys_pkg import LazyBlob, StreamedBlob
 from docx.opc.rel import Relationships, _Relationship
 from docx.oxml.xmlchemy import BaseOxmlElement
 
@@ -66,12 +71,85 @@ class DescribePart:
         part = Part(PackURI("/part/name"), "content/type", blob)
         assert part.blob is blob
 
+    def it_writes_its_blob_into_a_stream(self):
+        part = Part(PackURI("/part/name"), "content/type", b"abcde")
+        stream = io.BytesIO()
+
+        part.write_blob(stream)
+
+        assert stream.getvalue() == b"abcde"
+
+    def it_can_take_a_snapshot_of_itself(self):
+        part = Part(PackURI("/part/name"), "content/type", b"abcde")
+        part.rels.add_relationship("http://rel/type", "http://some/url", "rId1", True)
+
+        snapshot = part.snapshot()
+        del part.rels["rId1"]
+
+        assert snapshot is not part
+        assert (snapshot.partname, snapshot.content_type) == (part.partname, part.content_type)
+        assert snapshot.blob == b"abcde"
+        assert list(snapshot.rels.keys()) == ["rId1"]
+
+    def it_takes_a_snapshot_of_a_clean_part_without_reading_it(self, lazy_blob_: Mock):
+        part = Part(PackURI("/part/name"), "content/type", lazy_blob_)
+
+        snapshot = part.snapshot()
+
+        assert snapshot.source is lazy_blob_
+        lazy_blob_.read.assert_not_called()
+
+    def it_reads_a_streamed_blob_as_it_is_loaded(self, request: FixtureRequest):
+        streamed_blob_ = instance_mock(request, StreamedBlob)
+        streamed_blob_.read.return_value = b"abcde"
+
+        part = Part(PackURI("/part/name"), "content/type", streamed_blob_)
+
+        streamed_blob_.read.assert_called_once_with()
+        assert part.blob == b"abcde"
+        assert part.is_dirty is True
+
+    def it_reads_a_lazy_blob_on_first_access_only(self, lazy_blob_: Mock):
+        lazy_blob_.read.return_value = b"abcde"
+        part = Part(PackURI("/part/name"), "content/type", lazy_blob_)
+        assert lazy_blob_.read.call_count == 0
+
+        assert part.blob == b"abcde"
+        assert part.blob == b"abcde"
+        lazy_blob_.read.assert_called_once_with()
+
+    def it_stays_clean_after_its_lazy_blob_is_read(self, lazy_blob_: Mock):
+        lazy_blob_.read.return_value = b"abcde"
+        part = Part(PackURI("/part/name"), "content/type", lazy_blob_)
+
+        part.blob
+
+        assert part.is_dirty is False
+        assert part.source is lazy_blob_
+
+    def but_it_is_dirty_once_detached_from_its_source(self, lazy_blob_: Mock):
+        lazy_blob_.read.return_value = b"abcde"
+        part = Part(PackURI("/part/name"), "content/type", lazy_blob_)
+
+        part.detach()
+
+        assert part.is_dirty is True
+        assert part.source is None
+
+    def and_it_is_always_dirty_when_loaded_eagerly(self):
+        part = Part(PackURI("/part/name"), "content/type", b"abcde")
+        assert part.is_dirty is True
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
     def init__(self, request: FixtureRequest):
         return initializer_mock(request, Part)
 
+    @pytest.fixture
+    def lazy_blob_(self, request: FixtureRequest):
+        return instance_mock(request, LazyBlob)
+
     @pytest.fixture
     def package_(self, request: FixtureRequest):
         return instance_mock(request, OpcPackage)
@@ -88,7 +166,7 @@ class DescribePartRelationshipManagementInterface:
 
         rels = part.rels
 
-        Relationships_.assert_called_once_with(partname_.baseURI)
+        Relationships_.assert_called_once_with(partname_.baseURI, None)
         assert rels is rels_
 
     def it_can_load_a_relationship(self, rels_prop_: Mock, rels_: Mock, other_part_: Mock):
@@ -341,16 +419,107 @@ class DescribeXmlPart:
     ):
         part = XmlPart.load(partname_, content_type_, blob_, package_)
 
-        parse_xml_.assert_called_once_with(blob_)
+        parse_xml_.assert_called_once_with(blob_, package_.read_only, None)
         __init_.assert_called_once_with(ANY, partname_, content_type_, element_, package_)
         assert isinstance(part, XmlPart)
 
+    def it_parses_streamed_xml_as_it_is_read(self, request: FixtureRequest, package_, parse_xml_):
+        streamed_blob_ = instance_mock(request, StreamedBlob)
+        streamed_blob_.open.return_value = io.BytesIO(b'<w:p xmlns:w="http://foo"><w:r/></w:p>')
+        package_.read_only = False
+
+        part = XmlPart.load(PackURI("/part/name"), "content/type", streamed_blob_, package_)
+
+        assert streamed_blob_.read.call_count == 0
+        assert parse_xml_.call_count == 0
+        assert part.element.tag == "{http://foo}p"
+        assert part.is_dirty is True
+
+    def it_defers_parsing_a_lazily_loaded_part(self, package_, lazy_blob_):
+        lazy_blob_.read.return_value = b'<w:p xmlns:w="http://foo"><w:r/></w:p>'
+
+        part = XmlPart.load(PackURI("/part/name"), "content/type", lazy_blob_, package_)
+
+        assert lazy_blob_.read.call_count == 0
+        assert part.is_dirty is False
+        assert part.element.tag == "{http://foo}p"
+        assert part.element is part.element
+        lazy_blob_.read.assert_called_once_with()
+        assert part.is_dirty is True
+
+    def it_passes_the_xml_of_an_unparsed_part_through_unchanged(self, package_, lazy_blob_):
+        lazy_blob_.read.return_value = b"<w:p  xmlns:w='http://foo' />"
+        part = XmlPart.load(PackURI("/part/name"), "content/type", lazy_blob_, package_)
+
+        assert part.blob == b"<w:p  xmlns:w='http://foo' />"
+
+    def it_can_detach_from_its_source_package(self, package_, lazy_blob_):
+        lazy_blob_.read.return_value = b'<w:p xmlns:w="http://foo"/>'
+        part = XmlPart.load(PackURI("/part/name"), "content/type", lazy_blob_, package_)
+
+        part.detach()
+
+        lazy_blob_.read.assert_called_once_with()
+        assert part.blob == b'<w:p xmlns:w="http://foo"/>'
+        assert part.element.tag == "{http://foo}p"
+        assert lazy_blob_.read.call_count == 1
+
     def it_can_serialize_to_xml(self, blob_fixture):
         xml_part, element_, serialize_part_xml_ = blob_fixture
         blob = xml_part.blob
         serialize_part_xml_.assert_called_once_with(element_)
         assert blob is serialize_part_xml_.return_value
 
+    def it_can_serialize_its_xml_into_a_stream(self):
+        xml_part = XmlPart(None, None, element("w:p/w:r"), None)
+        stream = io.BytesIO()
+
+        xml_part.write_blob(stream)
+
+        assert stream.getvalue() == xml_part.blob
+
+    def it_can_serialize_its_xml_in_canonical_form(self):
+        xml_part = XmlPart(None, None, element("w:p{w:rsidR=1,a:b=2,w:rsidP=3}/w:r"), None)
+        stream = io.BytesIO()
+
+        xml_part.write_blob(stream, canonical=True)
+
+        assert stream.getvalue() == (
+            b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+            b'<w:p xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+            b' xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+            b' a:b="2" w:rsidP="3" w:rsidR="1"><w:r></w:r></w:p>'
+        )
+
+    def it_can_take_a_snapshot_of_its_xml(self):
+        xml_part = XmlPart(PackURI("/part/name"), "content/type", element("w:p/w:r"), None)
+
+        snapshot = xml_part.snapshot()
+        xml_part.element.remove(xml_part.element[0])
+
+        assert isinstance(snapshot, XmlPart)
+        assert snapshot.element is not xml_part.element
+        assert snapshot.element.xml == element("w:p/w:r").xml
+        assert snapshot.package is None
+
+    def it_takes_a_snapshot_of_unparsed_xml_without_parsing_it(self, package_, lazy_blob_):
+        part = XmlPart.load(PackURI("/part/name"), "content/type", lazy_blob_, package_)
+
+        snapshot = part.snapshot()
+
+        assert snapshot.source is lazy_blob_
+        assert part.source is lazy_blob_
+        lazy_blob_.read.assert_not_called()
+
+    def it_writes_the_xml_of_an_unparsed_part_into_a_stream_as_is(self, package_, lazy_blob_):
+        lazy_blob_.read.return_value = b"<w:p  xmlns:w='http://foo' />"
+        part = XmlPart.load(PackURI("/part/name"), "content/type", lazy_blob_, package_)
+        stream = io.BytesIO()
+
+        part.write_blob(stream)
+
+        assert stream.getvalue() == b"<w:p  xmlns:w='http://foo' />"
+
     def it_knows_its_the_part_for_its_child_objects(self, part_fixture):
         xml_part = part_fixture
         assert xml_part.part is xml_part
@@ -373,6 +542,78 @@ class DescribeXmlPart:
 
         assert ("rId42" not in part.rels) is rel_should_be_dropped
 
+    def it_counts_references_from_any_relationship_attribute(self, package_: Mock):
+        part = XmlPart(
+            PackURI("/partname"),
+            "content_type",
+            element(
+                "w:p/(r:a{r:id=rId42},r:b{r:embed=rId42},r:c{r:id=rId7},v:imagedata{o:relid=rId9})"
+            ),
+            package_,
+        )
+
+        assert part._rel_ref_counts() == {"rId42": 2, "rId7": 1, "rId9": 1}
+
+    def it_counts_references_afresh_each_time_it_drops_a_relationship(self, package_: Mock):
+        part = XmlPart(
+            PackURI("/partname"),
+            "content_type",
+            element("w:body/(w:p/w:hyperlink{r:id=rId1},w:p/w:hyperlink{r:id=rId2})"),
+            package_,
+        )
+        rels = part.rels
+        rels.add_relationship(RT.HYPERLINK, "https://url/1", "rId1", True)
+        rels.add_relationship(RT.HYPERLINK, "https://url/2", "rId2", True)
+        part.drop_rel("rId2")
+        body = part.element
+        p = body[0]
+        body.extend([copy.deepcopy(p), copy.deepcopy(p)])
+        body.remove(p)
+
+        part.drop_rel("rId1")
+
+        assert "rId1" in rels
+
+    def it_can_drop_many_relationships_at_once(self, rels_prop_: Mock, package_: Mock):
+        rels_prop_.return_value = {"rId1": None, "rId2": None, "rId3": None}
+        part = XmlPart(
+            PackURI("/partname"),
+            "content_type",
+            element("w:p/(r:a{r:id=rId1},r:b{r:id=rId2},r:c{r:id=rId2})"),
+            package_,
+        )
+
+        part.drop_rels(["rId1", "rId2", "rId3"])
+
+        assert part.rels == {"rId2": None}
+
+    def it_can_drop_the_relationships_nothing_refers_to(self, package_: Mock):
+        part = XmlPart(
+            PackURI("/partname"), "content_type", element("w:p/r:a{r:embed=rId2}"), package_
+        )
+        rels = part.rels
+        rels.add_relationship(RT.IMAGE, Mock(name="image_part"), "rId1")
+        rels.add_relationship(RT.IMAGE, Mock(name="image_part"), "rId2")
+        rels.add_relationship(RT.HYPERLINK, "https://url", "rId3", is_external=True)
+        rels.add_relationship(RT.STYLES, Mock(name="styles_part"), "rId4")
+
+        dropped = part.drop_unreferenced_rels()
+
+        assert dropped == ["rId1", "rId3"]
+        assert sorted(rels.keys()) == ["rId2", "rId4"]
+
+    def it_keeps_an_image_relationship_only_vml_refers_to(self, package_: Mock):
+        part = XmlPart(
+            PackURI("/partname"),
+            "content_type",
+            element("w:pict/v:shape/v:fill{o:relid=rId1}"),
+            package_,
+        )
+        part.rels.add_relationship(RT.IMAGE, Mock(name="image_part"), "rId1")
+
+        assert part.drop_unreferenced_rels() == []
+        assert list(part.rels.keys()) == ["rId1"]
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -402,9 +643,13 @@ class DescribeXmlPart:
     def __init_(self, request):
         return initializer_mock(request, XmlPart)
 
+    @pytest.fixture
+    def lazy_blob_(self, request):
+        return instance_mock(request, LazyBlob)
+
     @pytest.fixture
     def package_(self, request):
-        return instance_mock(request, OpcPackage)
+        return instance_mock(request, OpcPackage, resource_limits=None)
 
     @pytest.fixture
     def parse_xml_(self, request, element_):
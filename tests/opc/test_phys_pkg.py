@@ -1,28 +1,55 @@
 """Test suite for docx.opc.phys_pkg module."""
 
+from __future__ import annotations
+
 import hashlib
 import io
-from zipfile import ZIP_DEFLATED, ZipFile
+import os
+import zlib
+from zipfile import ZIP_DEFLATED, ZIP_STORED, BadZipFile, ZipFile
 
 import pytest
+from lxml import etree
 
-from docx.opc.exceptions import PackageNotFoundError
+from docx.opc.constants import CONTENT_TYPE as CT
+from docx.opc.exceptions import PackageLimitError, PackageNotFoundError
+from docx.opc.limits import ResourceLimits
 from docx.opc.packuri import PACKAGE_URI, PackURI
 from docx.opc.phys_pkg import (
+    FileBlob,
+    LazyBlob,
     PhysPkgReader,
     PhysPkgWriter,
     _DirPkgReader,
+    _DirPkgWriter,
+    _FlatOpcPkgReader,
+    _FlatOpcPkgWriter,
     _ZipPkgReader,
     _ZipPkgWriter,
 )
 
 from ..unitutil.file import absjoin, test_file_dir
-from ..unitutil.mock import Mock, class_mock, loose_mock
+from ..unitutil.mock import Mock, class_mock, loose_mock, var_mock
 
 test_docx_path = absjoin(test_file_dir, "test.docx")
 dir_pkg_path = absjoin(test_file_dir, "expanded_docx")
 zip_pkg_path = test_docx_path
 
+flat_opc_xml = (
+    b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+    b'<?mso-application progid="Word.Document"?>\n'
+    b'<pkg:package xmlns:pkg="http://schemas.microsoft.com/office/2006/xmlPackage">'
+    b'<pkg:part pkg:name="/_rels/.rels"'
+    b' pkg:contentType="application/vnd.openxmlformats-package.relationships+xml">'
+    b"<pkg:xmlData><Relationships/></pkg:xmlData></pkg:part>"
+    b'<pkg:part pkg:name="/word/document.xml" pkg:contentType="%s">'
+    b'<pkg:xmlData><w:document xmlns:w="http://w"><w:body/></w:document></pkg:xmlData>'
+    b"</pkg:part>"
+    b'<pkg:part pkg:name="/word/media/image1.png" pkg:contentType="image/png"'
+    b' pkg:compression="store"><pkg:binaryData>iVBORw==</pkg:binaryData></pkg:part>'
+    b"</pkg:package>"
+) % CT.WML_DOCUMENT_MAIN.encode()
+
 
 class DescribeDirPkgReader:
     def it_is_used_by_PhysPkgReader_when_pkg_is_a_dir(self):
@@ -52,6 +79,14 @@ class DescribeDirPkgReader:
         rels_xml = dir_reader.rels_xml_for(partname)
         assert rels_xml is None
 
+    def it_can_open_a_stream_on_the_file_for_a_pack_uri(self, dir_reader):
+        pack_uri = PackURI("/word/document.xml")
+        with dir_reader.open_member(pack_uri) as stream:
+            assert stream.read() == dir_reader.blob_for(pack_uri)
+
+    def it_has_no_raw_member_for_a_pack_uri(self, dir_reader):
+        assert dir_reader.raw_member_for(PackURI("/word/document.xml")) is None
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -63,6 +98,227 @@ class DescribeDirPkgReader:
         return _DirPkgReader(dir_pkg_path)
 
 
+class DescribeDirPkgWriter:
+    def it_is_used_by_PhysPkgWriter_when_pkg_is_a_dir(self, tmp_path):
+        assert isinstance(PhysPkgWriter(str(tmp_path)), _DirPkgWriter)
+        assert isinstance(PhysPkgWriter(str(tmp_path / "new") + os.sep), _DirPkgWriter)
+        assert isinstance(PhysPkgWriter(str(tmp_path / "new.docx")), _ZipPkgWriter)
+
+    def it_writes_each_member_to_a_file_in_the_directory(self, tmp_path):
+        path = str(tmp_path / "expanded") + os.sep
+        pkg_writer = PhysPkgWriter(path)
+
+        pkg_writer.write(PackURI("/[Content_Types].xml"), b"<Types/>")
+        with pkg_writer.open(PackURI("/word/document.xml")) as stream:
+            stream.write(b"<w:document/>")
+        pkg_writer.write_compressed(*pkg_writer.compress(PackURI("/word/styles.xml"), b"<w:s/>"))
+        pkg_writer.close()
+
+        assert (tmp_path / "expanded" / "[Content_Types].xml").read_bytes() == b"<Types/>"
+        assert (tmp_path / "expanded" / "word" / "document.xml").read_bytes() == b"<w:document/>"
+        assert pkg_writer.blob_for(PackURI("/word/styles.xml")) == b"<w:s/>"
+        assert PackURI("/word/document.xml") in pkg_writer
+        assert PackURI("/word/other.xml") not in pkg_writer
+
+    def it_can_copy_a_member_from_a_package(self, tmp_path):
+        pack_uri = PackURI("/word/document.xml")
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        pkg_writer = PhysPkgWriter(str(tmp_path))
+
+        pkg_writer.copy(pack_uri, LazyBlob(phys_reader, pack_uri))
+
+        assert pkg_writer.blob_for(pack_uri) == phys_reader.blob_for(pack_uri)
+        phys_reader.close()
+
+    def it_can_remove_a_member(self, tmp_path):
+        pkg_writer = PhysPkgWriter(str(tmp_path))
+        pkg_writer.write(PackURI("/word/document.xml"), b"<w:document/>")
+        pkg_writer.write(PackURI("/word/styles.xml"), b"<w:styles/>")
+
+        pkg_writer.remove(PackURI("/word/styles.xml"))
+        pkg_writer.remove(PackURI("/word/numbering.xml"))
+
+        assert pkg_writer.pack_uris == ["/word/document.xml"]
+        with pytest.raises(KeyError):
+            pkg_writer.blob_for(PackURI("/word/styles.xml"))
+
+
+class DescribeFlatOpcPkgReader:
+    def it_is_used_by_PhysPkgReader_when_pkg_is_a_flat_opc_document(self, tmp_path):
+        path = tmp_path / "flat.xml"
+        path.write_bytes(flat_opc_xml)
+
+        assert isinstance(PhysPkgReader(str(path)), _FlatOpcPkgReader)
+        assert isinstance(PhysPkgReader(io.BytesIO(flat_opc_xml)), _FlatOpcPkgReader)
+        assert isinstance(PhysPkgReader(flat_opc_xml), _FlatOpcPkgReader)
+
+    def it_provides_the_xml_of_an_xml_part(self):
+        phys_reader = _FlatOpcPkgReader(flat_opc_xml)
+
+        blob = phys_reader.blob_for(PackURI("/word/document.xml"))
+
+        assert blob == (
+            b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+            b'<w:document xmlns:w="http://w"><w:body/></w:document>'
+        )
+
+    def it_provides_the_decoded_content_of_a_binary_part(self):
+        phys_reader = _FlatOpcPkgReader(flat_opc_xml)
+
+        assert phys_reader.blob_for(PackURI("/word/media/image1.png")) == b"\x89PNG"
+        assert phys_reader.open_member(PackURI("/word/media/image1.png")).read() == b"\x89PNG"
+        assert phys_reader.raw_member_for(PackURI("/word/media/image1.png")) is None
+
+    def it_composes_the_content_types_xml_from_the_parts(self):
+        phys_reader = _FlatOpcPkgReader(flat_opc_xml)
+
+        content_types_xml = phys_reader.content_types_xml
+
+        assert (
+            b'PartName="/word/document.xml" ContentType="%s"' % CT.WML_DOCUMENT_MAIN.encode()
+            in (content_types_xml)
+        )
+        assert b'PartName="/word/media/image1.png" ContentType="image/png"' in content_types_xml
+
+    def it_can_retrieve_rels_xml_for_source_uri(self):
+        phys_reader = _FlatOpcPkgReader(flat_opc_xml)
+
+        assert phys_reader.rels_xml_for(PACKAGE_URI) == (
+            b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n<Relationships/>"
+        )
+        assert phys_reader.rels_xml_for(PackURI("/word/document.xml")) is None
+
+    @pytest.mark.parametrize(
+        ("limits", "match"),
+        [
+            (ResourceLimits(max_part_size=2), r"part '/_rels/.rels' is \d+ bytes"),
+            (ResourceLimits(max_xml_depth=1), "nested over the limit of 1 deep"),
+            (ResourceLimits(max_xml_elements=1), "over the limit of 1 elements"),
+        ],
+    )
+    def it_checks_the_parts_against_limits_as_it_reads_them(
+        self, limits: ResourceLimits, match: str
+    ):
+        with pytest.raises(PackageLimitError, match=match):
+            _FlatOpcPkgReader(flat_opc_xml, limits=limits)
+
+    def it_reads_the_parts_when_they_are_within_the_limits(self):
+        limits = ResourceLimits(max_part_size=200, max_xml_depth=2, max_xml_elements=2)
+
+        phys_reader = _FlatOpcPkgReader(flat_opc_xml, limits=limits)
+
+        assert phys_reader.blob_for(PackURI("/word/media/image1.png")) == b"\x89PNG"
+
+    def it_keeps_the_parser_limit_on_text_size_only_when_limits_are_set(self):
+        xml = flat_opc_xml.replace(b"iVBORw==", b"AAAA" * 2_600_000)
+
+        with pytest.raises(etree.XMLSyntaxError, match="Text node too long"):
+            _FlatOpcPkgReader(xml, limits=ResourceLimits())
+        for limits in (None, ResourceLimits(huge_xml=True)):
+            phys_reader = _FlatOpcPkgReader(xml, limits=limits)
+            assert len(phys_reader.blob_for(PackURI("/word/media/image1.png"))) == 3 * 2_600_000
+
+
+class DescribeFlatOpcPkgWriter:
+    def it_is_used_by_PhysPkgWriter_for_an_xml_path_or_when_flat(self, tmp_path):
+        pkg_writer = PhysPkgWriter(str(tmp_path / "flat.XML"))
+        pkg_writer.close()
+
+        assert isinstance(pkg_writer, _FlatOpcPkgWriter)
+        assert isinstance(PhysPkgWriter(io.BytesIO(), flat=True), _FlatOpcPkgWriter)
+
+    def it_cannot_update_a_package_in_place(self, tmp_path):
+        with pytest.raises(ValueError, match="cannot be updated in place"):
+            PhysPkgWriter(str(tmp_path / "flat.xml"), append=True)
+
+    def it_writes_each_part_as_an_element_of_the_package_document(self):
+        stream = io.BytesIO()
+        pkg_writer = PhysPkgWriter(stream, flat=True)
+
+        pkg_writer.write(
+            PackURI("/[Content_Types].xml"),
+            b'<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            b'<Default Extension="png" ContentType="image/png"/></Types>',
+        )
+        with pkg_writer.open(PackURI("/word/document.xml"), content_type=CT.XML) as part_stream:
+            part_stream.write(b"<?xml version='1.0'")
+            part_stream.write(b" standalone='yes'?>\n<w:document")
+            part_stream.write(b' xmlns:w="http://w"><w:body/></w:document>')
+        with pkg_writer.open(PackURI("/word/media/image1.png")) as part_stream:
+            part_stream.write(b"\x89P")
+            part_stream.write(b"NG")
+        pkg_writer.close()
+
+        assert PackURI("/word/document.xml") in pkg_writer
+        phys_reader = _FlatOpcPkgReader(stream.getvalue())
+        assert phys_reader.blob_for(PackURI("/word/media/image1.png")) == b"\x89PNG"
+        assert phys_reader.blob_for(PackURI("/word/document.xml")).endswith(
+            b'<w:document xmlns:w="http://w"><w:body/></w:document>'
+        )
+        assert b'pkg:contentType="image/png"' in stream.getvalue()
+
+
+class DescribeFileBlob:
+    def it_keeps_small_content_in_memory(self):
+        assert FileBlob.spool(io.BytesIO(b"foobar")) == b"foobar"
+
+    def it_spools_large_content_to_a_temporary_file(self, request: pytest.FixtureRequest):
+        var_mock(request, "docx.opc.phys_pkg._SPOOL_MAX_SIZE", new=4)
+        var_mock(request, "docx.opc.phys_pkg._COPY_CHUNK_SIZE", new=2)
+
+        file_blob = FileBlob.spool(io.BytesIO(b"foobar"))
+
+        assert isinstance(file_blob, FileBlob)
+        assert file_blob.read() == b"foobar"
+        with file_blob.open() as stream:
+            assert stream.read(3) == b"foo"
+        stream = io.BytesIO()
+        file_blob.write_to(stream)
+        assert stream.getvalue() == b"foobar"
+
+    def it_removes_its_temporary_file_once_no_longer_used(self, request: pytest.FixtureRequest):
+        var_mock(request, "docx.opc.phys_pkg._SPOOL_MAX_SIZE", new=4)
+        file_blob = FileBlob.spool(io.BytesIO(b"foobar"))
+        assert isinstance(file_blob, FileBlob)
+        path = file_blob._path
+        assert os.path.exists(path)
+
+        del file_blob
+
+        assert not os.path.exists(path)
+
+
+class DescribeLazyBlob:
+    def it_reads_the_member_it_refers_to_from_the_phys_reader(self):
+        phys_reader = Mock(name="phys_reader")
+        pack_uri = PackURI("/word/document.xml")
+        lazy_blob = LazyBlob(phys_reader, pack_uri)
+
+        blob = lazy_blob.read()
+
+        phys_reader.blob_for.assert_called_once_with(pack_uri)
+        assert blob is phys_reader.blob_for.return_value
+        assert lazy_blob.pack_uri is pack_uri
+
+    def it_opens_the_member_it_refers_to_on_the_phys_reader(self):
+        phys_reader = Mock(name="phys_reader")
+        pack_uri = PackURI("/word/document.xml")
+
+        stream = LazyBlob(phys_reader, pack_uri).open()
+
+        phys_reader.open_member.assert_called_once_with(pack_uri)
+        assert stream is phys_reader.open_member.return_value
+
+    def it_reads_the_raw_member_from_the_phys_reader(self):
+        phys_reader = Mock(name="phys_reader")
+        pack_uri = PackURI("/word/document.xml")
+
+        raw_member = LazyBlob(phys_reader, pack_uri).read_raw()
+
+        phys_reader.raw_member_for.assert_called_once_with(pack_uri)
+        assert raw_member is phys_reader.raw_member_for.return_value
+
+
 class DescribePhysPkgReader:
     def it_raises_when_pkg_path_is_not_a_package(self):
         with pytest.raises(PackageNotFoundError):
@@ -79,6 +335,11 @@ class DescribeZipPkgReader:
             phys_reader = PhysPkgReader(stream)
         assert isinstance(phys_reader, _ZipPkgReader)
 
+    def it_is_used_by_PhysPkgReader_when_pkg_is_a_buffer(self):
+        with open(zip_pkg_path, "rb") as f:
+            phys_reader = PhysPkgReader(memoryview(f.read()))
+        assert isinstance(phys_reader, _ZipPkgReader)
+
     def it_opens_pkg_file_zip_on_construction(self, ZipFile_, pkg_file_):
         _ZipPkgReader(pkg_file_)
         ZipFile_.assert_called_once_with(pkg_file_, "r")
@@ -98,6 +359,11 @@ class DescribeZipPkgReader:
         sha1 = hashlib.sha1(blob).hexdigest()
         assert sha1 == "b9b4a98bcac7c5a162825b60c3db7df11e02ac5f"
 
+    def it_can_open_a_stream_on_the_member_for_a_pack_uri(self, phys_reader):
+        pack_uri = PackURI("/word/document.xml")
+        with phys_reader.open_member(pack_uri) as stream:
+            assert stream.read() == phys_reader.blob_for(pack_uri)
+
     def it_has_the_content_types_xml(self, phys_reader):
         sha1 = hashlib.sha1(phys_reader.content_types_xml).hexdigest()
         assert sha1 == "cd687f67fd6b5f526eedac77cf1deb21968d7245"
@@ -112,8 +378,53 @@ class DescribeZipPkgReader:
         rels_xml = phys_reader.rels_xml_for(partname)
         assert rels_xml is None
 
+    def it_can_retrieve_the_raw_member_for_a_pack_uri(self, phys_reader):
+        pack_uri = PackURI("/word/document.xml")
+
+        zinfo, data = phys_reader.raw_member_for(pack_uri)
+
+        assert zinfo.filename == "word/document.xml"
+        assert len(data) == zinfo.compress_size
+        assert zlib.decompress(data, -15) == phys_reader.blob_for(pack_uri)
+
+    @pytest.mark.parametrize("use_mmap", [False, True])
+    def it_provides_a_stored_member_as_a_view_on_a_package_read_in_place(
+        self, use_mmap: bool, stored_pkg_path: str
+    ):
+        with open(stored_pkg_path, "rb") as f:
+            pkg_bytes = f.read()
+        pkg_file = stored_pkg_path if use_mmap else pkg_bytes
+        phys_reader = _ZipPkgReader(pkg_file, use_mmap=use_mmap)
+
+        blob = phys_reader.blob_for(PackURI("/word/media/image1.png"))
+        xml = phys_reader.blob_for(PackURI("/word/document.xml"))
+
+        assert isinstance(blob, memoryview)
+        assert blob == b"\x89PNG" + b"\x00" * 60
+        assert isinstance(xml, bytes)
+        assert xml == b"<w:document/>" * 10
+        del blob
+        phys_reader.close()
+
+    def it_raises_on_a_corrupt_stored_member(self, stored_pkg_path: str):
+        with open(stored_pkg_path, "rb") as f:
+            pkg_bytes = bytearray(f.read())
+        pkg_bytes[pkg_bytes.index(b"\x89PNG")] = 0
+        phys_reader = _ZipPkgReader(pkg_bytes)
+
+        with pytest.raises(BadZipFile):
+            phys_reader.blob_for(PackURI("/word/media/image1.png"))
+
     # fixtures ---------------------------------------------
 
+    @pytest.fixture
+    def stored_pkg_path(self, tmp_path) -> str:
+        path = str(tmp_path / "stored.docx")
+        with ZipFile(path, "w") as zipf:
+            zipf.writestr("word/document.xml", b"<w:document/>" * 10, ZIP_DEFLATED)
+            zipf.writestr("word/media/image1.png", b"\x89PNG" + b"\x00" * 60, ZIP_STORED)
+        return path
+
     @pytest.fixture(scope="class")
     def phys_reader(self):
         phys_reader = _ZipPkgReader(zip_pkg_path)
@@ -133,7 +444,9 @@ class DescribeZipPkgWriter:
     def it_opens_pkg_file_zip_on_construction(self, ZipFile_):
         pkg_file = Mock(name="pkg_file")
         _ZipPkgWriter(pkg_file)
-        ZipFile_.assert_called_once_with(pkg_file, "w", compression=ZIP_DEFLATED)
+        ZipFile_.assert_called_once_with(
+            pkg_file, "w", compression=ZIP_DEFLATED, compresslevel=None
+        )
 
     def it_can_be_closed(self, ZipFile_):
         # mockery ----------------------
@@ -160,6 +473,233 @@ class DescribeZipPkgWriter:
         retrieved_blob_sha1 = hashlib.sha1(retrieved_blob).hexdigest()
         assert retrieved_blob_sha1 == written_blob_sha1
 
+    @pytest.mark.parametrize("buffer_size", [1_000_000, 1000])
+    def it_can_stream_a_member_past_the_zip64_limit(
+        self, buffer_size: int, pkg_file, request: pytest.FixtureRequest
+    ):
+        var_mock(request, "zipfile.ZIP64_LIMIT", new=20000)
+        var_mock(request, "docx.opc.phys_pkg._ZIP_STREAM_BUFFER_SIZE", new=buffer_size)
+        pack_uri = PackURI("/word/media/image1.bin")
+        blob = os.urandom(50000)
+
+        pkg_writer = PhysPkgWriter(pkg_file)
+        with pkg_writer.open(pack_uri, ZIP_STORED) as stream:
+            for i in range(0, len(blob), 4096):
+                stream.write(blob[i : i + 4096])
+        pkg_writer.close()
+
+        with ZipFile(pkg_file) as zipf:
+            assert zipf.read(pack_uri.membername) == blob
+
+    def it_can_copy_a_member_verbatim_from_a_zip_package(self, pkg_file):
+        pack_uri = PackURI("/word/document.xml")
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        src_zinfo, data = phys_reader.raw_member_for(pack_uri)
+
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.copy(PackURI("/word/doc.xml"), LazyBlob(phys_reader, pack_uri))
+        pkg_writer.write(PackURI("/part/name.xml"), b"<Foo/>")
+        pkg_writer.close()
+
+        with ZipFile(pkg_file, "r") as zipf:
+            assert zipf.testzip() is None
+            assert zipf.read("word/doc.xml") == phys_reader.blob_for(pack_uri)
+            assert zipf.read("part/name.xml") == b"<Foo/>"
+        assert _ZipPkgReader(pkg_file).raw_member_for(PackURI("/word/doc.xml"))[1] == data
+        phys_reader.close()
+
+    @pytest.mark.parametrize(
+        ("compress_type", "compress_level"),
+        [(ZIP_DEFLATED, None), (ZIP_DEFLATED, 1), (ZIP_DEFLATED, 9), (ZIP_STORED, None)],
+    )
+    def it_can_compress_a_member_to_write_later(
+        self, pkg_file, compress_type: int, compress_level: int | None
+    ):
+        pack_uri = PackURI("/part/name.xml")
+        blob = b"<BlobbityFooBlob/>" * 100
+        pkg_writer = PhysPkgWriter(pkg_file, compress_level)
+
+        zinfo, data = pkg_writer.compress(pack_uri, blob, compress_type)
+        pkg_writer.write_compressed(zinfo, data)
+        pkg_writer.close()
+
+        assert zinfo.compress_type == compress_type
+        assert (data == blob) is (compress_type == ZIP_STORED)
+        with ZipFile(pkg_file, "r") as zipf:
+            assert zipf.testzip() is None
+            assert zipf.read("part/name.xml") == blob
+
+    def it_can_store_a_member_without_compressing_it(self, pkg_file):
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.write(PackURI("/media/image1.png"), b"PNG-bytes", ZIP_STORED)
+        pkg_writer.close()
+
+        with ZipFile(pkg_file, "r") as zipf:
+            assert zipf.getinfo("media/image1.png").compress_type == ZIP_STORED
+            assert zipf.read("media/image1.png") == b"PNG-bytes"
+
+    def it_can_write_a_member_incrementally(self, pkg_file):
+        pack_uri = PackURI("/word/document.xml")
+        pkg_writer = PhysPkgWriter(pkg_file)
+
+        with pkg_writer.open(pack_uri) as stream:
+            stream.write(b"<w:document>")
+            stream.write(b"</w:document>")
+        assert pack_uri in pkg_writer
+        assert PackURI("/part/name.xml") not in pkg_writer
+        pkg_writer.close()
+
+        with ZipFile(pkg_file, "r") as zipf:
+            assert zipf.read("word/document.xml") == b"<w:document></w:document>"
+
+    def it_can_store_a_member_written_incrementally(self, pkg_file):
+        pack_uri = PackURI("/word/media/image1.png")
+        pkg_writer = PhysPkgWriter(pkg_file, compress_level=9)
+
+        with pkg_writer.open(pack_uri, ZIP_STORED) as stream:
+            stream.write(b"\x89PNG" * 10)
+        with pkg_writer.open(PackURI("/word/document.xml")) as stream:
+            stream.write(b"<w:document/>" * 10)
+        pkg_writer.close()
+
+        with ZipFile(pkg_file, "r") as zipf:
+            assert zipf.getinfo("word/media/image1.png").compress_type == ZIP_STORED
+            assert zipf.getinfo("word/document.xml").compress_type == ZIP_DEFLATED
+            assert zipf.read("word/media/image1.png") == b"\x89PNG" * 10
+
+    def it_can_write_to_a_stream_it_cannot_seek(self):
+        class WriteOnlyStream:
+            def __init__(self):
+                self.chunks: list[bytes] = []
+
+            def write(self, b: bytes):
+                self.chunks.append(bytes(b))
+
+        core_props_uri = PackURI("/docProps/core.xml")
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        stream = WriteOnlyStream()
+        pkg_writer = PhysPkgWriter(stream)
+        pkg_writer.write(PackURI("/word/styles.xml"), b"<w:styles/>")
+        with pkg_writer.open(PackURI("/word/document.xml")) as member:
+            member.write(b"<w:document/>")
+        pkg_writer.copy(core_props_uri, LazyBlob(phys_reader, core_props_uri))
+        chunk_count = len(stream.chunks)
+        pkg_writer.close()
+
+        assert chunk_count > 0
+        with ZipFile(io.BytesIO(b"".join(stream.chunks))) as zipf:
+            assert zipf.testzip() is None
+            assert zipf.read("word/styles.xml") == b"<w:styles/>"
+            assert zipf.read("word/document.xml") == b"<w:document/>"
+            assert zipf.read("docProps/core.xml") == phys_reader.blob_for(core_props_uri)
+        phys_reader.close()
+
+    def it_keeps_writing_to_a_stream_that_writes_only_part_of_each_chunk(self):
+        class ShortWriteStream:
+            def __init__(self):
+                self.chunks: list[bytes] = []
+
+            def write(self, b: bytes) -> int:
+                self.chunks.append(bytes(b[:7]))
+                return len(self.chunks[-1])
+
+        stream = ShortWriteStream()
+        pkg_writer = PhysPkgWriter(stream)
+        pkg_writer.write(PackURI("/word/styles.xml"), b"<w:styles/>" * 10)
+        with pkg_writer.open(PackURI("/word/document.xml")) as member:
+            member.write(b"<w:document/>")
+        pkg_writer.close()
+
+        with ZipFile(io.BytesIO(b"".join(stream.chunks))) as zipf:
+            assert zipf.testzip() is None
+            assert zipf.read("word/styles.xml") == b"<w:styles/>" * 10
+            assert zipf.read("word/document.xml") == b"<w:document/>"
+
+    def it_can_update_an_existing_package_in_place(self, pkg_file):
+        with ZipFile(pkg_file, "w") as zipf:
+            zipf.writestr("word/document.xml", b"<w:document/>")
+            zipf.writestr("word/styles.xml", b"<w:styles/>")
+            zipf.writestr("docProps/core.xml", b"<cp:coreProperties/>")
+        original = pkg_file.getvalue()
+        pkg_writer = PhysPkgWriter(pkg_file, append=True)
+
+        assert pkg_writer.blob_for(PackURI("/word/styles.xml")) == b"<w:styles/>"
+        pkg_writer.remove(PackURI("/word/styles.xml"))
+        pkg_writer.remove(PackURI("/docProps/core.xml"))
+        pkg_writer.remove(PackURI("/docProps/app.xml"))
+        pkg_writer.write(PackURI("/docProps/core.xml"), b"<cp:coreProperties>x</cp:coreProperties>")
+        assert pkg_writer.pack_uris == ["/word/document.xml", "/docProps/core.xml"]
+        pkg_writer.close()
+
+        with ZipFile(pkg_file, "r") as zipf:
+            assert zipf.namelist() == ["word/document.xml", "docProps/core.xml"]
+            assert zipf.getinfo("word/document.xml").header_offset == 0
+            assert zipf.read("docProps/core.xml") == b"<cp:coreProperties>x</cp:coreProperties>"
+            assert zipf.getinfo("docProps/core.xml").header_offset == len(original)
+        assert pkg_file.getvalue().startswith(original)
+
+    def it_stores_every_member_without_compression_at_level_0(self, pkg_file):
+        pkg_writer = PhysPkgWriter(pkg_file, compress_level=0)
+
+        pkg_writer.write(PackURI("/word/styles.xml"), b"<w:styles/>")
+        with pkg_writer.open(PackURI("/word/document.xml")) as stream:
+            stream.write(b"<w:document/>")
+        pkg_writer.write_compressed(*pkg_writer.compress(PackURI("/docProps/app.xml"), b"<a/>"))
+        pkg_writer.close()
+
+        with ZipFile(pkg_file, "r") as zipf:
+            assert {zinfo.compress_type for zinfo in zipf.infolist()} == {ZIP_STORED}
+            assert zipf.read("word/document.xml") == b"<w:document/>"
+
+    def it_gives_every_member_a_fixed_timestamp_when_deterministic(self, pkg_file):
+        pkg_writer = PhysPkgWriter(pkg_file, deterministic=True)
+
+        pkg_writer.write(PackURI("/word/styles.xml"), b"<w:styles/>")
+        with pkg_writer.open(PackURI("/word/document.xml")) as stream:
+            stream.write(b"<w:document/>")
+        pkg_writer.write_compressed(*pkg_writer.compress(PackURI("/docProps/app.xml"), b"<a/>"))
+        pkg_writer.close()
+
+        with ZipFile(pkg_file, "r") as zipf:
+            assert {zinfo.date_time for zinfo in zipf.infolist()} == {(1980, 1, 1, 0, 0, 0)}
+            assert {zinfo.create_system for zinfo in zipf.infolist()} == {3}
+
+    def it_writes_the_content_of_a_member_without_a_raw_form(self, pkg_file):
+        pack_uri = PackURI("/word/document.xml")
+        phys_reader = _DirPkgReader(dir_pkg_path)
+
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.copy(pack_uri, LazyBlob(phys_reader, pack_uri))
+        pkg_writer.close()
+
+        with ZipFile(pkg_file, "r") as zipf:
+            assert zipf.read("word/document.xml") == phys_reader.blob_for(pack_uri)
+
+    def it_falls_back_to_public_zipfile_methods_without_its_internals(
+        self, pkg_file, request: pytest.FixtureRequest
+    ):
+        var_mock(request, "docx.opc.phys_pkg._ZipInternals.available", new=False)
+        pack_uri = PackURI("/word/document.xml")
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        blob = b"<BlobbityFooBlob/>" * 100
+
+        pkg_writer = PhysPkgWriter(pkg_file, compress_level=9)
+        pkg_writer.copy(pack_uri, LazyBlob(phys_reader, pack_uri))
+        pkg_writer.write_compressed(*pkg_writer.compress(PackURI("/part/name.xml"), blob))
+        with pkg_writer.open(PackURI("/part/other.xml")) as stream:
+            stream.write(blob)
+        pkg_writer.close()
+
+        assert phys_reader.raw_member_for(pack_uri) is None
+        with ZipFile(pkg_file, "r") as zipf:
+            assert zipf.testzip() is None
+            assert zipf.read("word/document.xml") == phys_reader.blob_for(pack_uri)
+            assert zipf.read("part/name.xml") == zipf.read("part/other.xml") == blob
+            assert zipf.getinfo("part/name.xml").compress_type == ZIP_DEFLATED
+        with pytest.raises(ValueError, match="cannot update a package in place"):
+            PhysPkgWriter(pkg_file, append=True)
+        phys_reader.close()
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -5,7 +5,7 @@ import pytest
 from docx.opc.constants import CONTENT_TYPE as CT
 from docx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from docx.opc.packuri import PackURI
-from docx.opc.phys_pkg import _ZipPkgReader
+from docx.opc.phys_pkg import LazyBlob, StreamedBlob, _ZipPkgReader
 from docx.opc.pkgreader import (
     PackageReader,
     _ContentTypeMap,
@@ -41,16 +41,53 @@ class DescribePackageReader:
 
         pkg_reader = PackageReader.from_file(pkg_file)
 
-        PhysPkgReader_.assert_called_once_with(pkg_file)
+        PhysPkgReader_.assert_called_once_with(pkg_file, use_mmap=False, limits=None)
         from_xml.assert_called_once_with(phys_reader.content_types_xml)
         _srels_for.assert_called_once_with(phys_reader, "/")
         _load_serialized_parts.assert_called_once_with(
-            phys_reader, pkg_srels, content_types
+            phys_reader, pkg_srels, content_types, False, ()
         )
-        phys_reader.close.assert_called_once_with()
-        _init_.assert_called_once_with(ANY, content_types, pkg_srels, sparts)
+        assert phys_reader.close.call_count == 0
+        _init_.assert_called_once_with(ANY, content_types, pkg_srels, sparts, phys_reader)
         assert isinstance(pkg_reader, PackageReader)
 
+    def it_leaves_the_phys_reader_open_when_loading_lazily(
+        self, _init_, PhysPkgReader_, from_xml, _srels_for, _load_serialized_parts
+    ):
+        phys_reader = PhysPkgReader_.return_value
+        content_types = from_xml.return_value
+        pkg_srels = _srels_for.return_value
+        sparts = _load_serialized_parts.return_value
+
+        PackageReader.from_file(Mock(name="pkg_file"), lazy=True)
+
+        _load_serialized_parts.assert_called_once_with(
+            phys_reader, pkg_srels, content_types, True, ()
+        )
+        assert phys_reader.close.call_count == 0
+        _init_.assert_called_once_with(ANY, content_types, pkg_srels, sparts, phys_reader)
+
+    @pytest.mark.parametrize("failing", ["from_xml", "_srels_for", "_load_serialized_parts"])
+    def it_closes_the_phys_reader_when_loading_fails(
+        self, failing, request, PhysPkgReader_, from_xml, _srels_for, _load_serialized_parts
+    ):
+        phys_reader = PhysPkgReader_.return_value
+        request.getfixturevalue(failing).side_effect = KeyError("no such member")
+
+        with pytest.raises(KeyError, match="no such member"):
+            PackageReader.from_file(Mock(name="pkg_file"), lazy=True)
+
+        phys_reader.close.assert_called_once_with()
+
+    def it_closes_its_phys_reader_when_closed(self):
+        phys_reader = Mock(name="phys_reader")
+        pkg_reader = PackageReader(None, [], [], phys_reader)
+
+        pkg_reader.close()
+        pkg_reader.close()
+
+        phys_reader.close.assert_called_once_with()
+
     def it_can_iterate_over_the_serialized_parts(self, iter_sparts_fixture):
         pkg_reader, expected_iter_spart_items = iter_sparts_fixture
         iter_spart_items = list(pkg_reader.iter_sparts())
@@ -169,7 +206,52 @@ class DescribePackageReader:
             (partname_2, part_2_blob, reltype2, part_2_srels),
             (partname_3, part_3_blob, reltype3, part_3_srels),
         ]
-        assert generated_tuples == expected_tuples
+        assert all(isinstance(t[1], StreamedBlob) for t in generated_tuples)
+        assert [
+            (partname, blob.read(), reltype, srels)
+            for partname, blob, reltype, srels in generated_tuples
+        ] == expected_tuples
+
+    def it_walks_a_deep_rels_graph_without_recursing(self, _srels_for):
+        srels = [
+            Mock(is_external=False, reltype="reltype", target_partname="/part%d.xml" % n)
+            for n in range(2000)
+        ]
+        _srels_for.side_effect = [[srel] for srel in srels[1:]] + [[]]
+        phys_reader = Mock(name="phys_reader")
+
+        generated_tuples = list(PackageReader._walk_phys_parts(phys_reader, srels[:1]))
+
+        assert [t[0] for t in generated_tuples] == [s.target_partname for s in srels]
+
+    def it_does_not_follow_excluded_relationship_types(self, _srels_for):
+        srels = [
+            Mock(is_external=False, reltype="reltype1", target_partname="/part1.xml"),
+            Mock(is_external=False, reltype="reltype2", target_partname="/part2.xml"),
+        ]
+        _srels_for.return_value = srels
+        phys_reader = Mock(name="phys_reader")
+
+        generated_tuples = list(
+            PackageReader._walk_phys_parts(phys_reader, srels[:1], False, {"reltype2"})
+        )
+
+        ((partname, _, _, part_srels),) = generated_tuples
+        assert partname == "/part1.xml"
+        assert part_srels == srels[:1]
+
+    def it_yields_lazy_blobs_when_walking_lazily(self, _srels_for):
+        srel = Mock(name="rId1", is_external=False, reltype="reltype", target_partname="/pn.xml")
+        phys_reader = Mock(name="phys_reader")
+        _srels_for.return_value = []
+
+        generated_tuples = list(PackageReader._walk_phys_parts(phys_reader, [srel], lazy=True))
+
+        ((partname, blob, reltype, srels),) = generated_tuples
+        assert phys_reader.blob_for.call_count == 0
+        assert isinstance(blob, LazyBlob)
+        assert blob.pack_uri == "/pn.xml"
+        assert (partname, reltype, srels) == ("/pn.xml", "reltype", [])
 
     def it_can_retrieve_srels_for_a_source_uri(self, _SerializedRelationships_):
         # mockery ----------------------
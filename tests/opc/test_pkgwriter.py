@@ -4,13 +4,15 @@
 
 from __future__ import annotations
 
+from zipfile import ZIP_DEFLATED, ZIP_STORED
+
 import pytest
 
 from docx.opc.constants import CONTENT_TYPE as CT
 from docx.opc.packuri import PackURI
 from docx.opc.part import Part
-from docx.opc.phys_pkg import _ZipPkgWriter
-from docx.opc.pkgwriter import PackageWriter, _ContentTypesItem
+from docx.opc.phys_pkg import LazyBlob, _ZipPkgWriter
+from docx.opc.pkgwriter import PRECOMPRESSED_CONTENT_TYPES, PackageWriter, _ContentTypesItem
 from docx.opc.rel import Relationships
 
 from ..unitutil.mock import (
@@ -38,9 +40,9 @@ class DescribePackageWriter:
         expected_calls = [
             call._write_content_types_stream(phys_writer, parts),
             call._write_pkg_rels(phys_writer, pkg_rels),
-            call._write_parts(phys_writer, parts),
+            call._write_parts(phys_writer, parts, None, (), False),
         ]
-        PhysPkgWriter_.assert_called_once_with(pkg_file)
+        PhysPkgWriter_.assert_called_once_with(pkg_file, None, deterministic=False)
         assert _write_methods.mock_calls == expected_calls
         phys_writer.close.assert_called_once_with()
 
@@ -64,16 +66,95 @@ class DescribePackageWriter:
     ):
         rels_.__len__.return_value = 1
         part_.rels = rels_
+        part_.source = None
+        part_.content_type = CT.XML
         part_2_.rels = []
+        part_2_.source = None
+        part_2_.content_type = CT.PNG
 
-        PackageWriter._write_parts(phys_pkg_writer_, [part_, part_2_])
+        stream = phys_pkg_writer_.open.return_value.__enter__.return_value
 
-        expected_calls = [
-            call(part_.partname, part_.blob),
-            call(part_.partname.rels_uri, part_.rels.xml),
-            call(part_2_.partname, part_2_.blob),
+        PackageWriter._write_parts(phys_pkg_writer_, [part_, part_2_], None, {CT.PNG})
+
+        assert phys_pkg_writer_.open.call_args_list == [
+            call(part_.partname, ZIP_DEFLATED, CT.XML),
+            call(part_2_.partname, ZIP_STORED, CT.PNG),
         ]
-        assert phys_pkg_writer_.write.mock_calls == expected_calls
+        part_.write_blob.assert_called_once_with(stream, False)
+        part_2_.write_blob.assert_called_once_with(stream, False)
+        phys_pkg_writer_.write.assert_called_once_with(part_.partname.rels_uri, part_.rels.xml)
+
+    def it_copies_a_clean_part_from_its_source(
+        self, phys_pkg_writer_: Mock, part_: Mock, lazy_blob_: Mock
+    ):
+        part_.rels = []
+        part_.source = lazy_blob_
+        part_.content_type = CT.XML
+
+        PackageWriter._write_parts(phys_pkg_writer_, [part_])
+
+        phys_pkg_writer_.copy.assert_called_once_with(part_.partname, lazy_blob_, ZIP_DEFLATED)
+        assert phys_pkg_writer_.write.call_count == 0
+
+    def it_writes_only_the_rels_of_a_part_already_written(
+        self, phys_pkg_writer_: Mock, part_: Mock, rels_: Mock
+    ):
+        rels_.__len__.return_value = 1
+        part_.rels = rels_
+        part_.content_type = CT.XML
+        phys_pkg_writer_.__contains__.return_value = True
+
+        PackageWriter._write_parts(phys_pkg_writer_, [part_])
+
+        phys_pkg_writer_.write.assert_called_once_with(part_.partname.rels_uri, rels_.xml)
+        assert phys_pkg_writer_.copy.call_count == 0
+
+    def it_leaves_a_member_being_updated_alone_when_unchanged(self, phys_pkg_writer_: Mock):
+        pack_uri = PackURI("/_rels/.rels")
+        phys_pkg_writer_.__contains__.return_value = True
+        phys_pkg_writer_.blob_for.return_value = b"<Relationships/>"
+
+        PackageWriter._update_member(phys_pkg_writer_, pack_uri, b"<Relationships/>")
+
+        phys_pkg_writer_.blob_for.assert_called_once_with(pack_uri)
+        assert phys_pkg_writer_.remove.call_count == 0
+        assert phys_pkg_writer_.write.call_count == 0
+
+    def it_replaces_a_member_being_updated_when_changed(self, phys_pkg_writer_: Mock):
+        pack_uri = PackURI("/_rels/.rels")
+        phys_pkg_writer_.__contains__.return_value = True
+        phys_pkg_writer_.blob_for.return_value = b"<Relationships/>"
+
+        PackageWriter._update_member(phys_pkg_writer_, pack_uri, b"<Relationships>")
+
+        phys_pkg_writer_.remove.assert_called_once_with(pack_uri)
+        phys_pkg_writer_.write.assert_called_once_with(pack_uri, b"<Relationships>", ZIP_DEFLATED)
+
+    def it_can_compress_parts_concurrently(self, phys_pkg_writer_: Mock, lazy_blob_: Mock):
+        parts = [
+            Part(PackURI("/word/media/image%d.png" % n), CT.PNG, b"png%d" % n) for n in range(1, 7)
+        ]
+        parts[3]._source = lazy_blob_
+        members = {}
+
+        def compress(pack_uri, blob, compress_type):
+            members[pack_uri] = (pack_uri, (blob, compress_type))
+            return members[pack_uri]
+
+        def prepare_copy(pack_uri, source, compress_type):
+            members[pack_uri] = (pack_uri, (source, compress_type))
+            return members[pack_uri]
+
+        phys_pkg_writer_.compress.side_effect = compress
+        phys_pkg_writer_.prepare_copy.side_effect = prepare_copy
+
+        PackageWriter._write_parts(phys_pkg_writer_, parts, 2, PRECOMPRESSED_CONTENT_TYPES)
+
+        assert phys_pkg_writer_.write_compressed.call_args_list == [
+            call(*members[part.partname]) for part in parts
+        ]
+        assert members["/word/media/image4.png"][1] == (lazy_blob_, ZIP_STORED)
+        assert members["/word/media/image1.png"][1] == (b"png1", ZIP_STORED)
 
     # fixtures ---------------------------------------------
 
@@ -91,6 +172,10 @@ class DescribePackageWriter:
         _ContentTypesItem_.from_parts.return_value = cti_
         return _ContentTypesItem_
 
+    @pytest.fixture
+    def lazy_blob_(self, request: FixtureRequest):
+        return instance_mock(request, LazyBlob)
+
     @pytest.fixture
     def part_(self, request: FixtureRequest):
         return instance_mock(request, Part)
@@ -121,11 +121,100 @@ class DescribeRelationships:
             any_order=True,
         )
 
+    def it_reports_each_change_to_its_package(self):
+        package = Mock(name="package")
+        rels = Relationships("/", package)
+
+        rels.add_relationship("http://rel/type", "http://some/url", "rId1", is_external=True)
+        assert package.mark_graph_changed.call_count == 1
+        del rels["rId1"]
+        assert package.mark_graph_changed.call_count == 2
+
+    def it_can_take_a_snapshot_resolved_against_the_parts_as_they_are(self):
+        package = Mock(name="package")
+        rels = Relationships("/word", package)
+        target = Part(PackURI("/word/media/image1.png"), "image/png")
+        rels.add_relationship("http://rel/type", target, "rId1")
+        rels.add_relationship("http://rel/type", "http://some/url", "rId2", is_external=True)
+        package.reset_mock()
+
+        snapshot = rels.snapshot()
+        target.partname = PackURI("/word/media/image2.png")
+
+        assert package.mark_graph_changed.call_count == 0
+        assert list(snapshot.keys()) == ["rId1", "rId2"]
+        assert rels["rId1"].target_ref == "media/image2.png"
+        assert snapshot["rId1"].target_ref == "media/image1.png"
+        assert snapshot["rId2"].target_ref == "http://some/url"
+        assert snapshot.related_parts == {}
+        with pytest.raises(ValueError, match="does not refer to its target part"):
+            snapshot["rId1"].target_part
+
     def it_knows_the_next_available_rId_to_help(self, rels_with_rId_gap):
         rels, expected_next_rId = rels_with_rId_gap
         next_rId = rels._next_rId
         assert next_rId == expected_next_rId
 
+    def it_reuses_the_rId_of_a_deleted_relationship(self):
+        rels = Relationships("/foo")
+        for n in range(1, 6):
+            rels.add_relationship("http://rel/type", "http://url/%d" % n, "rId%d" % n, True)
+        assert rels._next_rId == "rId6"
+
+        del rels["rId2"]
+        assert rels._next_rId == "rId2"
+        rels.pop("rId4")
+        assert rels._next_rId == "rId2"
+        rels.get_or_add_ext_rel("http://rel/type", "http://url/7")
+        assert rels._next_rId == "rId4"
+
+    def it_keeps_its_indexes_up_to_date_as_it_changes(self):
+        rels = Relationships("/foo")
+        part, other_part = Mock(name="part"), Mock(name="other_part")
+        rels.add_relationship("http://rel/a", part, "rId1")
+        rels.add_relationship("http://rel/a", part, "rId2")
+        rels.add_relationship("http://rel/b", other_part, "rId3")
+
+        assert rels._get_matching("http://rel/a", part) is rels["rId1"]
+        assert rels.part_with_reltype("http://rel/b") is other_part
+        with pytest.raises(ValueError, match="multiple relationships of type"):
+            rels.part_with_reltype("http://rel/a")
+
+        del rels["rId1"]
+        assert rels._get_matching("http://rel/a", part) is rels["rId2"]
+        assert rels.part_with_reltype("http://rel/a") is part
+        assert "rId1" not in rels.related_parts
+
+        rels.add_relationship("http://rel/b", "http://url", "rId3", is_external=True)
+        assert rels._get_matching("http://rel/b", other_part) is None
+        assert rels._get_matching("http://rel/b", "http://url", is_external=True) is rels["rId3"]
+        with pytest.raises(KeyError):
+            rels.part_with_reltype("http://rel/c")
+
+    def it_keeps_its_indexes_up_to_date_through_the_other_dict_methods(self):
+        rels = Relationships("/foo")
+        part, other_part = Mock(name="part"), Mock(name="other_part")
+        rel_a = _Relationship("rId1", "http://rel/a", part, "/foo")
+        rel_b = _Relationship("rId2", "http://rel/b", other_part, "/foo")
+        rel_c = _Relationship("rId3", "http://rel/c", "http://url", "/foo", external=True)
+
+        rels.update({"rId1": rel_a}, rId2=rel_b)
+        assert rels.part_with_reltype("http://rel/a") is part
+        assert rels.part_with_reltype("http://rel/b") is other_part
+        assert rels.setdefault("rId1", rel_c) is rel_a
+        assert rels.setdefault("rId3", rel_c) is rel_c
+        assert rels._get_matching("http://rel/c", "http://url", is_external=True) is rel_c
+
+        assert rels.popitem() == ("rId3", rel_c)
+        assert rels._get_matching("http://rel/c", "http://url", is_external=True) is None
+        assert rels._next_rId == "rId3"
+
+        rels.clear()
+        assert rels._get_matching("http://rel/a", part) is None
+        with pytest.raises(KeyError):
+            rels.part_with_reltype("http://rel/b")
+        assert rels._next_rId == "rId1"
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
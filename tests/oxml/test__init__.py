@@ -1,10 +1,22 @@
 """Test suite for pptx.oxml.__init__.py module, primarily XML parser-related."""
 
+import io
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from lxml import etree
 
+from docx.opc.exceptions import PackageLimitError
+from docx.opc.limits import ResourceLimits
 from docx.oxml.ns import qn
-from docx.oxml.parser import OxmlElement, oxml_parser, parse_xml, register_element_cls
+from docx.oxml.parser import (
+    OxmlElement,
+    iter_child_elements,
+    oxml_parser,
+    parse_xml,
+    parse_xml_stream,
+    register_element_cls,
+)
 from docx.oxml.shared import BaseOxmlElement
 
 
@@ -71,6 +83,59 @@ class DescribeParseXml:
         element = parse_xml(xml_bytes)
         assert isinstance(element, CustElmCls)
 
+    def it_can_parse_with_the_read_only_parser_profile(self, xml_bytes):
+        register_element_cls("a:foo", CustElmCls)
+        deep_xml = "<a>%s</a>" % ("<b>" * 300 + "</b>" * 300)
+
+        assert isinstance(parse_xml(xml_bytes, read_only=True), CustElmCls)
+        with pytest.raises(etree.XMLSyntaxError):
+            parse_xml(deep_xml, read_only=True)
+
+    @pytest.mark.parametrize("read_only", [False, True])
+    def it_lifts_the_parser_limits_only_when_asked_to(self, read_only: bool):
+        deep_xml = "<a>%s</a>" % ("<b>" * 300 + "</b>" * 300)
+        limits = ResourceLimits(huge_xml=True)
+
+        element = parse_xml(deep_xml, read_only, limits)
+        assert len(element.xpath("//b")) == 300
+        element = parse_xml(deep_xml, read_only, ResourceLimits(max_xml_depth=301, huge_xml=True))
+        assert len(element.xpath("//b")) == 300
+        with pytest.raises(etree.XMLSyntaxError):
+            parse_xml(deep_xml, read_only, ResourceLimits(max_xml_depth=301))
+
+    def it_uses_registered_element_classes_in_other_threads(self, xml_bytes):
+        register_element_cls("a:foo", CustElmCls)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            elements = list(executor.map(parse_xml, [xml_bytes] * 8))
+        assert all(isinstance(element, CustElmCls) for element in elements)
+
+    def it_can_parse_xml_read_from_a_stream(self, xml_bytes):
+        register_element_cls("a:foo", CustElmCls)
+        element = parse_xml_stream(io.BytesIO(xml_bytes))
+        assert isinstance(element, CustElmCls)
+        assert etree.tostring(element) == etree.tostring(parse_xml(xml_bytes))
+        assert len(element) == 1
+
+    def it_can_parse_xml_within_resource_limits(self, xml_bytes):
+        register_element_cls("a:foo", CustElmCls)
+        limits = ResourceLimits(max_xml_depth=2, max_xml_elements=2)
+
+        element = parse_xml(xml_bytes, limits=limits)
+
+        assert isinstance(element, CustElmCls)
+        assert etree.tostring(element) == etree.tostring(parse_xml(xml_bytes))
+
+    @pytest.mark.parametrize(
+        ("limits", "match"),
+        [
+            (ResourceLimits(max_xml_depth=1), "nested over the limit of 1 deep"),
+            (ResourceLimits(max_xml_elements=1), "over the limit of 1 elements"),
+        ],
+    )
+    def it_raises_when_xml_exceeds_a_resource_limit(self, xml_bytes, limits, match):
+        with pytest.raises(PackageLimitError, match=match):
+            parse_xml_stream(io.BytesIO(xml_bytes), limits=limits)
+
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -83,6 +148,27 @@ class DescribeParseXml:
         ).encode("utf-8")
 
 
+class DescribeIterChildElements:
+    def it_generates_each_child_of_the_parent_element(self):
+        xml = (
+            '<a:root xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">\n'
+            "  <a:other><a:foo/></a:other>\n"
+            "  <a:bar><a:foo>1</a:foo><a:foo>2</a:foo><a:baz><a:foo/></a:baz></a:bar>\n"
+            "</a:root>"
+        ).encode("utf-8")
+        register_element_cls("a:foo", CustElmCls)
+        children = []
+
+        for child in iter_child_elements(io.BytesIO(xml), "a:bar"):
+            children.append((child.tag, type(child), len(child), child.getprevious()))
+
+        assert children == [
+            (qn("a:foo"), CustElmCls, 0, None),
+            (qn("a:foo"), CustElmCls, 0, None),
+            (qn("a:baz"), etree._Element, 1, None),
+        ]
+
+
 class DescribeRegisterElementCls:
     def it_determines_class_used_for_elements_with_matching_tagname(self, xml_text):
         register_element_cls("a:foo", CustElmCls)
@@ -78,7 +78,15 @@ class DescribeDocumentPart:
     def it_can_save_the_package_to_a_file(self, save_fixture):
         document, file_ = save_fixture
         document.save(file_)
-        document._package.save.assert_called_once_with(file_)
+        document._package.save.assert_called_once_with(file_, None, None, (), False, False)
+
+    def it_can_save_the_package_in_the_background(self, save_fixture):
+        document, file_ = save_fixture
+        future = document.save_in_background(file_)
+        document._package.save_in_background.assert_called_once_with(
+            file_, None, None, (), False, None
+        )
+        assert future is document._package.save_in_background.return_value
 
     def it_provides_access_to_the_document_settings(self, settings_fixture):
         document_part, settings_ = settings_fixture
@@ -33,7 +33,7 @@ class DescribeImagePart:
         image_part = ImagePart.from_image(image_, partname_)
 
         _init_.assert_called_once_with(
-            ANY, partname_, image_.content_type, image_.blob, image_
+            ANY, partname_, image_.content_type, image_.part_blob, image_
         )
         assert isinstance(image_part, ImagePart)
 
@@ -51,6 +51,11 @@ class DescribeImagePart:
         image_part = ImagePart(None, None, blob)
         assert image_part.sha1 == "4921e7002ddfba690a937d54bda226a7b8bdeb68"
 
+    def it_takes_the_sha1_from_the_image_it_was_created_from(self, image_):
+        image_.sha1 = "f005ba11"
+        image_part = ImagePart(None, None, b"fO0Bar", image_)
+        assert image_part.sha1 == "f005ba11"
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -6,6 +6,7 @@ from docx.oxml.numbering import CT_Numbering
 from docx.parts.numbering import NumberingPart, _NumberingDefinitions
 
 from ..oxml.unitdata.numbering import a_num, a_numbering
+from ..unitutil.cxml import element
 from ..unitutil.mock import class_mock, instance_mock
 
 
@@ -21,6 +22,25 @@ class DescribeNumberingPart:
         _NumberingDefinitions_.assert_called_once_with(numbering_elm_)
         assert numbering_definitions is numbering_definitions_
 
+    def it_adds_numbering_definitions_with_ids_from_its_allocator(self):
+        numbering_part = NumberingPart(
+            None, None, element("w:numbering/(w:num{w:numId=1},w:num{w:numId=3})"), None
+        )
+
+        nums = [numbering_part.add_num(7) for _ in range(3)]
+
+        assert [num.numId for num in nums] == [4, 5, 6]
+        assert [num.abstractNumId.val for num in nums] == [7, 7, 7]
+        assert len(numbering_part.element.num_lst) == 5
+
+    def it_looks_for_num_ids_again_when_nums_are_added_by_other_means(self):
+        numbering_part = NumberingPart(None, None, element("w:numbering/w:num{w:numId=1}"), None)
+        assert numbering_part.add_num(7).numId == 2
+
+        numbering_part.element.add_num(7, 9)
+
+        assert numbering_part.add_num(7).numId == 10
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
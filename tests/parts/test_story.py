@@ -9,6 +9,7 @@ from docx.package import Package
 from docx.parts.document import DocumentPart
 from docx.parts.image import ImagePart
 from docx.parts.story import StoryPart
+from docx.shared import IdAllocator
 from docx.styles.style import BaseStyle
 
 from ..unitutil.cxml import element
@@ -57,11 +58,14 @@ class DescribeStoryPart:
         document_part_.get_style_id.assert_called_once_with(style_, style_type)
         assert style_id == "BodyText"
 
-    def it_can_create_a_new_pic_inline(self, get_or_add_image_, image_, next_id_prop_):
+    def it_can_create_a_new_pic_inline(
+        self, get_or_add_image_, image_, id_allocator_prop_, id_allocator_
+    ):
         get_or_add_image_.return_value = "rId42", image_
         image_.scaled_dimensions.return_value = 444, 888
         image_.filename = "bar.png"
-        next_id_prop_.return_value = 24
+        id_allocator_prop_.return_value = id_allocator_
+        id_allocator_.next_id.return_value = 24
         expected_xml = snippet_text("inline")
         story_part = StoryPart(None, None, None, None)
 
@@ -79,6 +83,44 @@ class DescribeStoryPart:
 
         assert next_id == expected_value
 
+    def it_hands_out_ids_after_one_scan_of_the_xml(self):
+        story_part = StoryPart(None, None, element("w:document/w:p{id=7}"), None)
+
+        assert [story_part.id_allocator.next_id() for _ in range(3)] == [8, 9, 10]
+        assert story_part.next_id == 11
+
+    def it_sees_ids_added_to_the_xml_by_other_means_only_once_reset(self):
+        story_part = StoryPart(None, None, element("w:document/w:p{id=1}"), None)
+        assert story_part.next_id == 2
+
+        story_part.element.append(element("wp:docPr{id=57}"))
+        assert story_part.next_id == 2
+        story_part.id_allocator.reset()
+
+        assert story_part.next_id == 58
+
+    def it_looks_for_ids_again_when_its_element_is_replaced(self):
+        story_part = StoryPart(None, None, element("w:document/w:p{id=7}"), None)
+        assert story_part.id_allocator.next_id() == 8
+
+        story_part._element = element("w:document/w:p{id=41}")
+
+        assert story_part.id_allocator.next_id() == 42
+
+    def it_renumbers_duplicate_drawing_ids_on_save(self):
+        story_part = StoryPart(
+            None,
+            None,
+            element("w:document/w:p/(wp:docPr{id=1},wp:docPr{id=2},wp:docPr{id=1})"),
+            None,
+        )
+        story_part.id_allocator.next_id()
+
+        story_part.before_marshal()
+
+        ids = story_part.element.xpath("//wp:docPr/@id")
+        assert ids == ["1", "2", "3"]
+
     def it_knows_the_main_document_part_to_help(self, package_, document_part_):
         package_.main_document_part = document_part_
         story_part = StoryPart(None, None, None, package_)
@@ -130,8 +172,12 @@ class DescribeStoryPart:
         return instance_mock(request, ImagePart)
 
     @pytest.fixture
-    def next_id_prop_(self, request):
-        return property_mock(request, StoryPart, "next_id")
+    def id_allocator_(self, request):
+        return instance_mock(request, IdAllocator)
+
+    @pytest.fixture
+    def id_allocator_prop_(self, request):
+        return property_mock(request, StoryPart, "id_allocator")
 
     @pytest.fixture
     def package_(self, request):
@@ -0,0 +1,87 @@
+# pyright: reportPrivateUsage=false
+
+"""Unit test suite for the docx.aio module."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import docx.aio
+from docx.aio import configure, open_document, save_document
+from docx.document import Document as DocumentObject
+
+from .unitutil.file import docx_path
+
+
+class DescribeOpenDocument:
+    def it_opens_a_document_on_the_executor(self):
+        document = asyncio.run(open_document(docx_path("having-images"), read_only=True))
+
+        assert isinstance(document, DocumentObject)
+        assert len(document.inline_shapes) == 5
+
+    def it_runs_at_most_max_concurrency_at_a_time(self):
+        configure(max_concurrency=1)
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocker():
+            started.set()
+            release.wait(5)
+
+        async def main():
+            blocking = asyncio.get_running_loop().run_in_executor(docx.aio._get_executor(), blocker)
+            opening = asyncio.ensure_future(open_document(docx_path("having-images")))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            await asyncio.sleep(0.05)
+            assert not opening.done()
+            opening.cancel()
+            release.set()
+            await blocking
+            with pytest.raises(asyncio.CancelledError):
+                await opening
+
+        try:
+            asyncio.run(main())
+        finally:
+            configure()
+
+
+class DescribeSaveDocument:
+    def it_saves_a_snapshot_of_the_document(self):
+        document = docx.Document()
+        document.add_paragraph("before")
+        stream = io.BytesIO()
+
+        async def main():
+            saving = asyncio.ensure_future(document.save_async(stream))
+            await asyncio.sleep(0)
+            document.add_paragraph("after")
+            await saving
+
+        asyncio.run(main())
+
+        saved = docx.Document(io.BytesIO(stream.getvalue()))
+        assert [p.text for p in saved.paragraphs] == ["before"]
+
+    def it_saves_on_the_configured_executor(self):
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="custom")
+        configure(executor=executor)
+        stream = io.BytesIO()
+
+        try:
+            asyncio.run(save_document(docx.Document(), stream))
+        finally:
+            configure()
+            executor.shutdown()
+
+        assert docx.Document(io.BytesIO(stream.getvalue()))
+
+    def it_refuses_both_an_executor_and_max_concurrency(self):
+        with pytest.raises(ValueError, match="not both"):
+            configure(max_concurrency=2, executor=ThreadPoolExecutor())
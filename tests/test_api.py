@@ -3,9 +3,12 @@
 import pytest
 
 import docx
-from docx.api import Document
+from docx.api import Document, inspect, iter_blocks
 from docx.opc.constants import CONTENT_TYPE as CT
+from docx.table import Table
+from docx.text.paragraph import Paragraph
 
+from .unitutil.file import docx_path, test_file
 from .unitutil.mock import class_mock, function_mock, instance_mock
 
 
@@ -13,13 +16,17 @@ class DescribeDocument:
     def it_opens_a_docx_file(self, open_fixture):
         docx, Package_, document_ = open_fixture
         document = Document(docx)
-        Package_.open.assert_called_once_with(docx)
+        Package_.open.assert_called_once_with(
+            docx, lazy=False, parse_workers=None, read_only=False, exclude_reltypes=(), limits=None
+        )
         assert document is document_
 
     def it_opens_the_default_docx_if_none_specified(self, default_fixture):
         docx, Package_, document_ = default_fixture
         document = Document()
-        Package_.open.assert_called_once_with(docx)
+        Package_.open.assert_called_once_with(
+            docx, lazy=False, parse_workers=None, read_only=False, exclude_reltypes=(), limits=None
+        )
         assert document is document_
 
     def it_raises_on_not_a_Word_file(self, raise_fixture):
@@ -65,3 +72,52 @@ class DescribeDocument:
     @pytest.fixture
     def Package_(self, request):
         return class_mock(request, "docx.api.Package")
+
+
+class DescribeInspect:
+    def it_takes_an_inventory_of_a_docx_file(self, request: pytest.FixtureRequest):
+        PackageInventory_ = class_mock(request, "docx.api.PackageInventory")
+
+        inventory = inspect("foobar.docx")
+
+        PackageInventory_.from_file.assert_called_once_with("foobar.docx")
+        assert inventory is PackageInventory_.from_file.return_value
+
+    def it_is_exposed_by_the_docx_package(self):
+        assert docx.inspect is inspect
+
+
+class DescribeIterBlocks:
+    def it_generates_each_block_item_in_the_document_body(self):
+        document = Document(docx_path("blk-inner-content"))
+        expected = [
+            (type(block), block.style.name if block.style else None)
+            for block in document.iter_inner_content()
+        ]
+
+        blocks = [
+            (type(block), block.style.name if block.style else None)
+            for block in iter_blocks(docx_path("blk-inner-content"))
+        ]
+
+        assert blocks == expected
+        assert {Paragraph, Table} <= {block_type for block_type, _ in blocks}
+
+    def it_provides_the_text_and_cells_of_each_block(self):
+        document = Document(docx_path("blk-inner-content"))
+        expected = [
+            block.text if isinstance(block, Paragraph) else block.cell(0, 0).text
+            for block in document.iter_inner_content()
+        ]
+
+        texts = [
+            block.text if isinstance(block, Paragraph) else block.cell(0, 0).text
+            for block in iter_blocks(docx_path("blk-inner-content"))
+        ]
+
+        assert texts == expected
+
+    def it_can_read_an_expanded_package_directory(self):
+        blocks = list(iter_blocks(test_file("expanded_docx")))
+        assert all(isinstance(block, (Paragraph, Table)) for block in blocks)
+        assert blocks
@@ -37,3 +37,14 @@ class TestComment:
         assert len(p.comments) == 2
         assert p.comments[1].text == "New comment 2"
         assert p.comments[1].id == 1
+
+    def it_does_not_reuse_the_id_of_a_comment_added_as_xml(self):
+        doc = Document()
+        r = doc.add_paragraph("Hello world!").add_run("run")
+        r.add_comment("first")
+        comments = doc.part._comments_part.element
+        comments.add_comment("author", "a", "2024-01-01T00:00:00Z", 7)
+
+        c = r.add_comment("second")
+
+        assert c.id == 8
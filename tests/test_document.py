@@ -96,7 +96,15 @@ class DescribeDocument:
     def it_can_save_the_document_to_a_file(self, save_fixture):
         document, file_ = save_fixture
         document.save(file_)
-        document._part.save.assert_called_once_with(file_)
+        document._part.save.assert_called_once_with(file_, None, None, (), False, False)
+
+    def it_can_save_the_document_in_the_background(self, save_fixture):
+        document, file_ = save_fixture
+        future = document.save_in_background(file_)
+        document._part.save_in_background.assert_called_once_with(
+            file_, None, None, (), False, None
+        )
+        assert future is document._part.save_in_background.return_value
 
     def it_provides_access_to_its_core_properties(self, core_props_fixture):
         document, core_properties_ = core_props_fixture
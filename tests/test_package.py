@@ -1,14 +1,37 @@
 """Unit test suite for docx.package module."""
 
+import copy
+import hashlib
+import io
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from zipfile import ZIP_DEFLATED, ZipFile
+
 import pytest
 
+from docx.api import Document
 from docx.image.image import Image
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.exceptions import PackageLimitError, ReadOnlyPackageError
+from docx.opc.limits import ResourceLimits
 from docx.opc.packuri import PackURI
+from docx.opc.phys_pkg import FileBlob
+from docx.opc.pkgwriter import PackageWriter
 from docx.package import ImageParts, Package
 from docx.parts.image import ImagePart
 
-from .unitutil.file import docx_path
-from .unitutil.mock import class_mock, instance_mock, method_mock, property_mock
+from .unitutil.file import docx_path, test_file
+from .unitutil.mock import (
+    FixtureRequest,
+    Mock,
+    PropertyMock,
+    class_mock,
+    instance_mock,
+    method_mock,
+    property_mock,
+    var_mock,
+)
 
 
 class DescribePackage:
@@ -31,6 +54,286 @@ class DescribePackage:
         for image_part in image_parts:
             assert isinstance(image_part, ImagePart)
 
+    def it_can_be_opened_read_only_without_excluded_parts(self):
+        package = Package.open(
+            docx_path("having-images"), read_only=True, exclude_reltypes={RT.IMAGE}
+        )
+
+        assert package.read_only is True
+        assert not [part for part in package.parts if isinstance(part, ImagePart)]
+        assert len(package.image_parts) == 0
+        assert package.main_document_part.element.body is not None
+        with pytest.raises(ReadOnlyPackageError):
+            package.get_or_add_image_part(test_file("monty-truth.png"))
+
+    def it_can_parse_its_parts_on_a_thread_pool(self):
+        package = Package.open(docx_path("having-images"), parse_workers=4)
+        expected = Package.open(docx_path("having-images"))
+
+        assert [p.partname for p in package.parts] == [p.partname for p in expected.parts]
+        assert [p.blob for p in package.parts] == [p.blob for p in expected.parts]
+        assert len(package.image_parts) == 3
+
+    def it_can_be_opened_lazily_and_saved_over_its_source(self, tmp_path):
+        path = str(tmp_path / "having-images.docx")
+        shutil.copy(docx_path("having-images"), path)
+        package = Package.open(path, lazy=True)
+        image_blobs = [image_part.blob for image_part in package.image_parts]
+
+        package.save(path)
+
+        package = Package.open(path)
+        assert [image_part.blob for image_part in package.image_parts] == image_blobs
+        assert package.main_document_part.element.body is not None
+
+    def it_can_be_opened_from_a_buffer_without_copying_its_images(self, tmp_path):
+        with open(docx_path("having-images"), "rb") as f:
+            buffer = memoryview(f.read())
+        expected = Package.open(docx_path("having-images"))
+
+        package = Package.open(buffer)
+
+        image_blobs = [image_part.blob for image_part in package.image_parts]
+        assert all(isinstance(blob, memoryview) and blob.obj is buffer.obj for blob in image_blobs)
+        assert image_blobs == [image_part.blob for image_part in expected.image_parts]
+        package.save(str(tmp_path / "saved.docx"))
+        saved = Package.open(str(tmp_path / "saved.docx"))
+        assert [image_part.blob for image_part in saved.image_parts] == image_blobs
+
+    def it_memory_maps_a_package_opened_lazily_and_read_only(self):
+        package = Package.open(docx_path("having-images"), lazy=True, read_only=True)
+
+        blobs = [part.blob for part in package.parts if isinstance(part, ImagePart)]
+
+        assert len(blobs) == 3
+        assert all(isinstance(blob, memoryview) for blob in blobs)
+        assert package.main_document_part.element.body is not None
+        del blobs
+        package.close()
+
+    def it_can_be_saved_to_a_stream_it_cannot_seek(self):
+        class WriteOnlyStream:
+            def __init__(self):
+                self.chunks: list[bytes] = []
+
+            def write(self, b: bytes):
+                self.chunks.append(bytes(b))
+
+        stream = WriteOnlyStream()
+        package = Package.open(docx_path("having-images"), lazy=True)
+
+        package.save(stream)  # pyright: ignore[reportArgumentType]
+
+        saved = Package.open(io.BytesIO(b"".join(stream.chunks)))
+        assert [p.partname for p in saved.parts] == [p.partname for p in package.parts]
+        assert len(saved.image_parts) == 3
+        package.close()
+
+    def it_can_be_saved_incrementally_over_its_source(self, tmp_path):
+        path = str(tmp_path / "having-images.docx")
+        shutil.copy(docx_path("having-images"), path)
+        with ZipFile(path) as zipf:
+            offsets = {zinfo.filename: zinfo.header_offset for zinfo in zipf.infolist()}
+        package = Package.open(path, lazy=True)
+        package.core_properties.title = "Changed"
+
+        package.save(path, incremental=True)
+        package.core_properties.title = "Changed again"
+        package.save(path, incremental=True)
+
+        with ZipFile(path) as zipf:
+            assert zipf.testzip() is None
+            moved = {
+                zinfo.filename
+                for zinfo in zipf.infolist()
+                if zinfo.header_offset != offsets.get(zinfo.filename)
+            }
+        assert "docProps/core.xml" in moved
+        assert "word/document.xml" not in moved
+        assert not [name for name in moved if name.startswith("word/media/")]
+        saved = Package.open(path)
+        assert saved.core_properties.title == "Changed again"
+        assert len(saved.image_parts) == 3
+        package.close()
+
+    def it_is_left_unchanged_when_an_incremental_save_fails(
+        self, request: FixtureRequest, tmp_path
+    ):
+        path = str(tmp_path / "having-images.docx")
+        shutil.copy(docx_path("having-images"), path)
+        with open(path, "rb") as f:
+            original = f.read()
+        update_member = PackageWriter._update_member
+
+        def fail_on_document_rels(phys_writer, pack_uri, *args):
+            if pack_uri == "/word/_rels/document.xml.rels":
+                raise RuntimeError("boom")
+            update_member(phys_writer, pack_uri, *args)
+
+        var_mock(
+            request, "docx.opc.pkgwriter.PackageWriter._update_member", new=fail_on_document_rels
+        )
+        package = Package.open(path, lazy=True)
+        package.main_document_part.element.body.set("foo", "bar")  # pyright: ignore
+
+        with pytest.raises(RuntimeError, match="boom"):
+            package.save(path, incremental=True)
+        package.close()
+
+        with open(path, "rb") as f:
+            assert f.read() == original
+        with ZipFile(path) as zipf:
+            assert zipf.testzip() is None
+
+    def it_does_not_grow_when_saved_incrementally_without_changes(self, tmp_path):
+        path = str(tmp_path / "having-images.docx")
+        shutil.copy(docx_path("having-images"), path)
+        document = Document(path, lazy=True)
+        document.save(path, incremental=True)
+        size = os.path.getsize(path)
+
+        document.save(path, incremental=True)
+        document.save(path, incremental=True)
+
+        assert os.path.getsize(path) == size
+        assert len(Document(path).inline_shapes) == len(document.inline_shapes)
+        document.part.package.close()
+
+    def it_can_be_saved_as_an_expanded_package_directory(self, tmp_path):
+        path = str(tmp_path / "expanded")
+        package = Package.open(docx_path("having-images"), lazy=True)
+
+        package.save(path + os.sep)
+
+        saved = Package.open(path)
+        assert [p.partname for p in saved.parts] == [p.partname for p in package.parts]
+        assert [p.blob for p in saved.image_parts] == [p.blob for p in package.image_parts]
+        package.close()
+
+    def it_can_be_saved_as_and_opened_from_a_flat_opc_document(self, tmp_path):
+        path = str(tmp_path / "flat.xml")
+        package = Package.open(docx_path("having-images"))
+
+        package.save(path)
+
+        for lazy in (False, True):
+            saved = Package.open(path, lazy=lazy)
+            assert [p.partname for p in saved.parts] == [p.partname for p in package.parts]
+            assert [p.blob for p in saved.image_parts] == [p.blob for p in package.image_parts]
+            saved.close()
+
+    def it_can_open_a_flat_opc_document_it_saved_with_a_large_binary_part(self, tmp_path):
+        path = str(tmp_path / "flat.xml")
+        package = Package.open(docx_path("having-images"))
+        image_part = next(iter(package.image_parts))
+        image_part._blob = os.urandom(8 * 1024 * 1024)
+
+        package.save(path)
+
+        document = Document(path)
+        assert next(iter(document.part.package.image_parts)).blob == image_part.blob
+
+    def it_can_be_saved_deterministically(self):
+        def save(package: Package) -> bytes:
+            stream = io.BytesIO()
+            package.save(stream, deterministic=True)
+            return stream.getvalue()
+
+        package = Package.open(docx_path("having-images"))
+        blob = save(package)
+        package.main_document_part.element.body.set("foo", "bar")  # pyright: ignore
+
+        with ZipFile(io.BytesIO(blob)) as zipf:
+            partnames = [name for name in zipf.namelist() if not name.endswith(".rels")]
+            assert partnames[1:] == sorted(partnames[1:])
+            assert {zinfo.date_time for zinfo in zipf.infolist()} == {(1980, 1, 1, 0, 0, 0)}
+        assert save(Package.open(io.BytesIO(blob))) == blob
+        assert save(package) != blob
+
+    def it_can_be_saved_in_the_background(self, tmp_path):
+        path = str(tmp_path / "saved.docx")
+        package = Package.open(docx_path("having-images"), lazy=True)
+        body = package.main_document_part.element.body
+        paragraph_count = len(body)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = package.save_in_background(path, executor=executor)
+            body.append(copy.deepcopy(body[0]))
+            assert future.result() is None
+
+        saved = Package.open(path)
+        assert len(saved.main_document_part.element.body) == paragraph_count
+        assert [p.blob for p in saved.image_parts] == [p.blob for p in package.image_parts]
+        package.close()
+
+    @pytest.mark.parametrize("compress_workers", [None, 2])
+    def it_streams_a_large_image_from_its_spool_file_on_save(
+        self, compress_workers: int | None, request: pytest.FixtureRequest
+    ):
+        var_mock(request, "docx.opc.phys_pkg._SPOOL_MAX_SIZE", new=1024)
+        with open(test_file("300-dpi.png"), "rb") as f:
+            image_bytes = f.read()
+        package = Package.open(docx_path("having-images"))
+
+        document_part = package.main_document_part
+        rId, _ = document_part.get_or_add_image(test_file("300-dpi.png"))
+        image_part = document_part.related_parts[rId]
+        stream = io.BytesIO()
+        package.save(stream, compress_workers=compress_workers)
+
+        assert isinstance(image_part.image.part_blob, FileBlob)
+        assert image_part.sha1 == hashlib.sha1(image_bytes).hexdigest()
+        saved = Package.open(stream)
+        assert [p.blob for p in saved.image_parts if p.partname == image_part.partname] == [
+            image_bytes
+        ]
+
+    def it_can_save_a_part_past_the_zip64_limit(self, request: pytest.FixtureRequest):
+        var_mock(request, "zipfile.ZIP64_LIMIT", new=20000)
+        var_mock(request, "docx.opc.phys_pkg._ZIP_STREAM_BUFFER_SIZE", new=10000)
+        document = Document()
+        for i in range(2000):
+            document.add_paragraph("paragraph %d" % i)
+        stream = io.BytesIO()
+
+        document.save(stream)
+
+        assert len(Document(stream).paragraphs) == 2000
+
+    def it_refuses_to_open_a_package_over_a_size_limit(self):
+        with open(docx_path("having-images"), "rb") as f:
+            stream = io.BytesIO(f.read())
+        with ZipFile(stream, "a", ZIP_DEFLATED) as zipf:
+            zipf.writestr("word/bomb.xml", b"\x00" * 10_000_000)
+
+        with pytest.raises(PackageLimitError, match="'/word/bomb.xml' is compressed"):
+            Package.open(stream, limits=ResourceLimits(max_compression_ratio=100))
+        with pytest.raises(PackageLimitError, match="exceed the limit of 1000000 bytes"):
+            Package.open(stream, limits=ResourceLimits(max_total_size=1_000_000))
+
+    def it_checks_the_xml_of_a_lazily_loaded_part_when_it_is_parsed(self):
+        limits = ResourceLimits(max_xml_elements=10)
+        package = Package.open(docx_path("having-images"), lazy=True, limits=limits)
+
+        with pytest.raises(PackageLimitError, match="over the limit of 10 elements"):
+            package.main_document_part.element
+
+        package.close()
+
+    def it_copies_untouched_parts_verbatim_when_saved(self, tmp_path):
+        path = str(tmp_path / "saved.docx")
+        package = Package.open(docx_path("having-images"), lazy=True)
+        package.core_properties.title = "Changed"
+
+        package.save(path)
+
+        with ZipFile(docx_path("having-images")) as src, ZipFile(path) as dst:
+            for name in ("word/document.xml", "word/media/image1.png"):
+                assert dst.getinfo(name).compress_size == src.getinfo(name).compress_size
+                assert dst.getinfo(name).CRC == src.getinfo(name).CRC
+            assert dst.read("docProps/core.xml") != src.read("docProps/core.xml")
+        assert Package.open(path).core_properties.title == "Changed"
+
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -81,6 +384,23 @@ class DescribeImageParts:
         image_parts, ext, expected_partname = next_partname_fixture
         assert image_parts._next_image_partname(ext) == expected_partname
 
+    def it_hashes_each_image_part_only_once_to_find_a_match(self):
+        image_parts = ImageParts()
+        sha1_props_ = []
+        for n, sha1 in ((1, "f005ba11"), (2, "fa1afe1"), (3, "f005ba11")):
+            partname = PackURI("/word/media/image%d.png" % n)
+            image_part_ = Mock(name="image_part_%d_" % n, partname=partname)
+            type(image_part_).sha1 = sha1_prop_ = PropertyMock(return_value=sha1)
+            image_parts.append(image_part_)
+            sha1_props_.append(sha1_prop_)
+        first, second, _ = image_parts
+
+        assert image_parts._get_by_sha1("f005ba11") is first
+        assert image_parts._get_by_sha1("fa1afe1") is second
+        assert image_parts._get_by_sha1("bad") is None
+        assert [sha1_prop_.call_count for sha1_prop_ in sha1_props_] == [1, 1, 1]
+        assert image_parts._next_image_partname("png") == "/word/media/image4.png"
+
     def it_can_really_add_a_new_image_part(
         self, _next_image_partname_, partname_, image_, ImagePart_, image_part_
     ):
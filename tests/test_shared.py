@@ -3,7 +3,18 @@
 import pytest
 
 from docx.opc.part import XmlPart
-from docx.shared import Cm, ElementProxy, Emu, Inches, Length, Mm, Pt, RGBColor, Twips
+from docx.shared import (
+    Cm,
+    ElementProxy,
+    Emu,
+    IdAllocator,
+    Inches,
+    Length,
+    Mm,
+    Pt,
+    RGBColor,
+    Twips,
+)
 
 from .unitutil.cxml import element
 from .unitutil.mock import instance_mock
@@ -63,6 +74,50 @@ class DescribeElementProxy:
         return instance_mock(request, XmlPart)
 
 
+class DescribeIdAllocator:
+    def it_scans_for_the_ids_in_use_only_once(self):
+        scans = []
+
+        def scan():
+            scans.append(None)
+            return [3, 1]
+
+        allocator = IdAllocator(scan)
+
+        assert allocator.peek() == 4
+        assert [allocator.next_id() for _ in range(3)] == [4, 5, 6]
+        assert len(scans) == 1
+
+    @pytest.mark.parametrize(
+        ("used_ids", "first", "expected_value"), [([], 1, 1), ([], 0, 0), ([-1, 0], 1, 1)]
+    )
+    def it_starts_from_first_when_no_id_is_in_use(
+        self, used_ids: list[int], first: int, expected_value: int
+    ):
+        assert IdAllocator(lambda: used_ids, first=first).next_id() == expected_value
+
+    def it_scans_again_when_ids_are_added_by_other_means(self):
+        used_ids = [1]
+        allocator = IdAllocator(lambda: used_ids, lambda: len(used_ids))
+
+        used_ids.append(allocator.next_id())
+        assert used_ids == [1, 2]
+        used_ids.append(9)
+
+        assert allocator.next_id() == 10
+
+    def it_can_reserve_an_id_and_be_reset(self):
+        used_ids = [1]
+        allocator = IdAllocator(lambda: used_ids)
+        allocator.next_id()
+
+        allocator.reserve(5)
+        assert allocator.peek() == 6
+        used_ids.append(20)
+        allocator.reset()
+        assert allocator.peek() == 21
+
+
 class DescribeLength:
     def it_can_construct_from_convenient_units(self, construct_fixture):
         UnitCls, units_val, emu = construct_fixture
@@ -0,0 +1,154 @@
+# pyright: reportPrivateUsage=false
+
+"""Unit test suite for the docx.streaming module."""
+
+from __future__ import annotations
+
+import io
+import os
+from pathlib import Path
+from zipfile import BadZipFile, ZipFile
+
+import pytest
+
+import docx
+from docx.oxml.ns import qn
+from docx.shared import Inches
+from docx.streaming import StreamingDocument
+
+from .unitutil.file import docx_path, test_file
+from .unitutil.mock import FixtureRequest, var_mock
+
+
+class DescribeStreamingDocument:
+    """Unit-test suite for `docx.streaming.StreamingDocument` objects."""
+
+    def it_writes_the_blocks_added_to_it(self, pkg_file: io.BytesIO):
+        with StreamingDocument(pkg_file) as document:
+            document.add_heading("Title", 1)
+            document.add_paragraph("foo", "List Bullet")
+            table = document.add_table(2, 2, "Light Grid")
+            table.cell(0, 0).text = "bar"
+            document.add_page_break()
+
+        document = docx.Document(pkg_file)
+        assert [p.text for p in document.paragraphs] == ["Title", "foo", ""]
+        assert document.paragraphs[1].style.name == "List Bullet"
+        assert document.tables[0].cell(0, 0).text == "bar"
+        assert document.tables[0].style.name == "Light Grid"
+
+    def it_discards_each_block_once_it_is_written(self, pkg_file: io.BytesIO):
+        document = StreamingDocument(pkg_file)
+
+        document.add_paragraph("foo")
+        document.add_paragraph("bar")
+
+        assert [child.tag for child in document._body] == [qn("w:p"), qn("w:sectPr")]
+        document.close()
+
+    def it_starts_from_the_template_body_and_section(self, pkg_file: io.BytesIO):
+        template = docx.Document(docx_path("having-images"))
+
+        with StreamingDocument(pkg_file, docx_path("having-images")) as document:
+            document.sections[-1].left_margin = Inches(2)
+            document.add_paragraph("foo")
+
+        document = docx.Document(pkg_file)
+        assert len(document.inline_shapes) == len(template.inline_shapes)
+        assert document.paragraphs[-1].text == "foo"
+        assert document.sections[-1].left_margin == Inches(2)
+
+    def it_declares_namespaces_only_once(self, pkg_file: io.BytesIO):
+        with StreamingDocument(pkg_file) as document:
+            for _ in range(3):
+                document.add_paragraph("foo")
+
+        with ZipFile(pkg_file) as zipf:
+            xml = zipf.read("word/document.xml")
+        assert xml.count(b"xmlns:w=") == 1
+        assert b"<w:body><w:p><w:r><w:t>foo</w:t></w:r></w:p>" in xml
+
+    def it_writes_the_attributes_and_namespaces_of_each_block(self, pkg_file: io.BytesIO):
+        with StreamingDocument(pkg_file) as document:
+            paragraph = document.add_paragraph("foo")
+            p = paragraph._p
+            p.set(qn("w14:paraId"), '1"<2>')
+            p.set("{http://example.com/ns}foo", "bar")
+
+        with ZipFile(pkg_file) as zipf:
+            xml = zipf.read("word/document.xml")
+        assert xml.count(b"xmlns:w14=") == 1
+        assert xml.count(b'="http://example.com/ns"') == 1
+        p = docx.Document(pkg_file).paragraphs[0]._p
+        assert p.get(qn("w14:paraId")) == '1"<2>'
+        assert p.get("{http://example.com/ns}foo") == "bar"
+
+    def it_prefixes_an_attribute_in_the_default_namespace_of_its_block(self, pkg_file: io.BytesIO):
+        with StreamingDocument(pkg_file) as document:
+            paragraph = document.add_paragraph("foo")
+            p = paragraph._p
+            foo = p.makeelement("{http://example.com/ns}foo", nsmap={None: "http://example.com/ns"})
+            foo.set("{http://example.com/ns}bar", "baz")
+            p.addprevious(foo)
+
+        with ZipFile(pkg_file) as zipf:
+            xml = zipf.read("word/document.xml")
+        assert b' bar="baz"' not in xml
+        foo = docx.Document(pkg_file).element.body[0]
+        assert foo.get("{http://example.com/ns}bar") == "baz"
+
+    def it_gives_pictures_ids_unused_by_the_drawings_in_its_template(self, pkg_file: io.BytesIO):
+        with StreamingDocument(pkg_file, docx_path("having-images")) as document:
+            for _ in range(3):
+                document.add_picture(test_file("monty-truth.png"))
+
+        document = docx.Document(pkg_file)
+        ids = document.element.body.xpath("//wp:docPr/@id")
+        assert len(ids) == len(set(ids)) == len(document.inline_shapes)
+
+    def it_discards_the_package_when_an_exception_is_raised(self, tmp_path: Path):
+        path = str(tmp_path / "report.docx")
+
+        document = StreamingDocument(path)
+        document.add_paragraph("foo")
+
+        document.__exit__(ZeroDivisionError, ZeroDivisionError(), None)
+
+        assert not os.path.exists(path)
+        with pytest.raises(ValueError, match="streaming document is closed"):
+            document.add_paragraph("foo")
+
+    def it_leaves_no_readable_package_in_a_stream_it_discards(self, pkg_file: io.BytesIO):
+        document = StreamingDocument(pkg_file)
+        document.add_paragraph("foo")
+
+        document.__exit__(ZeroDivisionError, ZeroDivisionError(), None)
+
+        with pytest.raises(BadZipFile):
+            ZipFile(pkg_file)
+
+    def it_can_stream_a_document_part_past_the_zip64_limit(
+        self, request: FixtureRequest, pkg_file: io.BytesIO
+    ):
+        var_mock(request, "zipfile.ZIP64_LIMIT", new=1000)
+        var_mock(request, "docx.opc.phys_pkg._ZIP_STREAM_BUFFER_SIZE", new=1000)
+
+        with StreamingDocument(pkg_file) as document:
+            for _ in range(200):
+                document.add_paragraph("foo")
+
+        assert len(docx.Document(pkg_file).paragraphs) == 200
+
+    def it_can_be_closed_more_than_once(self, pkg_file: io.BytesIO):
+        document = StreamingDocument(pkg_file)
+        document.close()
+        document.close()
+
+        with pytest.raises(ValueError, match="streaming document is closed"):
+            document.add_paragraph("foo")
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def pkg_file(self):
+        return io.BytesIO()
@@ -8,6 +8,7 @@ from typing import Any, List, cast
 
 import pytest
 
+from docx import Document
 from docx import types as t
 from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_BREAK, WD_UNDERLINE
@@ -18,7 +19,7 @@ from docx.text.font import Font
 from docx.text.run import Run
 
 from ..unitutil.cxml import element, xml
-from ..unitutil.mock import class_mock, instance_mock, property_mock
+from ..unitutil.mock import class_mock, instance_mock, property_mock, var_mock
 
 
 class DescribeRun:
@@ -204,6 +205,20 @@ class DescribeRun:
         run.text = text
         assert run._r.xml == expected_xml
 
+    def it_can_add_an_ole_object_from_a_file(self, tmp_path, request: pytest.FixtureRequest):
+        var_mock(request, "docx.opc.phys_pkg._SPOOL_MAX_SIZE", new=4)
+        path = tmp_path / "object.bin"
+        path.write_bytes(b"foobar")
+        document = Document()
+        run = document.add_paragraph().add_run()
+
+        rId = run.add_ole_object_to_run(str(path))
+        path.unlink()
+
+        part = document.part.related_parts[rId]
+        assert part.partname == "/word/embeddings/object.bin"
+        assert part.blob == b"foobar"
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture